@@ -26,6 +26,7 @@ import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.config as focg
 import fiftyone.core.dataset as fod
+import fiftyone.core.profiling as fopf
 import fiftyone.core.session as fos
 import fiftyone.core.utils as fou
 import fiftyone.migrations as fom
@@ -87,6 +88,21 @@ class FiftyOneCommand(Command):
         _register_command(subparsers, "utils", UtilsCommand)
         _register_command(subparsers, "zoo", ZooCommand)
 
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="print the time spent in each stage of the command",
+        )
+        parser.add_argument(
+            "--profile-path",
+            metavar="PATH",
+            help=(
+                "a path to which to write the metrics collected while running "
+                "the command. Metrics are written in Prometheus text format if "
+                "the path ends in '.prom' and in JSON format otherwise"
+            ),
+        )
+
     @staticmethod
     def execute(parser, args):
         parser.print_help()
@@ -2554,6 +2570,16 @@ class MigrateCommand(Command):
             action="store_true",
             help="whether to log incremental migrations that are performed",
         )
+        parser.add_argument(
+            "-w",
+            "--num-workers",
+            default=None,
+            type=int,
+            help=(
+                "the maximum number of datasets to migrate concurrently when "
+                "migrating all datasets"
+            ),
+        )
 
     @staticmethod
     def execute(parser, args):
@@ -2575,7 +2601,11 @@ class MigrateCommand(Command):
             return
 
         if args.all:
-            fom.migrate_all(destination=args.version, verbose=args.verbose)
+            fom.migrate_all(
+                destination=args.version,
+                verbose=args.verbose,
+                num_workers=args.num_workers,
+            )
             return
 
         fom.migrate_database_if_necessary(
@@ -3054,4 +3084,25 @@ def main():
     """Executes the `fiftyone` tool with the given command-line args."""
     parser = _register_main_command(FiftyOneCommand, version=foc.VERSION_LONG)
     args = parser.parse_args()
-    args.execute(args)
+
+    if not args.profile and not args.profile_path:
+        args.execute(args)
+        return
+
+    with fopf.collect() as sink:
+        try:
+            args.execute(args)
+        finally:
+            _write_profile(sink, args.profile, args.profile_path)
+
+
+def _write_profile(sink, print_summary, outpath):
+    if print_summary:
+        print("")
+        sink.print_summary()
+
+    if outpath:
+        if outpath.endswith(".prom"):
+            etau.write_file(sink.to_prometheus(), outpath)
+        else:
+            etau.write_file(sink.to_json(pretty_print=True), outpath)
@@ -491,12 +491,25 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement view()")
 
-    def iter_samples(self, progress=False):
+    def iter_samples(
+        self, progress=False, batch_size=None, prefetch=False, read_only=False
+    ):
         """Returns an iterator over the samples in the collection.
 
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
+            batch_size (None): the number of samples to fetch from the
+                database per round trip. By default, the server's default is
+                used
+            prefetch (False): whether to fetch upcoming samples from the
+                database in a background thread while the current samples are
+                being processed
+            read_only (False): whether to generate lightweight
+                :class:`fiftyone.core.sample.ReadOnlySample` instances whose
+                fields are decoded only when they are accessed. Read-only
+                samples cannot be edited and do not include the frames of
+                video samples
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.Sample` or
@@ -1286,7 +1299,11 @@ class SampleCollection(object):
         if id_to_str:
             to_mongo = lambda _id: ObjectId(_id)
         else:
-            field_type = self.get_field(field_name)
+            if is_frame_field:
+                field_type = self.get_field(self._FRAMES_PREFIX + field_name)
+            else:
+                field_type = self.get_field(field_name)
+
             if field_type is not None:
                 to_mongo = field_type.to_mongo
 
@@ -1537,6 +1554,7 @@ class SampleCollection(object):
         frames=False,
     ):
         ops = []
+        op_ids = []
         for _id, value in zip(ids, values):
             if value is None and skip_none:
                 continue
@@ -1547,9 +1565,17 @@ class SampleCollection(object):
             if to_mongo is not None:
                 value = to_mongo(value)
 
-            ops.append(UpdateOne({"_id": _id}, {"$set": {field_name: value}}))
+            ops.append(
+                UpdateOne(
+                    {"_id": _id},
+                    self._dataset._stamp_update(
+                        {"$set": {field_name: value}}, frames=frames
+                    ),
+                )
+            )
+            op_ids.append(_id)
 
-        self._dataset._bulk_write(ops, frames=frames)
+        self._dataset._bulk_write(ops, ids=op_ids, frames=frames)
 
     def _set_list_values_by_id(
         self,
@@ -1571,6 +1597,7 @@ class SampleCollection(object):
             elem = root + ".$"
 
         ops = []
+        op_ids = []
         for _id, _elem_ids, _values in zip(ids, elem_ids, values):
             if not _elem_ids:
                 continue
@@ -1578,6 +1605,8 @@ class SampleCollection(object):
             if etau.is_str(_id):
                 _id = ObjectId(_id)
 
+            op_ids.append(_id)
+
             for _elem_id, value in zip(_elem_ids, _values):
                 if value is None and skip_none:
                     continue
@@ -1596,11 +1625,13 @@ class SampleCollection(object):
                 ops.append(
                     UpdateOne(
                         {"_id": _id, elem_id: _elem_id},
-                        {"$set": {elem: value}},
+                        self._dataset._stamp_update(
+                            {"$set": {elem: value}}, frames=frames
+                        ),
                     )
                 )
 
-        self._dataset._bulk_write(ops, frames=frames)
+        self._dataset._bulk_write(ops, ids=op_ids, frames=frames)
 
     def _set_labels(self, field_name, sample_ids, label_docs):
         label_type = self._get_label_field_type(field_name)
@@ -1626,7 +1657,10 @@ class SampleCollection(object):
                     ops.append(
                         UpdateOne(
                             {"_id": _id, elem_id: doc["_id"]},
-                            {"$set": {set_path: doc}},
+                            self._dataset._stamp_update(
+                                {"$set": {set_path: doc}},
+                                frames=is_frame_field,
+                            ),
                         )
                     )
         else:
@@ -1639,11 +1673,13 @@ class SampleCollection(object):
                 ops.append(
                     UpdateOne(
                         {"_id": _id, elem_id: doc["_id"]},
-                        {"$set": {field_name: doc}},
+                        self._dataset._stamp_update(
+                            {"$set": {field_name: doc}}, frames=is_frame_field
+                        ),
                     )
                 )
 
-        self._dataset._bulk_write(ops, frames=is_frame_field)
+        self._dataset._bulk_write(ops, ids=sample_ids, frames=is_frame_field)
 
     def _delete_labels(self, ids, fields=None):
         self._dataset.delete_labels(ids=ids, fields=fields)
@@ -2045,6 +2081,7 @@ class SampleCollection(object):
         use_masks=False,
         use_boxes=False,
         classwise=True,
+        incremental=False,
         **kwargs,
     ):
         """Evaluates the specified predicted detections in this collection with
@@ -2129,6 +2166,15 @@ class SampleCollection(object):
                 instances rather than using their actual geometries
             classwise (True): whether to only match objects with the same class
                 label (True) or allow matches between classes (False)
+            incremental (False): whether to only re-evaluate the samples that
+                have been added or modified since the existing evaluation with
+                the given ``eval_key`` was performed. The stored matches of all
+                other samples are reused and the aggregate results are
+                recomputed from them. Requires an ``eval_key`` and a dataset
+                with
+                :meth:`change tracking <fiftyone.core.dataset.Dataset.enable_change_tracking>`
+                enabled. If no compatible evaluation exists, a full evaluation
+                is performed
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.detection.DetectionEvaluationConfig`
                 being used
@@ -2148,6 +2194,7 @@ class SampleCollection(object):
             use_masks=use_masks,
             use_boxes=use_boxes,
             classwise=classwise,
+            incremental=incremental,
             **kwargs,
         )
 
@@ -2158,6 +2205,7 @@ class SampleCollection(object):
         eval_key=None,
         mask_targets=None,
         method="simple",
+        num_workers=1,
         **kwargs,
     ):
         """Evaluates the specified semantic segmentation masks in this
@@ -2206,6 +2254,8 @@ class SampleCollection(object):
                 provided, the observed pixel values are used
             method ("simple"): a string specifying the evaluation method to
                 use. Supported values are ``("simple")``
+            num_workers (1): the number of processes to use to compute the
+                pixel confusion matrices
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.segmentation.SegmentationEvaluationConfig`
                 being used
@@ -2220,6 +2270,7 @@ class SampleCollection(object):
             eval_key=eval_key,
             mask_targets=mask_targets,
             method=method,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -4729,14 +4780,22 @@ class SampleCollection(object):
 
     @view_stage
     def sort_by_similarity(
-        self, query_ids, k=None, reverse=False, dist_field=None, brain_key=None
+        self,
+        query_ids,
+        k=None,
+        reverse=False,
+        dist_field=None,
+        brain_key=None,
+        embeddings_field=None,
     ):
         """Sorts the samples in the collection by visual similiarity to a
         specified set of query ID(s).
 
         In order to use this stage, you must first use
         :meth:`fiftyone.brain.compute_similarity` to index your dataset by
-        visual similiarity.
+        visual similiarity, or you must provide the ``embeddings_field`` of
+        your dataset that contains the embeddings to use, in which case a
+        :class:`fiftyone.core.similarity.SimilarityIndex` is used.
 
         Examples::
 
@@ -4756,6 +4815,18 @@ class SampleCollection(object):
             query_id = dataset.first().id
             view = dataset.sort_by_similarity(query_id)
 
+            #
+            # Sort the samples by similarity of their embeddings in a vector
+            # field, without a brain run
+            #
+
+            model = foz.load_zoo_model("mobilenet-v2-imagenet-torch")
+            dataset.compute_embeddings(model, embeddings_field="embeddings")
+
+            view = dataset.sort_by_similarity(
+                query_id, k=10, embeddings_field="embeddings"
+            )
+
         Args:
             query_ids: an ID or iterable of query IDs. These may be sample IDs
                 or label IDs depending on ``brain_key``
@@ -4767,8 +4838,15 @@ class SampleCollection(object):
                 created if necessary
             brain_key (None): the brain key of an existing
                 :meth:`fiftyone.brain.compute_similarity` run on the dataset.
-                If not specified, the dataset must have an applicable run,
-                which will be used by default
+                If not specified and ``embeddings_field`` is not provided, the
+                dataset must have an applicable run, which will be used by
+                default
+            embeddings_field (None): the name of a
+                :class:`fiftyone.core.fields.VectorField` of the dataset
+                containing sample embeddings to use instead of a brain run. A
+                :class:`fiftyone.core.similarity.SimilarityIndex` is built for
+                the field if necessary. In this case, ``query_ids`` must be
+                sample IDs
 
         Returns:
             a :class:`fiftyone.core.view.DatasetView`
@@ -4780,6 +4858,7 @@ class SampleCollection(object):
                 reverse=reverse,
                 dist_field=dist_field,
                 brain_key=brain_key,
+                embeddings_field=embeddings_field,
             )
         )
 
@@ -6651,6 +6730,91 @@ class SampleCollection(object):
         """
         foan.AnnotationMethod.delete_runs(self)
 
+    def changes_since(self, timestamp):
+        """Returns a view containing the samples in this collection that have
+        been added or modified since the given time.
+
+        Only applicable to datasets with change tracking enabled. See
+        :meth:`fiftyone.core.dataset.Dataset.enable_change_tracking` for
+        details.
+
+        For video collections, samples with frames that have been added or
+        modified are also included.
+
+        Examples::
+
+            from datetime import datetime
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart").clone()
+            dataset.enable_change_tracking()
+
+            timestamp = datetime.utcnow()
+
+            sample = dataset.first()
+            sample["uniqueness"] = 1.0
+            sample.save()
+
+            view = dataset.changes_since(timestamp)
+            print(len(view))  # 1
+
+        Args:
+            timestamp: a UTC ``datetime``
+
+        Returns:
+            a :class:`fiftyone.core.view.DatasetView`
+        """
+        if not self._dataset.tracks_changes:
+            raise ValueError(
+                "Dataset '%s' does not track changes. Use "
+                "`enable_change_tracking()` to enable it" % self._dataset.name
+            )
+
+        filter = {"last_modified_at": {"$gte": timestamp}}
+
+        if (
+            self._dataset.media_type != fom.VIDEO
+            or not self._dataset._frame_doc_cls._tracks_changes()
+        ):
+            return self.match(filter)
+
+        # Frame-level changes are looked up per sample by the server, so that
+        # the IDs of the modified samples are never embedded in the view
+        return self.mongo(
+            [
+                {
+                    "$lookup": {
+                        "from": self._dataset._frame_collection_name,
+                        "let": {"sample_id": "$_id"},
+                        "pipeline": [
+                            {
+                                "$match": {
+                                    "$expr": {
+                                        "$eq": ["$$sample_id", "$_sample_id"]
+                                    },
+                                    **filter,
+                                }
+                            },
+                            {"$limit": 1},
+                            {"$project": {"_id": True}},
+                        ],
+                        "as": "_changed_frames",
+                    }
+                },
+                {
+                    "$match": {
+                        "$or": [
+                            filter,
+                            {"_changed_frames": {"$ne": []}},
+                        ]
+                    }
+                },
+                {"$unset": "_changed_frames"},
+            ]
+        )
+
     def list_indexes(self):
         """Returns the list of index names on this collection.
 
@@ -7223,6 +7387,7 @@ class SampleCollection(object):
         attach_frames=False,
         detach_frames=False,
         frames_only=False,
+        batch_size=None,
     ):
         """Runs the MongoDB aggregation pipeline on the collection and returns
         the result.
@@ -7236,6 +7401,7 @@ class SampleCollection(object):
                 end of the pipeline. Only applicable to video datasets
             frames_only (False): whether to generate a pipeline that contains
                 *only* the frames in the collection
+            batch_size (None): the number of documents to return per batch
 
         Returns:
             the aggregation result dict
@@ -7947,6 +8113,8 @@ def _parse_frame_values_dicts(sample_collection, sample_ids, values):
             ["id", "frames._id", "frames.frame_number"]
         )
 
+    stamp = sample_collection._dataset._make_change_stamp(frames=True)
+
     id_map = {}
     dicts = []
     for _id, _fids, _fns, _vals in zip(
@@ -7956,12 +8124,14 @@ def _parse_frame_values_dicts(sample_collection, sample_ids, values):
             id_map[(_id, fn)] = _fid
 
         for fn in set(_vals.keys()) - set(_fns):
-            dicts.append({"_sample_id": ObjectId(_id), "frame_number": fn})
+            dicts.append(
+                {"_sample_id": ObjectId(_id), "frame_number": fn, **stamp}
+            )
 
     # Insert frame documents for new frame numbers
     if dicts:
         sample_collection._dataset._bulk_write(
-            [InsertOne(d) for d in dicts], frames=True
+            [InsertOne(d) for d in dicts], ids=[], frames=True
         )  # adds `_id` to each dict
 
         for d in dicts:
@@ -100,6 +100,12 @@ class FiftyOneConfig(EnvConfig):
             env_var="FIFTYONE_DATASET_ZOO_DIR",
             default=None,
         )
+        self.dataset_zoo_snapshots = self.parse_bool(
+            d,
+            "dataset_zoo_snapshots",
+            env_var="FIFTYONE_DATASET_ZOO_SNAPSHOTS",
+            default=False,
+        )
         self.model_zoo_dir = self.parse_path(
             d, "model_zoo_dir", env_var="FIFTYONE_MODEL_ZOO_DIR", default=None
         )
@@ -157,6 +163,18 @@ class FiftyOneConfig(EnvConfig):
             env_var="FIFTYONE_DEFAULT_VIDEO_EXT",
             default=".mp4",
         )
+        self.media_export_workers = self.parse_int(
+            d,
+            "media_export_workers",
+            env_var="FIFTYONE_MEDIA_EXPORT_WORKERS",
+            default=1,
+        )
+        self.media_export_resume = self.parse_bool(
+            d,
+            "media_export_resume",
+            env_var="FIFTYONE_MEDIA_EXPORT_RESUME",
+            default=False,
+        )
         self.default_app_port = self.parse_int(
             d,
             "default_app_port",
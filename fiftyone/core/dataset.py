@@ -9,6 +9,7 @@ from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
 import fnmatch
+from functools import partial
 import itertools
 import logging
 import numbers
@@ -16,11 +17,13 @@ import os
 import random
 import string
 
+import bson
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
 from deprecated import deprecated
 import mongoengine.errors as moe
 from pymongo import DeleteMany, InsertOne, ReplaceOne, UpdateMany, UpdateOne
-from pymongo.errors import CursorNotFound, BulkWriteError
+from pymongo.errors import CursorNotFound
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -41,7 +44,9 @@ import fiftyone.core.metadata as fome
 from fiftyone.core.odm.dataset import SampleFieldDocument
 import fiftyone.migrations as fomi
 import fiftyone.core.odm as foo
+import fiftyone.core.profiling as fopf
 import fiftyone.core.sample as fos
+import fiftyone.core.similarity as fosi
 from fiftyone.core.singletons import DatasetSingleton
 import fiftyone.core.utils as fou
 import fiftyone.core.view as fov
@@ -52,13 +57,30 @@ foud = fou.lazy_import("fiftyone.utils.data")
 
 logger = logging.getLogger(__name__)
 
+# Number of samples that are prepared at a time when adding samples
+_PREPARE_BATCH_SIZE = 100
+
+# Fields of dataset documents that are read by `list_datasets(info=True)`
+_DATASET_INFO_FIELDS = (
+    "name",
+    "created_at",
+    "last_loaded_at",
+    "version",
+    "persistent",
+    "media_type",
+    "tags",
+    "sample_collection_name",
+)
+
 
 def list_datasets(info=False):
     """Lists the available FiftyOne datasets.
 
     Args:
         info (False): whether to return info dicts describing each dataset
-            rather than just their names
+            rather than just their names. The info for all datasets is read
+            via a single query, and the ``num_samples`` of each dataset are
+            estimates that may be cached for up to a minute
 
     Returns:
         a list of dataset names or info dicts
@@ -247,6 +269,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._doc = doc
         self._sample_doc_cls = sample_doc_cls
         self._frame_doc_cls = frame_doc_cls
+        self._schema_version = 0
 
         self._annotation_cache = {}
         self._brain_cache = {}
@@ -318,6 +341,23 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
     def _dataset(self):
         return self
 
+    @property
+    def _schema_token(self):
+        # A token that changes whenever the dataset is reloaded or any of its
+        # top-level fields are added, renamed, or deleted. Its elements must be
+        # compared by identity, since field names may be reused
+        if self._frame_doc_cls is not None:
+            frame_fields = self._frame_doc_cls._fields_ordered
+        else:
+            frame_fields = None
+
+        return (
+            self._schema_version,
+            self._doc,
+            self._sample_doc_cls._fields_ordered,
+            frame_fields,
+        )
+
     @property
     def _root_dataset(self):
         return self
@@ -435,6 +475,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         """The datetime that the dataset was last loaded."""
         return self._doc.last_loaded_at
 
+    @property
+    def tracks_changes(self):
+        """Whether the dataset records a ``last_modified_at`` timestamp on
+        each sample (and frame, for video datasets) whenever it is modified.
+
+        See :meth:`enable_change_tracking` for details.
+        """
+        return self._sample_doc_cls._tracks_changes()
+
     @property
     def persistent(self):
         """Whether the dataset persists in the database after a session is
@@ -1030,6 +1079,64 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._frame_doc_cls.add_implied_field(field_name, value)
         self._reload()
 
+    def enable_change_tracking(self):
+        """Enables modification tracking on this dataset.
+
+        When enabled, an indexed ``last_modified_at``
+        :class:`fiftyone.core.fields.DateTimeField` is added to the samples
+        (and frames, for video datasets) of the dataset and is automatically
+        set to the current UTC time whenever a sample (or frame) is added or
+        modified through the FiftyOne API. Existing samples and frames are
+        stamped with the current time when tracking is enabled.
+
+        Use :meth:`fiftyone.core.collections.SampleCollection.changes_since`
+        to efficiently retrieve the samples that have been modified since a
+        given time.
+        """
+        now = datetime.utcnow()
+
+        if "last_modified_at" not in self.get_field_schema():
+            self.add_sample_field("last_modified_at", fof.DateTimeField)
+
+        self._sample_collection.update_many(
+            {"last_modified_at": None}, {"$set": {"last_modified_at": now}}
+        )
+        self.create_index("last_modified_at")
+        fos.Sample._reload_docs(self._sample_collection_name)
+
+        if self.media_type == fom.VIDEO:
+            if "last_modified_at" not in self.get_frame_field_schema():
+                self.add_frame_field("last_modified_at", fof.DateTimeField)
+
+            self._frame_collection.update_many(
+                {"last_modified_at": None},
+                {"$set": {"last_modified_at": now}},
+            )
+            self.create_index("frames.last_modified_at")
+            fofr.Frame._reload_docs(self._frame_collection_name)
+
+    def disable_change_tracking(self):
+        """Disables modification tracking on this dataset.
+
+        The ``last_modified_at`` fields and their indexes are deleted.
+
+        See :meth:`enable_change_tracking` for details.
+        """
+        indexes = self.list_indexes()
+
+        if "last_modified_at" in indexes:
+            self.drop_index("last_modified_at")
+
+        if "last_modified_at" in self.get_field_schema():
+            self.delete_sample_field("last_modified_at")
+
+        if self.media_type == fom.VIDEO:
+            if "frames.last_modified_at" in indexes:
+                self.drop_index("frames.last_modified_at")
+
+            if "last_modified_at" in self.get_frame_field_schema():
+                self.delete_frame_field("last_modified_at")
+
     def rename_sample_field(self, field_name, new_field_name):
         """Renames the sample field to the given new name.
 
@@ -1092,6 +1199,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 self._sample_collection_name, fields, new_fields
             )
 
+            for field_name in fields:
+                fosi.delete_similarity_index(self, field_name)
+
         if embedded_fields:
             sample_collection = self if view is None else view
             self._sample_doc_cls._rename_embedded_fields(
@@ -1392,6 +1502,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             )
             fos.Sample._purge_fields(self._sample_collection_name, fields)
 
+            for field_name in fields:
+                fosi.delete_similarity_index(self, field_name)
+
         if embedded_fields:
             self._sample_doc_cls._delete_embedded_fields(embedded_fields)
             fos.Sample._reload_docs(self._sample_collection_name)
@@ -1414,43 +1527,118 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         self._reload()
 
-    def iter_samples(self, progress=False):
+    def iter_samples(
+        self, progress=False, batch_size=None, prefetch=False, read_only=False
+    ):
         """Returns an iterator over the samples in the dataset.
 
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
+            batch_size (None): the number of samples to fetch from the
+                database per round trip. By default, the server's default is
+                used
+            prefetch (False): whether to fetch upcoming samples from the
+                database in a background thread while the current samples are
+                being processed
+            read_only (False): whether to generate lightweight
+                :class:`fiftyone.core.sample.ReadOnlySample` instances whose
+                fields are decoded only when they are accessed. Read-only
+                samples cannot be edited and do not include the frames of
+                video samples
 
         Returns:
-            an iterator over :class:`fiftyone.core.sample.Sample` instances
+            an iterator over :class:`fiftyone.core.sample.Sample` or
+            :class:`fiftyone.core.sample.ReadOnlySample` instances
         """
         pipeline = self._pipeline(detach_frames=True)
+        samples = self._iter_samples(
+            pipeline,
+            batch_size=batch_size,
+            prefetch=prefetch,
+            read_only=read_only,
+        )
 
         if progress:
             with fou.ProgressBar(total=len(self)) as pb:
-                for sample in pb(self._iter_samples(pipeline)):
+                for sample in pb(samples):
                     yield sample
         else:
-            for sample in self._iter_samples(pipeline):
+            for sample in samples:
                 yield sample
 
-    def _iter_samples(self, pipeline):
+    def _iter_samples(
+        self, pipeline, batch_size=None, prefetch=False, read_only=False
+    ):
         index = 0
+        max_id = None
+        _pipeline = pipeline
+        hint = None
 
-        try:
-            for d in foo.aggregate(self._sample_collection, pipeline):
-                doc = self._sample_dict_to_doc(d)
-                sample = fos.Sample.from_doc(doc, dataset=self)
-                index += 1
-                yield sample
+        while True:
+            try:
+                for d in self._iter_sample_dicts(
+                    _pipeline,
+                    batch_size=batch_size,
+                    prefetch=prefetch,
+                    hint=hint,
+                ):
+                    if read_only:
+                        sample = fos.ReadOnlySample(
+                            d, self, self._sample_doc_cls
+                        )
+                    else:
+                        doc = self._sample_dict_to_doc(d)
+                        sample = fos.Sample.from_doc(doc, dataset=self)
 
-        except CursorNotFound:
-            # The cursor has timed out so we yield from a new one after
-            # skipping to the last offset
+                    _id = d["_id"]
+                    if max_id is None or _id > max_id:
+                        max_id = _id
 
-            pipeline.append({"$skip": index})
-            for sample in self._iter_samples(pipeline):
-                yield sample
+                    index += 1
+                    yield sample
+
+                return
+
+            except CursorNotFound:
+                # The cursor has timed out so we yield from a new one that
+                # starts after the last sample we've seen
+                _pipeline, hint = self._get_resume_pipeline(
+                    pipeline, index, max_id
+                )
+
+    def _iter_sample_dicts(
+        self, pipeline, batch_size=None, prefetch=False, hint=None
+    ):
+        docs = foo.aggregate(
+            self._sample_collection, pipeline, batch_size=batch_size, hint=hint
+        )
+        if prefetch:
+            docs = fou.iter_prefetched(docs, batch_size or 1000)
+
+        return docs
+
+    def _get_resume_pipeline(self, pipeline, index, max_id):
+        #
+        # If exactly the samples that we've seen have IDs <= `max_id`, then
+        # the unseen samples are exactly those with IDs > `max_id`, and we can
+        # resume via a `$match` rather than re-reading the samples that we've
+        # seen. This is true unless seen samples were deleted or samples with
+        # older IDs were inserted during iteration, in which case we must
+        # resort to skipping the samples that we've seen.
+        #
+        # Samples are iterated in natural order, which need not be ID order,
+        # so the `$match` must not use the `_id` index
+        #
+        if max_id is not None:
+            num_seen = self._sample_collection.count_documents(
+                {"_id": {"$lte": max_id}}
+            )
+            if num_seen == index:
+                resume_pipeline = [{"$match": {"_id": {"$gt": max_id}}}]
+                return resume_pipeline + pipeline, {"$natural": 1}
+
+        return pipeline + [{"$skip": index}], None
 
     def add_sample(self, sample, expand_schema=True, validate=True):
         """Adds the given sample to the dataset.
@@ -1503,21 +1691,19 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             except:
                 pass
 
-        # Dynamically size batches so that they are as large as possible while
-        # still achieving a nice frame rate on the progress bar
-        batcher = fou.DynamicBatcher(
-            samples, target_latency=0.2, init_batch_size=1, max_batch_beta=2.0
+        write_fcn = partial(
+            foo.insert_documents, coll=self._sample_collection, ordered=True
         )
 
-        sample_ids = []
-        with fou.ProgressBar(total=num_samples) as pb:
-            for batch in batcher:
-                sample_ids.extend(
-                    self._add_samples_batch(batch, expand_schema, validate)
-                )
-                pb.update(count=len(batch))
-
-        return sample_ids
+        with fopf.stage("add_samples"):
+            return self._write_samples(
+                samples,
+                write_fcn,
+                self._make_insert_op,
+                expand_schema=expand_schema,
+                validate=validate,
+                num_samples=num_samples,
+            )
 
     def add_collection(
         self, sample_collection, include_info=True, overwrite_info=False
@@ -1553,33 +1739,14 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         return self.skip(num_samples).values("id")
 
     def _add_samples_batch(self, samples, expand_schema, validate):
-        samples = [s.copy() if s._in_db else s for s in samples]
-
-        if self.media_type is None and samples:
-            self.media_type = samples[0].media_type
-
-        if expand_schema:
-            self._expand_schema(samples)
-
-        if validate:
-            self._validate_samples(samples)
+        samples = self._prepare_samples(samples, expand_schema, validate)
 
         dicts = [self._make_dict(sample) for sample in samples]
 
-        try:
-            # adds `_id` to each dict
-            self._sample_collection.insert_many(dicts)
-        except BulkWriteError as bwe:
-            msg = bwe.details["writeErrors"][0]["errmsg"]
-            raise ValueError(msg) from bwe
-
-        for sample, d in zip(samples, dicts):
-            doc = self._sample_dict_to_doc(d)
-            sample._set_backing_doc(doc, dataset=self)
-            if self.media_type == fom.VIDEO:
-                sample.frames.save()
+        # adds `_id` to each dict
+        foo.insert_documents(dicts, self._sample_collection, ordered=True)
 
-        return [str(d["_id"]) for d in dicts]
+        return self._finalize_samples(zip(samples, dicts))
 
     def _upsert_samples(
         self, samples, expand_schema=True, validate=True, num_samples=None
@@ -1590,18 +1757,85 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             except:
                 pass
 
-        # Dynamically size batches so that they are as large as possible while
-        # still achieving a nice frame rate on the progress bar
-        batcher = fou.DynamicBatcher(
-            samples, target_latency=0.2, init_batch_size=1, max_batch_beta=2.0
+        write_fcn = partial(
+            foo.bulk_write, coll=self._sample_collection, ordered=False
         )
 
+        with fopf.stage("upsert_samples"):
+            self._write_samples(
+                samples,
+                write_fcn,
+                self._make_upsert_op,
+                copy=False,
+                expand_schema=expand_schema,
+                validate=validate,
+                num_samples=num_samples,
+            )
+
+    def _write_samples(
+        self,
+        samples,
+        write_fcn,
+        make_op_fcn,
+        copy=True,
+        expand_schema=True,
+        validate=True,
+        num_samples=None,
+    ):
+        # Samples are prepared and encoded in this thread while the previous
+        # batch is written in a background thread. Write batches are sized by
+        # their encoded size and the observed write latency
+        sample_ids = []
+        writer = foo.BulkWriter(write_fcn)
+
         with fou.ProgressBar(total=num_samples) as pb:
-            for batch in batcher:
-                self._upsert_samples_batch(batch, expand_schema, validate)
-                pb.update(count=len(batch))
+            try:
+                with writer:
+                    for batch in fou.iter_batches(
+                        samples, _PREPARE_BATCH_SIZE
+                    ):
+                        batch = self._prepare_samples(
+                            batch, expand_schema, validate, copy=copy
+                        )
+
+                        for sample in batch:
+                            op, d, num_bytes = make_op_fcn(sample)
+                            writer.add(op, num_bytes, item=(sample, d))
+
+                        completed = writer.pop_completed()
+                        sample_ids.extend(
+                            self._finalize_samples(completed, pb)
+                        )
+            finally:
+                # Samples that were written before any error occurred are in
+                # the database, so they must be finalized regardless
+                completed = writer.pop_completed(raise_error=False)
+                sample_ids.extend(self._finalize_samples(completed, pb))
+
+        return sample_ids
 
     def _upsert_samples_batch(self, samples, expand_schema, validate):
+        samples = self._prepare_samples(
+            samples, expand_schema, validate, copy=False
+        )
+
+        dicts = []
+        ops = []
+        for sample in samples:
+            op, d, _ = self._make_upsert_op(sample)
+            dicts.append(d)
+            ops.append(op)
+
+        foo.bulk_write(ops, self._sample_collection, ordered=False)
+
+        self._finalize_samples(zip(samples, dicts))
+
+    def _prepare_samples(self, samples, expand_schema, validate, copy=True):
+        if copy:
+            samples = [s.copy() if s._in_db else s for s in samples]
+        else:
+            samples = list(samples)
+
         if self.media_type is None and samples:
             self.media_type = samples[0].media_type
 
@@ -1611,26 +1845,60 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if validate:
             self._validate_samples(samples)
 
-        dicts = []
-        ops = []
-        for sample in samples:
-            d = self._make_dict(sample, include_id=True)
-            dicts.append(d)
+        return samples
 
-            if sample.id:
-                ops.append(ReplaceOne({"_id": sample._id}, d, upsert=True))
-            else:
-                d.pop("_id", None)
-                ops.append(InsertOne(d))  # adds `_id` to dict
+    def _make_insert_op(self, sample):
+        d = self._make_dict(sample)
+        d["_id"] = ObjectId()
+        doc, num_bytes = _encode_dict(d)
 
-        foo.bulk_write(ops, self._sample_collection, ordered=False)
+        return doc, d, num_bytes
+
+    def _make_upsert_op(self, sample):
+        d = self._make_dict(sample, include_id=True)
+
+        # IDs of new samples are generated here rather than by the server so
+        # that documents are only encoded once
+        if sample.id:
+            doc, num_bytes = _encode_dict(d)
+            op = ReplaceOne({"_id": sample._id}, doc, upsert=True)
+        else:
+            d["_id"] = ObjectId()
+            doc, num_bytes = _encode_dict(d)
+            op = InsertOne(doc)
+
+        return op, d, num_bytes
+
+    def _finalize_samples(self, samples_and_dicts, pb=None):
+        is_video = self.media_type == fom.VIDEO
+
+        # Frames of new samples can be inserted in a single batch since they
+        # cannot already exist in the database
+        batch_frames = is_video and not self._is_clips
+
+        sample_ids = []
+        new_frames = []
+        for sample, d in samples_and_dicts:
+            is_new = sample.id is None
 
-        for sample, d in zip(samples, dicts):
             doc = self._sample_dict_to_doc(d)
             sample._set_backing_doc(doc, dataset=self)
 
-            if self.media_type == fom.VIDEO:
-                sample.frames.save()
+            if is_video:
+                if batch_frames and is_new:
+                    new_frames.append(sample.frames)
+                else:
+                    sample.frames.save()
+
+            sample_ids.append(str(d["_id"]))
+
+        if new_frames:
+            fofr.Frames._save_new(new_frames)
+
+        if pb is not None:
+            pb.update(count=len(sample_ids))
+
+        return sample_ids
 
     def _make_dict(self, sample, include_id=False):
         d = sample.to_mongo_dict(include_id=include_id)
@@ -1638,9 +1906,14 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         # We omit None here to allow samples with None-valued new fields to
         # be added without raising nonexistent field errors. This is safe
         # because None and missing are equivalent in our data model
-        return {k: v for k, v in d.items() if v is not None}
+        d = {k: v for k, v in d.items() if v is not None}
+
+        if self._sample_doc_cls._stamps_changes():
+            d["last_modified_at"] = datetime.utcnow()
 
-    def _bulk_write(self, ops, frames=False, ordered=False):
+        return d
+
+    def _bulk_write(self, ops, ids=None, frames=False, ordered=False):
         if frames:
             coll = self._frame_collection
         else:
@@ -1648,10 +1921,47 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         foo.bulk_write(ops, coll, ordered=ordered)
 
+        # Only reload in-memory documents that may have been modified, if
+        # the caller told us which ones they are
         if frames:
-            fofr.Frame._reload_docs(self._frame_collection_name)
+            if ids is not None:
+                fofr.Frame._reload_docs_by_frame_id(
+                    self._frame_collection_name, ids
+                )
+            else:
+                fofr.Frame._reload_docs(self._frame_collection_name)
         else:
-            fos.Sample._reload_docs(self._sample_collection_name)
+            fos.Sample._reload_docs(
+                self._sample_collection_name, sample_ids=ids
+            )
+
+    def _make_change_stamp(self, frames=False):
+        # Returns the fields to include in a write to record the time of the
+        # modification, if the dataset tracks changes
+        if frames:
+            doc_cls = self._frame_doc_cls
+        else:
+            doc_cls = self._sample_doc_cls
+
+        if not doc_cls._stamps_changes():
+            return {}
+
+        return {"last_modified_at": datetime.utcnow()}
+
+    def _stamp_update(self, update, frames=False):
+        # Returns a copy of the given update that also records the time of the
+        # modification, if the dataset tracks changes
+        stamp = self._make_change_stamp(frames=frames)
+        if not stamp:
+            return update
+
+        if isinstance(update, list):
+            # Pipeline-style update
+            return update + [{"$set": stamp}]
+
+        update = dict(update)
+        update["$set"] = dict(update.get("$set", {}), **stamp)
+        return update
 
     def _merge_doc(
         self,
@@ -1989,33 +2299,49 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 if view_ids is not None:
                     ops.append(
                         UpdateMany(
-                            {},
-                            {
-                                "$pull": {
-                                    array_field: {"_id": {"$in": view_ids}}
-                                }
-                            },
+                            {array_field + "._id": {"$in": view_ids}},
+                            self._stamp_update(
+                                {
+                                    "$pull": {
+                                        array_field: {"_id": {"$in": view_ids}}
+                                    }
+                                },
+                                frames=is_frame_field,
+                            ),
                         )
                     )
 
                 if ids is not None:
                     ops.append(
                         UpdateMany(
-                            {}, {"$pull": {array_field: {"_id": {"$in": ids}}}}
+                            {array_field + "._id": {"$in": ids}},
+                            self._stamp_update(
+                                {
+                                    "$pull": {
+                                        array_field: {"_id": {"$in": ids}}
+                                    }
+                                },
+                                frames=is_frame_field,
+                            ),
                         )
                     )
 
                 if tags is not None:
                     ops.append(
                         UpdateMany(
-                            {},
-                            {
-                                "$pull": {
-                                    array_field: {
-                                        "tags": {"$elemMatch": {"$in": tags}}
+                            {array_field + ".tags": {"$in": tags}},
+                            self._stamp_update(
+                                {
+                                    "$pull": {
+                                        array_field: {
+                                            "tags": {
+                                                "$elemMatch": {"$in": tags}
+                                            }
+                                        }
                                     }
-                                }
-                            },
+                                },
+                                frames=is_frame_field,
+                            ),
                         )
                     )
             else:
@@ -2023,7 +2349,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     ops.append(
                         UpdateMany(
                             {field + "._id": {"$in": view_ids}},
-                            {"$set": {field: None}},
+                            self._stamp_update(
+                                {"$set": {field: None}}, frames=is_frame_field
+                            ),
                         )
                     )
 
@@ -2031,7 +2359,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     ops.append(
                         UpdateMany(
                             {field + "._id": {"$in": ids}},
-                            {"$set": {field: None}},
+                            self._stamp_update(
+                                {"$set": {field: None}}, frames=is_frame_field
+                            ),
                         )
                     )
 
@@ -2039,7 +2369,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     ops.append(
                         UpdateMany(
                             {field + ".tags": {"$elemMatch": {"$in": tags}}},
-                            {"$set": {field: None}},
+                            self._stamp_update(
+                                {"$set": {field: None}}, frames=is_frame_field
+                            ),
                         )
                     )
 
@@ -2049,12 +2381,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 sample_ops.extend(ops)
 
         if sample_ops:
-            foo.bulk_write(sample_ops, self._sample_collection)
-            fos.Sample._reload_docs(self._sample_collection_name)
+            self._bulk_write(sample_ops)
 
         if frame_ops:
-            foo.bulk_write(frame_ops, self._frame_collection)
-            fofr.Frame._reload_docs(self._frame_collection_name)
+            self._bulk_write(frame_ops, frames=True)
 
     def _delete_labels(self, labels, fields=None):
         if etau.is_str(fields):
@@ -2097,13 +2427,16 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                                     "_sample_id": ObjectId(sample_id),
                                     "frame_number": frame_number,
                                 },
-                                {
-                                    "$pull": {
-                                        array_field: {
-                                            "_id": {"$in": label_ids}
+                                self._stamp_update(
+                                    {
+                                        "$pull": {
+                                            array_field: {
+                                                "_id": {"$in": label_ids}
+                                            }
                                         }
-                                    }
-                                },
+                                    },
+                                    frames=True,
+                                ),
                             )
                         )
                 else:
@@ -2124,7 +2457,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                                         "frame_number": frame_number,
                                         field + "._id": label_id,
                                     },
-                                    {"$set": {field: None}},
+                                    self._stamp_update(
+                                        {"$set": {field: None}}, frames=True
+                                    ),
                                 )
                             )
             else:
@@ -2140,13 +2475,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                         sample_ops.append(
                             UpdateOne(
                                 {"_id": ObjectId(sample_id)},
-                                {
-                                    "$pull": {
-                                        array_field: {
-                                            "_id": {"$in": label_ids}
+                                self._stamp_update(
+                                    {
+                                        "$pull": {
+                                            array_field: {
+                                                "_id": {"$in": label_ids}
+                                            }
                                         }
                                     }
-                                },
+                                ),
                             )
                         )
                 else:
@@ -2163,7 +2500,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                                         "_id": ObjectId(sample_id),
                                         field + "._id": label_id,
                                     },
-                                    {"$set": {field: None}},
+                                    self._stamp_update(
+                                        {"$set": {field: None}}
+                                    ),
                                 )
                             )
 
@@ -2284,6 +2623,14 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             d = {}
 
         self._sample_collection.delete_many(d)
+        foo.clear_collection_counts(
+            collection_name=self._sample_collection_name
+        )
+
+        # Views that use the dataset's IDs collections refer to samples that
+        # no longer exist, so their results are unchanged if they are dropped
+        if sample_ids is None:
+            foo.drop_ids_collections(self._sample_collection_name)
         fos.Sample._reset_docs(
             self._sample_collection_name, sample_ids=sample_ids
         )
@@ -2439,6 +2786,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     }
                 },
                 {"$unwind": "$frame_number"},
+                *_track_changes_pipeline(self._frame_doc_cls),
                 {
                     "$merge": {
                         "into": self._frame_collection_name,
@@ -2462,6 +2810,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         such that ``sample.in_dataset`` is False.
         """
         self._sample_collection.drop()
+        foo.drop_ids_collections(self._sample_collection_name)
         fos.Sample._reset_docs(self._sample_collection_name)
 
         # Clips datasets directly inherit frames from source dataset
@@ -2469,6 +2818,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             self._frame_collection.drop()
             fofr.Frame._reset_docs(self._frame_collection_name)
 
+        fosi.delete_similarity_index(self)
+
         # Update singleton
         self._instances.pop(self._doc.name, None)
 
@@ -4450,6 +4801,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         attach_frames=False,
         detach_frames=False,
         frames_only=False,
+        batch_size=None,
     ):
         _pipeline = self._pipeline(
             pipeline=pipeline,
@@ -4458,7 +4810,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             frames_only=frames_only,
         )
 
-        return foo.aggregate(self._sample_collection, _pipeline)
+        return foo.aggregate(
+            self._sample_collection, _pipeline, batch_size=batch_size
+        )
 
     @property
     def _sample_collection_name(self):
@@ -4633,6 +4987,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._evaluation_cache.clear()
 
     def _reload(self, hard=False):
+        self._schema_version += 1
+
         if not hard:
             self._doc.reload()
             return
@@ -4678,36 +5034,35 @@ def _list_datasets(include_private=False):
 
 
 def _list_dataset_info():
+    conn = foo.get_db_conn()
+
+    query = {"sample_collection_name": {"$regex": "^samples\\."}}
+    projection = {f: True for f in _DATASET_INFO_FIELDS}
+    dataset_dicts = list(conn.datasets.find(query, projection))
+
+    num_samples = foo.get_collection_counts(
+        d["sample_collection_name"] for d in dataset_dicts
+    )
+
+    # We don't want an error here if `name == None`
+    dataset_dicts = sorted(
+        dataset_dicts, key=lambda d: (d.get("name") is None, d.get("name"))
+    )
+
     info = []
-    for name in _list_datasets():
-        try:
-            dataset = Dataset(name, _create=False, _virtual=True)
-            num_samples = dataset._sample_collection.estimated_document_count()
-            i = {
-                "name": dataset.name,
-                "created_at": dataset.created_at,
-                "last_loaded_at": dataset.last_loaded_at,
-                "version": dataset.version,
-                "persistent": dataset.persistent,
-                "media_type": dataset.media_type,
-                "tags": dataset.tags,
-                "num_samples": num_samples,
-            }
-        except:
-            # If the dataset can't be loaded, it likely requires migration, so
-            # we can't show any information about it
-            i = {
-                "name": name,
-                "created_at": None,
-                "last_loaded_at": None,
-                "version": None,
-                "persistent": None,
-                "media_type": None,
-                "tags": None,
-                "num_samples": None,
+    for d in dataset_dicts:
+        info.append(
+            {
+                "name": d.get("name", None),
+                "created_at": d.get("created_at", None),
+                "last_loaded_at": d.get("last_loaded_at", None),
+                "version": d.get("version", None),
+                "persistent": d.get("persistent", None),
+                "media_type": d.get("media_type", None),
+                "tags": d.get("tags", None),
+                "num_samples": num_samples[d["sample_collection_name"]],
             }
-
-        info.append(i)
+        )
 
     return info
 
@@ -5132,9 +5487,11 @@ def _save_view(view, fields=None):
 
     if sample_fields:
         pipeline.append({"$project": {f: True for f in sample_fields}})
+        pipeline.extend(_track_changes_pipeline(dataset._sample_doc_cls))
         pipeline.append({"$merge": dataset._sample_collection_name})
         foo.aggregate(dataset._sample_collection, pipeline)
     elif save_samples:
+        pipeline.extend(_track_changes_pipeline(dataset._sample_doc_cls))
         pipeline.append(
             {
                 "$merge": {
@@ -5166,9 +5523,11 @@ def _save_view(view, fields=None):
 
         if frame_fields:
             pipeline.append({"$project": {f: True for f in frame_fields}})
+            pipeline.extend(_track_changes_pipeline(dataset._frame_doc_cls))
             pipeline.append({"$merge": dataset._frame_collection_name})
             foo.aggregate(dataset._sample_collection, pipeline)
         elif save_frames:
+            pipeline.extend(_track_changes_pipeline(dataset._frame_doc_cls))
             pipeline.append(
                 {
                     "$merge": {
@@ -5196,6 +5555,20 @@ def _save_view(view, fields=None):
         )
 
 
+def _track_changes_pipeline(doc_cls):
+    if not doc_cls._stamps_changes():
+        return []
+
+    return [{"$set": {"last_modified_at": datetime.utcnow()}}]
+
+
+def _encode_dict(d):
+    # Encoding here rather than letting pymongo do it during the write lets us
+    # measure the size of the document without encoding it twice
+    doc = RawBSONDocument(bson.encode(d))
+    return doc, len(doc.raw)
+
+
 def _merge_dataset_doc(
     dataset,
     collection_or_doc,
@@ -5742,6 +6115,11 @@ def _merge_samples_pipeline(
     else:
         when_not_matched = "discard"
 
+    track_changes = _track_changes_pipeline(dst_dataset._sample_doc_cls)
+    sample_pipeline.extend(track_changes)
+    if isinstance(when_matched, list):
+        when_matched.extend(track_changes)
+
     sample_pipeline.append(
         {
             "$merge": {
@@ -5813,6 +6191,11 @@ def _merge_samples_pipeline(
                 frames=True,
             )
 
+        track_changes = _track_changes_pipeline(dst_dataset._frame_doc_cls)
+        frame_pipeline.extend(track_changes)
+        if isinstance(when_frame_matched, list):
+            when_frame_matched.extend(track_changes)
+
         frame_pipeline.append(
             {
                 "$merge": {
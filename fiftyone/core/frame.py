@@ -588,7 +588,7 @@ class Frames(object):
         doc = self._dataset._frame_dict_to_doc(d)
         return Frame.from_doc(doc, dataset=self._dataset)
 
-    def _make_dict(self, frame, include_id=False):
+    def _make_dict(self, frame, include_id=False, stamp=True):
         d = frame.to_mongo_dict(include_id=include_id)
 
         # We omit None here to allow frames with None-valued new fields to
@@ -598,6 +598,9 @@ class Frames(object):
 
         d["_sample_id"] = self._sample_id
 
+        if stamp:
+            d.update(self._dataset._make_change_stamp(frames=True))
+
         return d
 
     def _to_frames_dict(self):
@@ -661,9 +664,11 @@ class Frames(object):
         new_dicts = {}
         ops = []
         for idx, (frame_number, frame) in enumerate(replacements.items()):
-            d = self._make_dict(frame)
+            d = self._make_dict(frame, stamp=_is_modified(frame))
             if not frame._in_db:
                 new_dicts[frame_number] = d
+            elif "last_modified_at" in d:
+                frame._doc._data["last_modified_at"] = d["last_modified_at"]
 
             op = ReplaceOne(
                 {"frame_number": frame_number, "_sample_id": self._sample_id},
@@ -684,8 +689,48 @@ class Frames(object):
 
                 frame._doc.id = ids_map[frame_number]
 
+        for frame in replacements.values():
+            frame._doc._clear_changed_fields()
+
         self._replacements.clear()
 
+    @staticmethod
+    def _save_new(frames_list):
+        """Saves the frames of samples that have just been added to the same
+        dataset via a single batch of inserts.
+
+        The samples must not have any frames in the database, so IDs can be
+        assigned to the new frame documents here rather than being read back
+        from the database.
+
+        Args:
+            frames_list: a list of :class:`Frames` instances
+        """
+        dataset = None
+        frames = []
+        dicts = []
+        for _frames in frames_list:
+            dataset = _frames._dataset
+            for frame in _frames._replacements.values():
+                d = _frames._make_dict(frame)
+                d["_id"] = ObjectId()
+                frames.append(frame)
+                dicts.append(d)
+
+            _frames._replacements.clear()
+
+        if not dicts:
+            return
+
+        foo.insert_documents(dicts, dataset._frame_collection, ordered=False)
+
+        for frame, d in zip(frames, dicts):
+            if isinstance(frame._doc, foo.NoDatasetFrameDocument):
+                doc = dataset._frame_dict_to_doc(d)
+                frame._set_backing_doc(doc, dataset=dataset)
+            else:
+                frame._doc.id = d["_id"]
+
 
 class FramesView(Frames):
     """An ordered dictionary of :class:`FrameView` instances keyed by frame
@@ -856,7 +901,9 @@ class FramesView(Frames):
 
         ops = []
         for frame_number, frame in self._replacements.items():
-            doc = self._make_dict(frame)
+            doc = self._make_dict(frame, stamp=_is_modified(frame))
+            if "last_modified_at" in doc:
+                frame._doc._data["last_modified_at"] = doc["last_modified_at"]
 
             # Update elements of filtered array fields separately
             for field in self._filtered_fields:
@@ -886,6 +933,10 @@ class FramesView(Frames):
             )
 
         self._frame_collection.bulk_write(ops, ordered=False)
+
+        for frame in self._replacements.values():
+            frame._doc._clear_changed_fields()
+
         self._replacements.clear()
 
 
@@ -974,3 +1025,8 @@ class FrameView(DocumentView):
     """
 
     _DOCUMENT_CLS = Frame
+
+
+def _is_modified(frame):
+    # Whether the frame is new or has unsaved changes
+    return not frame._in_db or bool(frame._doc._get_changed_fields())
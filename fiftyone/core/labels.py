@@ -898,12 +898,39 @@ class Keypoints(_HasLabelList, Label):
 class Segmentation(_HasID, Label):
     """A semantic segmentation for an image.
 
+    Provide either the ``mask`` or ``mask_path`` argument to define the
+    segmentation.
+
     Args:
         mask (None): a 2D numpy array with integer values encoding the semantic
             labels
+        mask_path (None): the path to the segmentation image on disk
     """
 
     mask = fof.ArrayField()
+    mask_path = fof.StringField()
+
+    @property
+    def has_mask(self):
+        """Whether this instance has a mask."""
+        return self.mask is not None or self.mask_path is not None
+
+    def get_mask(self):
+        """Returns the segmentation mask for this instance.
+
+        If the mask is stored on disk, it is loaded from ``mask_path``.
+
+        Returns:
+            a numpy array, or ``None``
+        """
+        if self.mask is not None:
+            return self.mask
+
+        if self.mask_path is not None:
+            # pylint: disable=no-member
+            return etai.read(self.mask_path, cv2.IMREAD_UNCHANGED)
+
+        return None
 
     def to_detections(self, mask_targets=None, mask_types="stuff"):
         """Returns a :class:`Detections` representation of this instance with
@@ -1253,7 +1280,7 @@ def _segmentation_to_detections(segmentation, mask_targets, mask_types):
         default = mask_types
         mask_types = {}
 
-    mask = segmentation.mask
+    mask = segmentation.get_mask()
 
     detections = []
     for target in np.unique(mask):
@@ -1303,7 +1330,7 @@ def _segmentation_to_polylines(
         default = mask_types
         mask_types = {}
 
-    mask = segmentation.mask
+    mask = segmentation.get_mask()
 
     polylines = []
     for target in np.unique(mask):
@@ -19,6 +19,7 @@ import eta.core.video as etav
 from fiftyone.core.odm import DynamicEmbeddedDocument
 import fiftyone.core.fields as fof
 import fiftyone.core.media as fom
+import fiftyone.core.profiling as fopf
 import fiftyone.core.utils as fou
 
 
@@ -228,6 +229,7 @@ def compute_sample_metadata(sample, overwrite=False, skip_failures=False):
         sample.save()
 
 
+@fopf.stage("compute_metadata")
 def compute_metadata(
     sample_collection, overwrite=False, num_workers=None, skip_failures=True
 ):
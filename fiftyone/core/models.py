@@ -22,6 +22,7 @@ import eta.core.web as etaw
 import fiftyone as fo
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.profiling as fopf
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
@@ -134,6 +135,8 @@ def apply_model(
         fov.validate_image_collection(samples)
 
     with contextlib.ExitStack() as context:
+        context.enter_context(fopf.stage("apply_model"))
+
         try:
             if confidence_thresh is not None:
                 cthresh = confidence_thresh
@@ -227,11 +230,14 @@ def _apply_image_model_single(
     with fou.ProgressBar() as pb:
         for sample in pb(samples):
             try:
-                img = etai.read(sample.filepath)
-                labels = model.predict(img)
+                with fopf.stage("read"):
+                    img = etai.read(sample.filepath)
 
-                sample.add_labels(
-                    labels, label_field, confidence_thresh=confidence_thresh
+                with fopf.stage("predict"):
+                    labels = model.predict(img)
+
+                _save_labels(
+                    [sample], [labels], label_field, confidence_thresh
                 )
             except Exception as e:
                 if not skip_failures:
@@ -249,15 +255,14 @@ def _apply_image_model_batch(
     with fou.ProgressBar(samples) as pb:
         for sample_batch in samples_loader:
             try:
-                imgs = [etai.read(sample.filepath) for sample in sample_batch]
-                labels_batch = model.predict_all(imgs)
+                imgs = _read_images(sample_batch)
 
-                for sample, labels in zip(sample_batch, labels_batch):
-                    sample.add_labels(
-                        labels,
-                        label_field,
-                        confidence_thresh=confidence_thresh,
-                    )
+                with fopf.stage("predict"):
+                    labels_batch = model.predict_all(imgs)
+
+                _save_labels(
+                    sample_batch, labels_batch, label_field, confidence_thresh
+                )
 
             except Exception as e:
                 if not skip_failures:
@@ -273,6 +278,19 @@ def _apply_image_model_batch(
             pb.update(len(sample_batch))
 
 
+@fopf.stage("read")
+def _read_images(sample_batch):
+    return [etai.read(sample.filepath) for sample in sample_batch]
+
+
+@fopf.stage("save")
+def _save_labels(sample_batch, labels_batch, label_field, confidence_thresh):
+    for sample, labels in zip(sample_batch, labels_batch):
+        sample.add_labels(
+            labels, label_field, confidence_thresh=confidence_thresh
+        )
+
+
 def _apply_image_model_data_loader(
     samples,
     model,
@@ -294,14 +312,12 @@ def _apply_image_model_data_loader(
                 if isinstance(imgs, Exception):
                     raise imgs
 
-                labels_batch = model.predict_all(imgs)
+                with fopf.stage("predict"):
+                    labels_batch = model.predict_all(imgs)
 
-                for sample, labels in zip(sample_batch, labels_batch):
-                    sample.add_labels(
-                        labels,
-                        label_field,
-                        confidence_thresh=confidence_thresh,
-                    )
+                _save_labels(
+                    sample_batch, labels_batch, label_field, confidence_thresh
+                )
 
             except Exception as e:
                 if not skip_failures:
@@ -642,6 +658,8 @@ def compute_embeddings(
         fov.validate_image_collection(samples)
 
     with contextlib.ExitStack() as context:
+        context.enter_context(fopf.stage("compute_embeddings"))
+
         if use_data_loader:
             # pylint: disable=no-member
             context.enter_context(fou.SetAttributes(model, preprocess=False))
@@ -1120,6 +1138,8 @@ def compute_patch_embeddings(
     batch_size = _parse_batch_size(batch_size, model, use_data_loader)
 
     with contextlib.ExitStack() as context:
+        context.enter_context(fopf.stage("compute_patch_embeddings"))
+
         if use_data_loader:
             # pylint: disable=no-member
             context.enter_context(fou.SetAttributes(model, preprocess=False))
@@ -25,15 +25,24 @@ from .database import (
     drop_orphan_collections,
     drop_orphan_run_results,
     list_collections,
+    make_ids_collection,
+    get_ids_collection_name,
+    drop_ids_collections,
+    drop_expired_ids_collections,
     get_collection_stats,
+    get_collection_counts,
+    clear_collection_counts,
     stream_collection,
     count_documents,
     export_document,
     export_collection,
+    dump_collection,
     import_document,
     import_collection,
+    restore_collection,
     insert_documents,
     bulk_write,
+    BulkWriter,
 )
 from .dataset import (
     create_field,
@@ -53,6 +62,7 @@ from .frame import (
 from .mixins import (
     get_default_fields,
     get_field_kwargs,
+    pause_change_tracking,
     validate_fields_match,
 )
 from .sample import (
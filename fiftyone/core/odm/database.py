@@ -6,21 +6,34 @@ Database utilities.
 |
 """
 import atexit
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 from datetime import datetime
+import hashlib
 import logging
-from multiprocessing.pool import ThreadPool
 import os
+import queue
+import re
+import threading
+import timeit
 
 import asyncio
-from bson import json_util
+import bson
+from bson import json_util, ObjectId
 from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from mongoengine import connect
 import mongoengine.errors as moe
 import motor.motor_asyncio as mtr
 
 from packaging.version import Version
 import pymongo
-from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
+import pymongo.read_concern
+from pymongo.errors import (
+    BulkWriteError,
+    OperationFailure,
+    ServerSelectionTimeoutError,
+)
 import pytz
 
 import eta.core.utils as etau
@@ -29,6 +42,7 @@ import fiftyone as fo
 import fiftyone.constants as foc
 from fiftyone.core.config import FiftyOneConfigError
 import fiftyone.core.fields as fof
+import fiftyone.core.profiling as fopf
 import fiftyone.core.service as fos
 import fiftyone.core.utils as fou
 
@@ -42,6 +56,39 @@ _client = None
 _async_client = None
 _connection_kwargs = {}
 _db_service = None
+_aggregation_executor = None
+_aggregation_executor_pid = None
+_aggregation_executor_lock = threading.Lock()
+_snapshot_reads_supported = None
+_collection_counts = {}
+_collection_counts_lock = threading.Lock()
+_ids_collections_used = {}
+_ids_collections_used_lock = threading.Lock()
+
+# Maximum number of aggregation pipelines that may run concurrently
+_MAX_AGGREGATION_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Number of seconds for which cached collection counts are considered fresh
+_COLLECTION_COUNTS_TTL = 60
+
+# Histogram buckets for the sizes of the batches written by `BulkWriter`
+_BYTES_BUCKETS = tuple(2**i for i in range(10, 27, 2))
+
+# Prefix of the collections created by `make_ids_collection()`
+_IDS_PREFIX = "ids."
+
+# Name of the collection that records when each IDs collection was last used
+_IDS_REGISTRY = "ids_collections"
+
+# Default number of seconds after their last use that IDs collections expire
+_IDS_COLLECTION_TTL = 86400
+
+# Number of seconds for which a process does not re-record its use of an IDs
+# collection. This must be much smaller than the TTL of any IDs collection
+_IDS_COLLECTION_REFRESH = 600
+
+# The error code of renaming a collection onto an existing collection
+_NAMESPACE_EXISTS = 48
 
 
 #
@@ -267,16 +314,23 @@ def _validate_db_version(config, client):
         )
 
 
-def aggregate(collection, pipelines):
+def aggregate(collection, pipelines, batch_size=None, hint=None):
     """Executes one or more aggregations on a collection.
 
-    Multiple aggregations are executed using multiple threads, and their
-    results are returned as lists rather than cursors.
+    Multiple aggregations are executed concurrently using a shared pool of
+    threads, and their results are returned as lists rather than cursors. If
+    the database supports snapshot reads (MongoDB 5.0+ replica sets or
+    sharded clusters), all pipelines read from the same point in time.
 
     Args:
         collection: a ``pymongo.collection.Collection`` or
             ``motor.motor_asyncio.AsyncIOMotorCollection``
         pipelines: a MongoDB aggregation pipeline or a list of pipelines
+        batch_size (None): the number of documents to return per batch when a
+            single pipeline is provided. By default, the server's default is
+            used
+        hint (None): an optional index specification to use when a single
+            pipeline is provided, e.g., ``{"$natural": 1}``
 
     Returns:
         -   If a single pipeline is provided, a
@@ -292,29 +346,149 @@ def aggregate(collection, pipelines):
     if not is_list:
         pipelines = [pipelines]
 
+    kwargs = {}
+    if batch_size is not None:
+        kwargs["batchSize"] = batch_size
+
+    if hint is not None:
+        kwargs["hint"] = hint
+
     num_pipelines = len(pipelines)
     if isinstance(collection, mtr.AsyncIOMotorCollection):
         if num_pipelines == 1 and not is_list:
-            return collection.aggregate(pipelines[0], allowDiskUse=True)
+            return collection.aggregate(
+                pipelines[0], allowDiskUse=True, **kwargs
+            )
 
         return _do_async_pooled_aggregate(collection, pipelines)
 
     if num_pipelines == 1:
-        result = collection.aggregate(pipelines[0], allowDiskUse=True)
+        result = collection.aggregate(
+            pipelines[0], allowDiskUse=True, **kwargs
+        )
         return [result] if is_list else result
 
     return _do_pooled_aggregate(collection, pipelines)
 
 
 def _do_pooled_aggregate(collection, pipelines):
-    # @todo: MongoDB 5.0 supports snapshots which can be used to make the
-    # results consistent, i.e. read from the same point in time
-    with ThreadPool(processes=len(pipelines)) as pool:
-        return pool.map(
-            lambda p: list(collection.aggregate(p, allowDiskUse=True)),
-            pipelines,
-            chunksize=1,
+    executor = _get_aggregation_executor()
+
+    # If the server supports it, all pipelines read from the same snapshot so
+    # that their results are consistent with each other
+    snapshot_time = _get_snapshot_time(collection)
+
+    # Each pipeline runs in its own copy of the current context so that any
+    # metrics it records are attributed to the caller's stage
+    futures = [
+        executor.submit(
+            contextvars.copy_context().run,
+            _do_aggregate,
+            collection,
+            pipeline,
+            snapshot_time,
+        )
+        for pipeline in pipelines
+    ]
+
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        # Don't run pipelines whose results will never be used
+        for future in futures:
+            future.cancel()
+
+        raise
+
+
+def _do_aggregate(collection, pipeline, snapshot_time):
+    if snapshot_time is not None:
+        read_concern = {"level": "snapshot", "atClusterTime": snapshot_time}
+        try:
+            return list(
+                collection.aggregate(
+                    pipeline, allowDiskUse=True, readConcern=read_concern
+                )
+            )
+        except OperationFailure as e:
+            # For example, the snapshot is too old or the pipeline contains
+            # a stage that is not supported in snapshot reads
+            logger.debug("Snapshot read failed; retrying: %s", e)
+
+    return list(collection.aggregate(pipeline, allowDiskUse=True))
+
+
+def _get_aggregation_executor():
+    global _aggregation_executor
+    global _aggregation_executor_pid
+
+    with _aggregation_executor_lock:
+        # Threads do not survive forks, so child processes need their own
+        pid = os.getpid()
+        if _aggregation_executor is None or _aggregation_executor_pid != pid:
+            _aggregation_executor = ThreadPoolExecutor(
+                max_workers=_MAX_AGGREGATION_WORKERS,
+                thread_name_prefix="fiftyone-aggregate",
+            )
+            _aggregation_executor_pid = pid
+
+        return _aggregation_executor
+
+
+def _shutdown_aggregation_executor():
+    global _aggregation_executor
+
+    with _aggregation_executor_lock:
+        if _aggregation_executor is not None:
+            _aggregation_executor.shutdown(wait=False)
+            _aggregation_executor = None
+
+
+atexit.register(_shutdown_aggregation_executor)
+
+
+def _get_snapshot_time(collection):
+    client = collection.database.client
+    if not _supports_snapshot_reads(client):
+        return None
+
+    try:
+        # The operation time of a majority read is a point in time that all
+        # pipelines can read at via `atClusterTime`
+        majority = collection.with_options(
+            read_concern=pymongo.read_concern.ReadConcern("majority")
         )
+        with client.start_session(causal_consistency=False) as session:
+            majority.find_one({}, {"_id": 1}, session=session)
+            return session.operation_time
+    except OperationFailure as e:
+        logger.debug("Failed to establish snapshot: %s", e)
+        return None
+
+
+def _supports_snapshot_reads(client):
+    global _snapshot_reads_supported
+
+    # Cached per client so that reconnecting to a different deployment
+    # re-checks its support
+    cached = _snapshot_reads_supported
+    if cached is not None and cached[0] is client:
+        return cached[1]
+
+    # Snapshot reads require MongoDB 5.0+ and a replica set or sharded
+    # cluster
+    try:
+        version = Version(client.server_info()["version"])
+        topology = client.topology_description.topology_type_name
+        supported = version >= Version("5.0") and (
+            topology in ("ReplicaSetWithPrimary", "Sharded")
+        )
+    except Exception:
+        supported = False
+
+    _snapshot_reads_supported = (client, supported)
+
+    return supported
 
 
 async def _do_async_pooled_aggregate(collection, pipelines):
@@ -388,6 +562,7 @@ def drop_database():
     """Drops the database."""
     _connect()
     _client.drop_database(fo.config.database_name)
+    _forget_ids_collections()
 
 
 def sync_database():
@@ -441,12 +616,203 @@ def drop_orphan_collections(dry_run=False):
     coll_prefixes = ("samples.", "frames.", "patches.", "clips.")
 
     for coll_name in conn.list_collection_names():
-        if coll_name not in colls_in_use and any(
-            coll_name.startswith(prefix) for prefix in coll_prefixes
-        ):
+        if coll_name.startswith(_IDS_PREFIX):
+            # IDs collections are orphans when their owner is
+            is_orphan = (
+                _get_ids_collection_owner(coll_name) not in colls_in_use
+            )
+        else:
+            is_orphan = coll_name not in colls_in_use and any(
+                coll_name.startswith(prefix) for prefix in coll_prefixes
+            )
+
+        if is_orphan:
             _logger.info("Dropping collection '%s'", coll_name)
             if not dry_run:
                 conn.drop_collection(coll_name)
+                if coll_name.startswith(_IDS_PREFIX):
+                    conn[_IDS_REGISTRY].delete_one({"_id": coll_name})
+                    _forget_ids_collections(prefix=coll_name)
+
+
+def make_ids_collection(sample_collection_name, ids, ttl=None):
+    """Creates a collection containing the given ObjectIds for use by views
+    into the given sample collection, if necessary, and returns its name.
+
+    The collection contains one ``{"_id": _id, "rank": rank}`` document for
+    each unique ID, where ``rank`` is the index of the first occurrence of the
+    ID in ``ids``, so it can be joined via ``$lookup`` in place of inlining
+    the IDs in a pipeline.
+
+    The name of the collection is given by :func:`get_ids_collection_name`,
+    so calling this method with the same arguments in any process returns the
+    same collection. The collection is owned by the sample collection; it is
+    deleted via :func:`drop_ids_collections` when its dataset is cleared or
+    deleted.
+
+    A new collection is created for every distinct list of IDs that a view
+    uses, so each call also records when the collection was last used, and
+    collections that have not been used for ``ttl`` seconds are deleted by
+    :func:`drop_expired_ids_collections` whenever a new collection is created.
+    Views should call this method each time they use the collection so that
+    it is recreated if it has expired. Repeated calls within
+    ``_IDS_COLLECTION_REFRESH`` seconds in the same process return
+    immediately.
+
+    Args:
+        sample_collection_name: the name of the sample collection whose views
+            will use the collection
+        ids: a list of ObjectIds
+        ttl (None): the number of seconds after its last use that the
+            collection may be deleted. By default, ``_IDS_COLLECTION_TTL`` is
+            used. This only applies when the collection is created
+
+    Returns:
+        the name of the collection
+    """
+    if ttl is None:
+        ttl = _IDS_COLLECTION_TTL
+
+    coll_name = get_ids_collection_name(sample_collection_name, ids)
+
+    now = timeit.default_timer()
+    with _ids_collections_used_lock:
+        last_used = _ids_collections_used.get(coll_name, None)
+        if last_used is not None and now - last_used < _IDS_COLLECTION_REFRESH:
+            return coll_name
+
+        _ids_collections_used[coll_name] = now
+
+    conn = get_db_conn()
+
+    # Record the use before checking whether the collection exists, so that
+    # it cannot be deemed expired after the check
+    conn[_IDS_REGISTRY].update_one(
+        {"_id": coll_name},
+        {
+            "$set": {"last_used_at": datetime.utcnow()},
+            "$setOnInsert": {"owner": sample_collection_name, "ttl": ttl},
+        },
+        upsert=True,
+    )
+
+    if conn.list_collection_names(filter={"name": coll_name}):
+        return coll_name
+
+    drop_expired_ids_collections()
+
+    docs = []
+    seen = set()
+    for rank, _id in enumerate(ids):
+        if _id not in seen:
+            seen.add(_id)
+            docs.append({"_id": _id, "rank": rank})
+
+    # Populate a temporary collection and then rename it so that other
+    # processes never observe a partially populated collection
+    tmp_coll_name = "%s%s.tmp%s" % (
+        _IDS_PREFIX,
+        sample_collection_name,
+        ObjectId(),
+    )
+    tmp_coll = conn[tmp_coll_name]
+    insert_documents(docs, tmp_coll)
+
+    try:
+        tmp_coll.rename(coll_name)
+    except OperationFailure as e:
+        tmp_coll.drop()
+
+        # Another process may have created the collection first
+        if e.code != _NAMESPACE_EXISTS:
+            raise
+
+    return coll_name
+
+
+def get_ids_collection_name(sample_collection_name, ids):
+    """Returns the name of the collection that :func:`make_ids_collection`
+    creates for the given arguments.
+
+    Args:
+        sample_collection_name: the name of the sample collection
+        ids: a list of ObjectIds
+
+    Returns:
+        the collection name
+    """
+    h = hashlib.md5()
+    for _id in ids:
+        h.update(_id.binary)
+
+    return "%s%s.%s" % (_IDS_PREFIX, sample_collection_name, h.hexdigest())
+
+
+def drop_ids_collections(sample_collection_name):
+    """Drops all collections created by :func:`make_ids_collection` for the
+    given sample collection.
+
+    Args:
+        sample_collection_name: the name of the sample collection
+    """
+    conn = get_db_conn()
+    prefix = _IDS_PREFIX + sample_collection_name + "."
+    for coll_name in conn.list_collection_names(
+        filter={"name": {"$regex": "^" + re.escape(prefix)}}
+    ):
+        conn.drop_collection(coll_name)
+
+    conn[_IDS_REGISTRY].delete_many({"owner": sample_collection_name})
+    _forget_ids_collections(prefix=prefix)
+
+
+def drop_expired_ids_collections():
+    """Drops all collections created by :func:`make_ids_collection` that
+    have not been used within their TTL.
+    """
+    conn = get_db_conn()
+    registry = conn[_IDS_REGISTRY]
+
+    expired = registry.find(
+        {
+            "$expr": {
+                "$lt": [
+                    {
+                        "$add": [
+                            "$last_used_at",
+                            {"$multiply": ["$ttl", 1000]},
+                        ]
+                    },
+                    datetime.utcnow(),
+                ]
+            }
+        },
+        {"last_used_at": True},
+    )
+
+    for d in list(expired):
+        # The collection is only dropped if it was not used in the meantime
+        result = registry.delete_one(
+            {"_id": d["_id"], "last_used_at": d["last_used_at"]}
+        )
+        if result.deleted_count:
+            conn.drop_collection(d["_id"])
+
+
+def _forget_ids_collections(prefix=None):
+    # Ensures that this process recreates dropped IDs collections on next use
+    with _ids_collections_used_lock:
+        if prefix is None:
+            _ids_collections_used.clear()
+            return
+
+        for coll_name in list(_ids_collections_used.keys()):
+            if coll_name.startswith(prefix):
+                del _ids_collections_used[coll_name]
+
+
+def _get_ids_collection_owner(coll_name):
+    return coll_name[len(_IDS_PREFIX) :].rsplit(".", 1)[0]
 
 
 def drop_orphan_run_results(dry_run=False):
@@ -513,6 +879,61 @@ def get_collection_stats(collection_name):
     return stats
 
 
+def get_collection_counts(collection_names, max_age=None):
+    """Returns the estimated number of documents in the given collections.
+
+    Counts are cached in-process and lazily refreshed, so only collections
+    whose cached counts are older than ``max_age`` seconds are queried. Writes
+    performed via :func:`insert_documents` and :func:`bulk_write` invalidate
+    the cached count of the collection that they modify.
+
+    Args:
+        collection_names: an iterable of collection names
+        max_age (None): the maximum age, in seconds, of cached counts to use.
+            By default, counts are cached for 60 seconds. Pass ``0`` to
+            refresh all counts
+
+    Returns:
+        a dict mapping collection names to counts
+    """
+    if max_age is None:
+        max_age = _COLLECTION_COUNTS_TTL
+
+    conn = get_db_conn()
+    now = timeit.default_timer()
+
+    counts = {}
+    for collection_name in collection_names:
+        with _collection_counts_lock:
+            cached = _collection_counts.get(collection_name, None)
+
+        if cached is not None and now - cached[1] <= max_age:
+            counts[collection_name] = cached[0]
+            continue
+
+        count = conn[collection_name].estimated_document_count()
+        with _collection_counts_lock:
+            _collection_counts[collection_name] = (count, now)
+
+        counts[collection_name] = count
+
+    return counts
+
+
+def clear_collection_counts(collection_name=None):
+    """Clears the cached counts used by :func:`get_collection_counts`.
+
+    Args:
+        collection_name (None): the name of a collection whose cached count to
+            clear. By default, all cached counts are cleared
+    """
+    with _collection_counts_lock:
+        if collection_name is None:
+            _collection_counts.clear()
+        else:
+            _collection_counts.pop(collection_name, None)
+
+
 def count_documents(coll, pipeline):
     result = aggregate(coll, pipeline + [{"$count": "count"}])
 
@@ -560,6 +981,23 @@ def export_collection(docs, json_path, key="documents", num_docs=None):
         f.write("]}")
 
 
+def dump_collection(coll, bson_path):
+    """Dumps the contents of the collection to disk in BSON format.
+
+    The documents are streamed to disk as raw BSON, without being decoded, in
+    the collection's natural order.
+
+    Args:
+        coll: a pymongo collection instance
+        bson_path: the path to write the BSON file
+    """
+    etau.ensure_basedir(bson_path)
+
+    with open(bson_path, "wb") as f:
+        for batch in coll.find_raw_batches():
+            f.write(batch)
+
+
 def import_document(json_path):
     """Imports a document from JSON on disk.
 
@@ -586,6 +1024,23 @@ def import_collection(json_path):
         return json_util.loads(f.read())
 
 
+def restore_collection(bson_path, coll):
+    """Inserts the documents in a BSON file written by
+    :meth:`dump_collection` into a collection.
+
+    The documents are inserted as raw BSON, without being decoded.
+
+    Args:
+        bson_path: the path to the BSON file
+        coll: a pymongo collection instance
+    """
+    codec_options = CodecOptions(document_class=RawBSONDocument)
+
+    with open(bson_path, "rb") as f:
+        docs = bson.decode_file_iter(f, codec_options=codec_options)
+        insert_documents(docs, coll, ordered=True)
+
+
 def insert_documents(docs, coll, ordered=False):
     """Inserts a list of documents into a collection.
 
@@ -603,6 +1058,8 @@ def insert_documents(docs, coll, ordered=False):
     except BulkWriteError as bwe:
         msg = bwe.details["writeErrors"][0]["errmsg"]
         raise ValueError(msg) from bwe
+    finally:
+        clear_collection_counts(collection_name=coll.name)
 
 
 def bulk_write(ops, coll, ordered=False):
@@ -619,6 +1076,216 @@ def bulk_write(ops, coll, ordered=False):
     except BulkWriteError as bwe:
         msg = bwe.details["writeErrors"][0]["errmsg"]
         raise ValueError(msg) from bwe
+    finally:
+        clear_collection_counts(collection_name=coll.name)
+
+
+class BulkWriter(object):
+    """Class that performs batches of write operations in a background thread
+    so that callers can prepare the next batch while the previous one is
+    being written.
+
+    Operations are grouped into batches based on their encoded BSON size. The
+    target size of each batch is dynamically scaled so that each write takes
+    approximately ``target_latency`` seconds to complete.
+
+    Writes are performed in the order that operations were added. Any error
+    raised by a write is re-raised by the next call to :meth:`add`,
+    :meth:`pop_completed`, or :meth:`close`.
+
+    Example usage::
+
+        import bson
+        from bson.raw_bson import RawBSONDocument
+
+        import fiftyone.core.odm as foo
+
+        coll = foo.get_db_conn()["my_collection"]
+
+        write_fcn = lambda docs: foo.insert_documents(docs, coll, ordered=True)
+
+        with foo.BulkWriter(write_fcn) as writer:
+            for idx in range(int(1e6)):
+                doc = RawBSONDocument(bson.encode({"_id": bson.ObjectId()}))
+                writer.add(doc, len(doc.raw), item=idx)
+
+        written = writer.pop_completed()
+
+    Args:
+        write_fcn: a function that performs a list of operations
+        target_latency (0.2): the target duration of each write, in seconds
+        init_batch_bytes (262144): the initial batch size, in bytes
+        min_batch_bytes (65536): the minimum batch size, in bytes
+        max_batch_bytes (16777216): the maximum batch size, in bytes
+        max_pending (2): the maximum number of batches that may be queued for
+            writing before :meth:`add` blocks
+    """
+
+    def __init__(
+        self,
+        write_fcn,
+        target_latency=0.2,
+        init_batch_bytes=262144,
+        min_batch_bytes=65536,
+        max_batch_bytes=16777216,
+        max_pending=2,
+    ):
+        self.write_fcn = write_fcn
+        self.target_latency = target_latency
+        self.min_batch_bytes = min_batch_bytes
+        self.max_batch_bytes = max_batch_bytes
+
+        self._batch_bytes = init_batch_bytes
+        self._queue = queue.Queue(maxsize=max(max_pending, 1))
+        self._lock = threading.Lock()
+        self._ops = []
+        self._items = []
+        self._num_bytes = 0
+        self._completed = []
+        self._error = None
+        self._abort = False
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, *args):
+        self.close(abort=exc_type is not None)
+
+    @property
+    def batch_bytes(self):
+        """The current target batch size, in bytes."""
+        return self._batch_bytes
+
+    def start(self):
+        """Starts the writer thread."""
+        if self._thread is not None:
+            return
+
+        # Run in a copy of the current context so that any metrics recorded
+        # by the writer are attributed to the caller's stage
+        ctx = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=ctx.run, args=(self._run,), daemon=True
+        )
+        self._thread.start()
+
+    def add(self, op, num_bytes, item=None):
+        """Adds an operation to the writer.
+
+        Args:
+            op: a pymongo operation or document, depending on what
+                ``write_fcn`` expects
+            num_bytes: the encoded size of the operation, in bytes
+            item (None): an optional item to return via :meth:`pop_completed`
+                after the operation has been written
+        """
+        self._raise_error()
+
+        self._ops.append(op)
+        self._items.append(item)
+        self._num_bytes += num_bytes
+
+        if self._num_bytes >= self._batch_bytes:
+            self.flush()
+
+    def flush(self):
+        """Submits any buffered operations for writing."""
+        if not self._ops:
+            return
+
+        batch = (self._ops, self._items, self._num_bytes)
+        self._ops = []
+        self._items = []
+        self._num_bytes = 0
+
+        self._queue.put(batch)
+
+    def pop_completed(self, raise_error=True):
+        """Returns the items of all operations that have been written since the
+        last call to this method, in the order that they were added.
+
+        Args:
+            raise_error (True): whether to raise any pending write error rather
+                than returning the items that were written before it occurred
+
+        Returns:
+            a list of items
+        """
+        if raise_error:
+            self._raise_error()
+
+        with self._lock:
+            completed = self._completed
+            self._completed = []
+
+        return completed
+
+    def close(self, abort=False):
+        """Writes any buffered operations and stops the writer thread.
+
+        Args:
+            abort (False): whether to discard any operations that have not yet
+                been written rather than writing them
+        """
+        if self._thread is not None:
+            if abort:
+                self._abort = True
+            else:
+                self.flush()
+
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        if not abort:
+            self._raise_error()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+
+            if self._abort or self._error is not None:
+                continue
+
+            ops, items, num_bytes = batch
+
+            start = timeit.default_timer()
+            try:
+                self.write_fcn(ops)
+            except Exception as e:
+                self._error = e
+                continue
+
+            elapsed = timeit.default_timer() - start
+
+            with self._lock:
+                self._completed.extend(items)
+
+            self._update_batch_bytes(num_bytes, elapsed)
+
+            fopf.observe("write_latency", elapsed)
+            fopf.observe("batch_bytes", num_bytes, buckets=_BYTES_BUCKETS)
+            fopf.record_batch_size(len(ops))
+
+    def _update_batch_bytes(self, num_bytes, elapsed):
+        # Scale by at most 2x per batch to avoid overreacting to noise
+        beta = self.target_latency / max(elapsed, 1e-6)
+        beta = min(max(beta, 0.5), 2.0)
+
+        batch_bytes = int(beta * max(num_bytes, self._batch_bytes))
+        batch_bytes = max(batch_bytes, self.min_batch_bytes)
+        batch_bytes = min(batch_bytes, self.max_batch_bytes)
+        self._batch_bytes = batch_bytes
+
+    def _raise_error(self):
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
 
 
 def list_datasets():
@@ -683,6 +1350,17 @@ def delete_dataset(name, dry_run=False):
         if not dry_run:
             conn.drop_collection(frame_collection_name)
 
+    ids_prefix = _IDS_PREFIX + sample_collection_name + "."
+    for coll_name in collections:
+        if coll_name.startswith(ids_prefix):
+            _logger.info("Dropping collection '%s'", coll_name)
+            if not dry_run:
+                conn.drop_collection(coll_name)
+
+    if not dry_run:
+        conn[_IDS_REGISTRY].delete_many({"owner": sample_collection_name})
+        _forget_ids_collections(prefix=ids_prefix)
+
     delete_results = _get_result_ids(dataset_dict)
 
     if delete_results:
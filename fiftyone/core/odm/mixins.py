@@ -6,6 +6,8 @@ Mixins and helpers for dataset backing documents.
 |
 """
 from collections import OrderedDict
+import contextlib
+import contextvars
 from datetime import date, datetime
 import json
 import logging
@@ -30,6 +32,26 @@ fod = fou.lazy_import("fiftyone.core.dataset")
 
 logger = logging.getLogger(__name__)
 
+_change_tracking_paused = contextvars.ContextVar(
+    "change_tracking_paused", default=False
+)
+
+
+@contextlib.contextmanager
+def pause_change_tracking():
+    """Context manager that prevents the writes made within it from updating
+    the ``last_modified_at`` timestamps of datasets that track changes.
+
+    This is useful when writing derived data, such as evaluation results,
+    that should not cause samples to be reported by
+    :meth:`fiftyone.core.collections.SampleCollection.changes_since`.
+    """
+    token = _change_tracking_paused.set(True)
+    try:
+        yield
+    finally:
+        _change_tracking_paused.reset(token)
+
 
 def get_default_fields(cls, include_private=False, use_db_fields=False):
     """Gets the default fields present on all instances of the given
@@ -144,6 +166,16 @@ class DatasetMixin(object):
         collection_name = cls.__name__
         return fod._get_dataset_doc(collection_name, frames=cls._is_frames_doc)
 
+    @classmethod
+    def _tracks_changes(cls):
+        # pylint: disable=no-member
+        field = cls._fields.get("last_modified_at", None)
+        return isinstance(field, fof.DateTimeField)
+
+    @classmethod
+    def _stamps_changes(cls):
+        return cls._tracks_changes() and not _change_tracking_paused.get()
+
     def _get_field_names(self, include_private=False):
         return self._get_fields_ordered(include_private=include_private)
 
@@ -774,6 +806,17 @@ class DatasetMixin(object):
             update_doc, filtered_fields
         )
 
+        if self._stamps_changes() and (update_doc or extra_updates):
+            now = datetime.utcnow()
+            set_doc = update_doc.setdefault("$set", {})
+            set_doc["last_modified_at"] = now
+            self._data["last_modified_at"] = now
+
+            unset_doc = update_doc.get("$unset", {})
+            unset_doc.pop("last_modified_at", None)
+            if "$unset" in update_doc and not unset_doc:
+                del update_doc["$unset"]
+
         if update_doc:
             result = collection.update_one(
                 select_dict, update_doc, upsert=True
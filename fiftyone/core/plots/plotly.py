@@ -16,6 +16,7 @@ from PIL import ImageColor
 import plotly.colors as pc
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.callbacks import BoxSelector, LassoSelector
 import sklearn.linear_model as skl
 import sklearn.metrics as skm
 
@@ -31,6 +32,7 @@ import fiftyone.core.utils as fou
 import fiftyone.core.video as fov
 
 from .base import Plot, InteractivePlot, ResponsivePlot
+from .utils import GridIndex
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,8 @@ _DEFAULT_LAYOUT = dict(
 _DEFAULT_LINE_COLOR = "#FF6D04"
 _DEFAULT_CONTINUOUS_COLORSCALE = "viridis"
 _MAX_LABEL_TRACES = 25
+_DEFAULT_MAX_POINTS = 10000
+_DEFAULT_NUM_BINS = 128
 
 
 def plot_confusion_matrix(
@@ -994,6 +998,8 @@ def scatterplot(
     edges_title=None,
     show_colorbar_title=None,
     axis_equal=False,
+    max_points=None,
+    num_bins=None,
     **kwargs,
 ):
     """Generates an interactive scatterplot of the given points.
@@ -1010,6 +1016,12 @@ def scatterplot(
     You can use the ``labels`` parameters to define a coloring for the points,
     and you can use the ``sizes`` parameter to scale the sizes of the points.
 
+    When visualizing many 2D points, you can pass the ``max_points`` parameter
+    to render a level-of-detail representation of the points via
+    :class:`InteractiveDensityScatter`, in which the points in the current
+    viewport are binned server-side whenever there are more than
+    ``max_points`` of them.
+
     Args:
         points: a ``num_points x num_dims`` array-like of points
         samples (None): the :class:`fiftyone.core.collections.SampleCollection`
@@ -1086,12 +1098,23 @@ def scatterplot(
             ``labels_title`` or an appropriate default can be inferred from
             the ``labels`` parameter
         axis_equal (False): whether to set the axes to equal scale
+        max_points (None): the maximum number of points to render
+            individually. If provided and there are more than this many 2D
+            points with IDs, an :class:`InteractiveDensityScatter` is returned
+            that bins the points in the current viewport whenever it contains
+            more than this many points. In this mode, ``sizes``, ``edges``, and
+            ``multi_trace`` are not supported
+        num_bins (None): the number of bins to use along each dimension when
+            binning points. Only applicable when ``max_points`` is provided. The
+            default is 128
         **kwargs: optional keyword arguments for
             :meth:`plotly:plotly.graph_objects.Figure.update_layout`
 
     Returns:
         one of the following
 
+        -   an :class:`InteractiveDensityScatter`, for 2D points when IDs are
+            available and there are more than ``max_points`` points
         -   an :class:`InteractiveScatter`, for 2D points and when IDs are
             available
         -   a :class:`PlotlyNotebookPlot`, if you're working in a Jupyter
@@ -1120,7 +1143,26 @@ def scatterplot(
         points, samples, ids, link_field, labels, sizes, edges, classes
     )
 
-    if categorical:
+    density = (
+        max_points is not None
+        and num_dims == 2
+        and ids is not None
+        and len(points) > max_points
+    )
+
+    if density:
+        if sizes is not None or edges is not None or multi_trace:
+            logger.warning(
+                "Ignoring `sizes`, `edges`, and `multi_trace`, which are not "
+                "supported when rendering binned points"
+            )
+
+        if figure is None:
+            figure = go.Figure()
+
+        if axis_equal:
+            figure.update_layout(yaxis_scaleanchor="x")
+    elif categorical:
         if multi_trace is None:
             multi_trace = len(classes) <= _MAX_LABEL_TRACES
 
@@ -1217,6 +1259,30 @@ def scatterplot(
         selection_mode = "patches"
         init_fcn = lambda view: view.to_patches(link_field)
 
+    if density:
+        if num_bins is None:
+            num_bins = _DEFAULT_NUM_BINS
+
+        return InteractiveDensityScatter(
+            figure,
+            points,
+            ids,
+            labels=labels,
+            classes=classes,
+            max_points=max_points,
+            num_bins=num_bins,
+            marker_size=marker_size,
+            colorscale=colorscale,
+            trace_title=trace_title,
+            labels_title=labels_title,
+            colorbar_title=colorbar_title,
+            link_type=link_type,
+            init_view=samples,
+            label_fields=link_field,
+            selection_mode=selection_mode,
+            init_fcn=init_fcn,
+        )
+
     return InteractiveScatter(
         figure,
         link_type=link_type,
@@ -2142,6 +2208,351 @@ class InteractiveScatter(PlotlyInteractivePlot):
         return ready
 
 
+class InteractiveDensityScatter(PlotlyInteractivePlot):
+    """An interactive Plotly scatterplot of 2D points that renders a
+    level-of-detail representation of the points.
+
+    When the current viewport of the plot contains more than ``max_points``
+    points, the points in the viewport are binned server-side into a
+    ``num_bins x num_bins`` grid and only the nonempty bins are sent to the
+    plot, colored by the number of points that they contain. Once you zoom in
+    far enough that the viewport contains at most ``max_points`` points, the
+    individual points are rendered instead.
+
+    Lasso and box selections are resolved to the IDs of the underlying points
+    server-side via a :class:`fiftyone.core.plots.utils.GridIndex`, so IDs are
+    never sent to the plot unless the corresponding points are being rendered
+    individually.
+
+    Args:
+        figure: a :class:`plotly:plotly.graph_objects.Figure` to which to add
+            the plot
+        points: a ``num_points x 2`` array of points
+        ids: an array-like of IDs corresponding to the points
+        labels (None): an optional array of numeric or string values to use to
+            color the points when they are rendered individually
+        classes (None): the list of classes in ``labels``, if ``labels``
+            contains strings
+        max_points (10000): the maximum number of points to render
+            individually
+        num_bins (128): the number of bins to use along each dimension when
+            rendering bins
+        marker_size (None): the marker size to use
+        colorscale (None): a plotly colorscale to use for the bin counts and
+            numeric ``labels``
+        trace_title (None): a name for the points trace
+        labels_title ("label"): a title string to use for ``labels`` in the
+            tooltip
+        colorbar_title (None): a title for the colorbar of ``labels``
+        **kwargs: keyword arguments for the
+            :class:`fiftyone.core.plots.base.InteractivePlot` constructor
+    """
+
+    def __init__(
+        self,
+        figure,
+        points,
+        ids,
+        labels=None,
+        classes=None,
+        max_points=_DEFAULT_MAX_POINTS,
+        num_bins=_DEFAULT_NUM_BINS,
+        marker_size=None,
+        colorscale=None,
+        trace_title=None,
+        labels_title="label",
+        colorbar_title=None,
+        **kwargs,
+    ):
+        if colorscale is None:
+            colorscale = _DEFAULT_CONTINUOUS_COLORSCALE
+
+        if labels is not None and classes is not None:
+            targets = {c: i for i, c in enumerate(classes)}
+            labels = np.array([targets[l] for l in labels])
+
+        self.max_points = max_points
+        self.num_bins = num_bins
+
+        self._figure = figure
+        self._index = GridIndex(points)
+        self._ids = np.asarray(ids)
+        self._ids_to_inds = None
+        self._labels = labels
+        self._classes = classes
+        self._marker_size = marker_size
+        self._colorscale = colorscale
+        self._trace_title = trace_title
+        self._labels_title = labels_title
+        self._colorbar_title = colorbar_title
+        self._selected_inds = None
+        self._point_inds = None
+        self._bin_keys = None
+        self._bin_edges = None
+        self._bins_trace = None
+        self._points_trace = None
+
+        widget = self._make_widget()
+
+        super().__init__(widget, **kwargs)
+
+    @property
+    def supports_session_updates(self):
+        return True
+
+    @property
+    def _selected_ids(self):
+        if self._selected_inds is None:
+            return None
+
+        return list(self._ids[self._selected_inds])
+
+    def _make_widget(self):
+        xmin, xmax, ymin, ymax = self._index.bounds
+        xpad = 0.05 * ((xmax - xmin) or 1.0)
+        ypad = 0.05 * ((ymax - ymin) or 1.0)
+        xrange = [xmin - xpad, xmax + xpad]
+        yrange = [ymin - ypad, ymax + ypad]
+
+        figure = go.Figure(self._figure)
+        figure.add_traces(self._make_traces())
+        figure.update_layout(xaxis_range=xrange, yaxis_range=yrange)
+
+        widget = go.FigureWidget(figure)
+        self._bins_trace = widget.data[-2]
+        self._points_trace = widget.data[-1]
+
+        with widget.batch_update():
+            self._render(xrange, yrange)
+
+        widget.layout.on_change(
+            self._on_relayout, "xaxis.range", "yaxis.range"
+        )
+
+        return widget
+
+    def _make_traces(self):
+        bins_marker = dict(
+            symbol="square",
+            size=self._marker_size or 6,
+            colorscale=self._colorscale,
+            colorbar=dict(title="count", lenmode="fraction", len=1),
+            showscale=True,
+        )
+
+        bins_trace = go.Scattergl(
+            x=[],
+            y=[],
+            mode="markers",
+            marker=bins_marker,
+            name="bins",
+            hovertemplate=(
+                "<b>count: %{text}</b><br>"
+                "x, y = %{x:.3f}, %{y:.3f}<extra></extra>"
+            ),
+        )
+
+        points_marker = dict()
+        hover_lines = []
+
+        if self._labels is not None:
+            if self._classes is not None:
+                num_classes = len(self._classes)
+                points_marker.update(
+                    dict(
+                        cmin=-0.5,
+                        cmax=num_classes - 0.5,
+                        autocolorscale=False,
+                        colorscale=_get_qualitative_colorscale(num_classes),
+                        colorbar=dict(
+                            title=self._colorbar_title,
+                            tickvals=list(range(num_classes)),
+                            ticktext=self._classes,
+                            lenmode="fraction",
+                            len=1,
+                        ),
+                        showscale=True,
+                    )
+                )
+                hover_lines.append("<b>%s: %%{text}</b>" % self._labels_title)
+            else:
+                points_marker.update(
+                    dict(
+                        colorscale=self._colorscale,
+                        colorbar=dict(
+                            title=self._colorbar_title,
+                            lenmode="fraction",
+                            len=1,
+                        ),
+                        showscale=True,
+                    )
+                )
+                hover_lines.append(
+                    "<b>%s: %%{marker.color}</b>" % self._labels_title
+                )
+
+        if self._marker_size is not None:
+            points_marker.update(dict(size=self._marker_size))
+
+        hover_lines.append("x, y = %{x:.3f}, %{y:.3f}")
+        hover_lines.append("ID: %{customdata}")
+
+        points_trace = go.Scattergl(
+            x=[],
+            y=[],
+            mode="markers",
+            marker=points_marker,
+            name=self._trace_title,
+            hovertemplate="<br>".join(hover_lines) + "<extra></extra>",
+        )
+
+        return [bins_trace, points_trace]
+
+    def _render(self, xrange, yrange):
+        inds = self._index.query_box(xrange, yrange)
+
+        if inds.size <= self.max_points:
+            self._render_points(inds)
+        else:
+            self._render_bins(inds, xrange, yrange)
+
+        self._render_selection()
+
+    def _render_points(self, inds):
+        points = self._index.points[inds]
+
+        self._point_inds = inds
+        self._bin_keys = None
+        self._bin_edges = None
+
+        self._bins_trace.update(x=[], y=[], text=None, visible=False)
+
+        kwargs = dict(
+            x=points[:, 0],
+            y=points[:, 1],
+            customdata=self._ids[inds],
+            visible=True,
+        )
+
+        if self._labels is not None:
+            kwargs["marker_color"] = self._labels[inds]
+            if self._classes is not None:
+                kwargs["text"] = [self._classes[l] for l in self._labels[inds]]
+
+        self._points_trace.update(**kwargs)
+
+    def _render_bins(self, inds, xrange, yrange):
+        x, y, bin_counts, bin_keys, bin_edges = _bin_points(
+            self._index.points[inds], xrange, yrange, self.num_bins
+        )
+
+        self._point_inds = None
+        self._bin_keys = bin_keys
+        self._bin_edges = bin_edges
+
+        colorscale = self._colorscale
+        maxval = bin_counts.max() if bin_counts.size > 0 else 1
+        if maxval > 1:
+            colorscale = _to_log_colorscale(colorscale, maxval)
+
+        self._points_trace.update(
+            x=[], y=[], customdata=None, text=None, visible=False
+        )
+        self._bins_trace.update(
+            x=x,
+            y=y,
+            text=bin_counts,
+            marker_color=bin_counts,
+            marker_colorscale=colorscale,
+            visible=True,
+        )
+
+    def _render_selection(self):
+        if self._selected_inds is None:
+            self._bins_trace.update(selectedpoints=None)
+            self._points_trace.update(selectedpoints=None)
+            return
+
+        if self._point_inds is not None:
+            found = np.isin(self._point_inds, self._selected_inds)
+        else:
+            keys = _get_bin_keys(
+                self._index.points[self._selected_inds], self._bin_edges
+            )
+            found = np.isin(self._bin_keys, keys)
+
+        trace_inds = list(np.nonzero(found)[0])
+        if self._point_inds is not None:
+            self._points_trace.update(selectedpoints=trace_inds)
+        else:
+            self._bins_trace.update(selectedpoints=trace_inds)
+
+    def _connect(self):
+        def _on_selection(trace, points, selector):
+            self._on_select(trace, selector=selector)
+
+        def _on_deselect(trace, points):
+            self._on_select(trace)
+
+        with self._widget.batch_update():
+            for trace in (self._bins_trace, self._points_trace):
+                trace.on_selection(_on_selection)
+                trace.on_deselect(_on_deselect)
+
+    def _disconnect(self):
+        with self._widget.batch_update():
+            for trace in (self._bins_trace, self._points_trace):
+                trace.on_selection(None)
+                trace.on_deselect(None)
+
+    def _reopen(self):
+        self._widget = self._make_widget()
+
+    def _select_ids(self, ids, view=None):
+        if ids is None:
+            self._selected_inds = None
+        else:
+            if self._ids_to_inds is None:
+                self._ids_to_inds = {
+                    _id: idx for idx, _id in enumerate(self._ids)
+                }
+
+            inds = [self._ids_to_inds.get(_id, None) for _id in ids]
+            self._selected_inds = np.array(
+                sorted(idx for idx in inds if idx is not None), dtype=int
+            )
+
+        with self._widget.batch_update():
+            self._render_selection()
+
+    def _on_relayout(self, layout, xrange, yrange):
+        if xrange is None or yrange is None:
+            return
+
+        with self._widget.batch_update():
+            self._render(xrange, yrange)
+
+    def _on_select(self, trace, selector=None):
+        # Each visible trace reports selection events, so only respond to the
+        # trace that is currently being rendered
+        if trace.visible != True:
+            return
+
+        if isinstance(selector, BoxSelector):
+            self._selected_inds = self._index.query_box(
+                selector.xrange, selector.yrange
+            )
+        elif isinstance(selector, LassoSelector):
+            self._selected_inds = self._index.query_polygon(
+                selector.xs, selector.ys
+            )
+        else:
+            self._selected_inds = None
+
+        if self._selection_callback is not None:
+            self._selection_callback(self.selected_ids)
+
+
 class InteractiveHeatmap(PlotlyInteractivePlot):
     """An interactive Plotly heatmap.
 
@@ -2463,6 +2874,33 @@ class InteractiveHeatmap(PlotlyInteractivePlot):
         return figure
 
 
+def _bin_points(points, xrange, yrange, num_bins):
+    counts, xedges, yedges = np.histogram2d(
+        points[:, 0],
+        points[:, 1],
+        bins=num_bins,
+        range=[sorted(xrange), sorted(yrange)],
+    )
+
+    bx, by = np.nonzero(counts)
+    bin_counts = counts[bx, by].astype(int)
+    x = 0.5 * (xedges[bx] + xedges[bx + 1])
+    y = 0.5 * (yedges[by] + yedges[by + 1])
+    bin_keys = bx * num_bins + by
+
+    return x, y, bin_counts, bin_keys, (xedges, yedges)
+
+
+def _get_bin_keys(points, bin_edges):
+    xedges, yedges = bin_edges
+    num_bins = len(xedges) - 1
+    counts, _, _ = np.histogram2d(
+        points[:, 0], points[:, 1], bins=[xedges, yedges]
+    )
+    bx, by = np.nonzero(counts)
+    return bx * num_bins + by
+
+
 def _plot_scatter_categorical(
     points,
     labels,
@@ -85,3 +85,130 @@ def pad_icon(img, pad, fill=0):
     img_pad = np.full((h + 2 * pad, w + 2 * pad, c), fill, dtype=img.dtype)
     img_pad[pad : (pad + h), pad : (pad + w), :] = img
     return img_pad
+
+
+class GridIndex(object):
+    """A uniform grid index over a set of 2D points that supports efficient
+    region queries.
+
+    The points are bucketed into a ``grid_size x grid_size`` grid spanning
+    their bounding box and sorted by cell, so that the points in any
+    rectangular region can be retrieved by reading one contiguous slice of the
+    index per grid row that the region overlaps.
+
+    Args:
+        points: a ``num_points x 2`` array-like of points
+        grid_size (512): the number of grid cells along each dimension
+    """
+
+    def __init__(self, points, grid_size=512):
+        points = np.asarray(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError("GridIndex only supports 2D points")
+
+        if points.size > 0:
+            mins = points.min(axis=0)
+            maxs = points.max(axis=0)
+        else:
+            mins = np.zeros(2)
+            maxs = np.ones(2)
+
+        spans = maxs - mins
+        spans[spans <= 0] = 1.0
+
+        self.points = points
+        self.grid_size = grid_size
+        self._mins = mins
+        self._maxs = maxs
+        self._spans = spans
+
+        cells = self._to_cells(points)
+        keys = cells[:, 1] * grid_size + cells[:, 0]
+        self._order = np.argsort(keys, kind="stable")
+        self._offsets = np.searchsorted(
+            keys[self._order], np.arange(grid_size * grid_size + 1)
+        )
+
+    def __len__(self):
+        return len(self.points)
+
+    @property
+    def bounds(self):
+        """The ``(xmin, xmax, ymin, ymax)`` bounding box of the points."""
+        return (self._mins[0], self._maxs[0], self._mins[1], self._maxs[1])
+
+    def query_box(self, xrange, yrange):
+        """Returns the indices of the points in the given rectangle.
+
+        Args:
+            xrange: a ``(xmin, xmax)`` tuple
+            yrange: a ``(ymin, ymax)`` tuple
+
+        Returns:
+            a sorted array of point indices
+        """
+        xmin, xmax = sorted(xrange)
+        ymin, ymax = sorted(yrange)
+
+        inds = self._get_candidates(xmin, xmax, ymin, ymax)
+        if inds.size == 0:
+            return inds
+
+        x = self.points[inds, 0]
+        y = self.points[inds, 1]
+        found = (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        return np.sort(inds[found])
+
+    def query_polygon(self, xs, ys):
+        """Returns the indices of the points in the given polygon.
+
+        Args:
+            xs: the x coordinates of the polygon's vertices
+            ys: the y coordinates of the polygon's vertices
+
+        Returns:
+            a sorted array of point indices
+        """
+        from matplotlib.path import Path
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if xs.size < 3:
+            return np.array([], dtype=int)
+
+        inds = self.query_box((xs.min(), xs.max()), (ys.min(), ys.max()))
+        if inds.size == 0:
+            return inds
+
+        path = Path(np.stack([xs, ys], axis=1))
+        found = path.contains_points(self.points[inds])
+        return inds[found]
+
+    def _to_cells(self, points):
+        n = self.grid_size
+        cells = np.floor((points - self._mins) / self._spans * n)
+        return np.clip(cells, 0, n - 1).astype(int)
+
+    def _get_candidates(self, xmin, xmax, ymin, ymax):
+        if (
+            xmax < self._mins[0]
+            or xmin > self._maxs[0]
+            or ymax < self._mins[1]
+            or ymin > self._maxs[1]
+        ):
+            return np.array([], dtype=int)
+
+        n = self.grid_size
+        (cx0, cy0), (cx1, cy1) = self._to_cells(
+            np.array([[xmin, ymin], [xmax, ymax]], dtype=float)
+        )
+
+        rows = np.arange(cy0, cy1 + 1) * n
+        starts = self._offsets[rows + cx0]
+        ends = self._offsets[rows + cx1 + 1]
+
+        slices = [self._order[s:e] for s, e in zip(starts, ends) if e > s]
+        if not slices:
+            return np.array([], dtype=int)
+
+        return np.concatenate(slices)
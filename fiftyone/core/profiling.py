@@ -0,0 +1,494 @@
+"""
+Instrumentation of long-running FiftyOne operations.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import bisect
+import contextlib
+import contextvars
+import json
+import math
+import re
+import threading
+import timeit
+
+
+_SINK = contextvars.ContextVar("fiftyone_metrics_sink", default=None)
+_STAGE = contextvars.ContextVar("fiftyone_metrics_stage", default=None)
+
+_DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    60.0,
+    300.0,
+)
+
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+
+class MetricsSink(object):
+    """Class that collects counters, gauges, timers, and histograms recorded
+    by FiftyOne operations.
+
+    Sinks are typically created via :func:`collect`, which activates the sink
+    for the current context, so that any instrumented operations that run in
+    the context are recorded in it.
+
+    Example usage::
+
+        import fiftyone as fo
+        import fiftyone.core.profiling as fopf
+        import fiftyone.zoo as foz
+
+        with fopf.collect() as sink:
+            dataset = foz.load_zoo_dataset("quickstart")
+            dataset.compute_metadata()
+
+        sink.print_summary()
+        print(sink.to_json(pretty_print=True))
+        print(sink.to_prometheus())
+
+    Args:
+        parent (None): an optional parent :class:`MetricsSink` to which all
+            metrics recorded by this sink are also forwarded
+    """
+
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._timers = {}
+        self._histograms = {}
+
+    def increment(self, name, value=1):
+        """Increments the given counter.
+
+        Args:
+            name: the metric name
+            value (1): the increment
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+        if self._parent is not None:
+            self._parent.increment(name, value=value)
+
+    def set_gauge(self, name, value):
+        """Sets the current value of the given gauge.
+
+        Gauges also track the maximum value that they have taken.
+
+        Args:
+            name: the metric name
+            value: the current value
+        """
+        with self._lock:
+            gauge = self._gauges.get(name, None)
+            if gauge is None:
+                self._gauges[name] = {"value": value, "max": value}
+            else:
+                gauge["value"] = value
+                gauge["max"] = max(gauge["max"], value)
+
+        if self._parent is not None:
+            self._parent.set_gauge(name, value)
+
+    def observe(self, name, value, buckets=None):
+        """Records an observation in the given histogram.
+
+        Args:
+            name: the metric name
+            value: the observed value
+            buckets (None): the upper bounds of the histogram buckets to use if
+                the histogram does not yet exist. By default, buckets suitable
+                for durations in seconds are used
+        """
+        with self._lock:
+            hist = self._histograms.get(name, None)
+            if hist is None:
+                hist = _Histogram(buckets or _DEFAULT_BUCKETS)
+                self._histograms[name] = hist
+
+            hist.observe(value)
+
+        if self._parent is not None:
+            self._parent.observe(name, value, buckets=buckets)
+
+    def record_time(self, name, seconds):
+        """Records a duration for the given timer.
+
+        Args:
+            name: the metric name
+            seconds: the duration, in seconds
+        """
+        with self._lock:
+            timer = self._timers.get(name, None)
+            if timer is None:
+                timer = _Histogram(_DEFAULT_BUCKETS)
+                self._timers[name] = timer
+
+            timer.observe(seconds)
+
+        if self._parent is not None:
+            self._parent.record_time(name, seconds)
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        """Returns a context manager that records the duration of its block in
+        the given timer.
+
+        Args:
+            name: the metric name
+        """
+        start = timeit.default_timer()
+        try:
+            yield
+        finally:
+            self.record_time(name, timeit.default_timer() - start)
+
+    def clear(self):
+        """Deletes all metrics recorded by this sink."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timers.clear()
+            self._histograms.clear()
+
+    def to_dict(self):
+        """Returns a JSON dict representation of the metrics in this sink.
+
+        Returns:
+            a JSON dict
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": {k: dict(v) for k, v in self._gauges.items()},
+                "timers": {k: v.to_dict() for k, v in self._timers.items()},
+                "histograms": {
+                    k: v.to_dict() for k, v in self._histograms.items()
+                },
+            }
+
+    def to_json(self, pretty_print=False):
+        """Returns a JSON string representation of the metrics in this sink.
+
+        Args:
+            pretty_print (False): whether to render the JSON in human readable
+                format with newlines and indentations
+
+        Returns:
+            a JSON string
+        """
+        if pretty_print:
+            return json.dumps(self.to_dict(), indent=4)
+
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self, prefix="fiftyone"):
+        """Returns a representation of the metrics in this sink in the
+        `Prometheus text exposition format <https://prometheus.io/docs/instrumenting/exposition_formats>`_.
+
+        Args:
+            prefix ("fiftyone"): a prefix to prepend to all metric names
+
+        Returns:
+            a string
+        """
+        d = self.to_dict()
+        lines = []
+
+        for name, value in sorted(d["counters"].items()):
+            metric = _prometheus_name(prefix, name) + "_total"
+            lines.append("# TYPE %s counter" % metric)
+            lines.append("%s %s" % (metric, _prometheus_value(value)))
+
+        for name, gauge in sorted(d["gauges"].items()):
+            metric = _prometheus_name(prefix, name)
+            lines.append("# TYPE %s gauge" % metric)
+            lines.append("%s %s" % (metric, _prometheus_value(gauge["value"])))
+            lines.append("# TYPE %s_max gauge" % metric)
+            lines.append(
+                "%s_max %s" % (metric, _prometheus_value(gauge["max"]))
+            )
+
+        for suffix, hists in (
+            ("_seconds", d["timers"]),
+            ("", d["histograms"]),
+        ):
+            for name, hist in sorted(hists.items()):
+                metric = _prometheus_name(prefix, name) + suffix
+                lines.append("# TYPE %s histogram" % metric)
+                count = 0
+                for bound, bucket_count in zip(
+                    hist["buckets"], hist["bucket_counts"]
+                ):
+                    count += bucket_count
+                    lines.append(
+                        '%s_bucket{le="%s"} %d'
+                        % (metric, _prometheus_value(bound), count)
+                    )
+
+                lines.append(
+                    '%s_bucket{le="+Inf"} %d' % (metric, hist["count"])
+                )
+                lines.append(
+                    "%s_sum %s" % (metric, _prometheus_value(hist["sum"]))
+                )
+                lines.append("%s_count %d" % (metric, hist["count"]))
+
+        return "\n".join(lines) + "\n"
+
+    def get_stage_summary(self):
+        """Returns a summary of the time spent in each stage recorded by this
+        sink.
+
+        Returns:
+            a list of dicts with ``stage``, ``count``, ``total``, ``mean``,
+            ``max``, ``items``, and ``items_per_sec`` keys, sorted by total
+            time in descending order
+        """
+        d = self.to_dict()
+        counters = d["counters"]
+
+        rows = []
+        for stage, timer in d["timers"].items():
+            items = counters.get(stage + ".items", None)
+            if items is not None and timer["sum"] > 0:
+                items_per_sec = items / timer["sum"]
+            else:
+                items_per_sec = None
+
+            rows.append(
+                {
+                    "stage": stage,
+                    "count": timer["count"],
+                    "total": timer["sum"],
+                    "mean": timer["sum"] / max(timer["count"], 1),
+                    "max": timer["max"],
+                    "items": items,
+                    "items_per_sec": items_per_sec,
+                }
+            )
+
+        return sorted(rows, key=lambda r: r["total"], reverse=True)
+
+    def print_summary(self):
+        """Prints a table summarizing the time spent in each stage recorded by
+        this sink.
+        """
+        from tabulate import tabulate
+
+        rows = [
+            (
+                r["stage"],
+                r["count"],
+                "%.3f" % r["total"],
+                "%.3f" % r["mean"],
+                "%.3f" % r["max"],
+                r["items"] if r["items"] is not None else "",
+                "%.1f" % r["items_per_sec"]
+                if r["items_per_sec"] is not None
+                else "",
+            )
+            for r in self.get_stage_summary()
+        ]
+
+        headers = [
+            "stage",
+            "count",
+            "total (s)",
+            "mean (s)",
+            "max (s)",
+            "items",
+            "items/s",
+        ]
+        print(tabulate(rows, headers=headers, tablefmt="plain"))
+
+
+class _Histogram(object):
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        idx = bisect.bisect_left(self.buckets, value)
+        if idx < len(self.buckets):
+            self.bucket_counts[idx] += 1
+
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": list(self.buckets),
+            "bucket_counts": list(self.bucket_counts),
+        }
+
+
+def get_sink():
+    """Returns the :class:`MetricsSink` that is active in the current context,
+    if any.
+
+    Returns:
+        a :class:`MetricsSink`, or None
+    """
+    return _SINK.get()
+
+
+@contextlib.contextmanager
+def collect(sink=None):
+    """Context manager that activates a :class:`MetricsSink` for the current
+    context.
+
+    Any sink that was already active remains active, i.e., it also receives
+    the metrics recorded within this context.
+
+    Args:
+        sink (None): a :class:`MetricsSink` to use. By default, a new sink is
+            created
+
+    Returns:
+        the :class:`MetricsSink`
+    """
+    if sink is None:
+        sink = MetricsSink(parent=_SINK.get())
+
+    token = _SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _SINK.reset(token)
+
+
+@contextlib.contextmanager
+def stage(name):
+    """Context manager that records the duration of its block as a stage in
+    the active :class:`MetricsSink`, if any.
+
+    Stages may be nested, in which case their names are joined by ``"."``.
+    Progress bars and dynamic batchers that run within the stage also record
+    their item counts and batch sizes under the stage's name.
+
+    Args:
+        name: the stage name
+    """
+    sink = _SINK.get()
+    if sink is None:
+        yield
+        return
+
+    parent = _STAGE.get()
+    if parent is not None:
+        name = parent + "." + name
+
+    token = _STAGE.set(name)
+    try:
+        with sink.timer(name):
+            yield
+    finally:
+        _STAGE.reset(token)
+
+
+def get_stage():
+    """Returns the name of the stage that is active in the current context, if
+    any.
+
+    Returns:
+        the stage name, or None
+    """
+    return _STAGE.get()
+
+
+def increment(name, value=1):
+    """Increments the given counter of the current stage in the active
+    :class:`MetricsSink`, if any.
+
+    Args:
+        name: the metric name, which is prefixed by the current stage name
+        value (1): the increment
+    """
+    sink = _SINK.get()
+    if sink is not None:
+        sink.increment(_stage_metric(name), value=value)
+
+
+def set_gauge(name, value):
+    """Sets the given gauge of the current stage in the active
+    :class:`MetricsSink`, if any.
+
+    Args:
+        name: the metric name, which is prefixed by the current stage name
+        value: the current value
+    """
+    sink = _SINK.get()
+    if sink is not None:
+        sink.set_gauge(_stage_metric(name), value)
+
+
+def observe(name, value, buckets=None):
+    """Records an observation in the given histogram of the current stage in
+    the active :class:`MetricsSink`, if any.
+
+    Args:
+        name: the metric name, which is prefixed by the current stage name
+        value: the observed value
+        buckets (None): the upper bounds of the histogram buckets to use if
+            the histogram does not yet exist
+    """
+    sink = _SINK.get()
+    if sink is not None:
+        sink.observe(_stage_metric(name), value, buckets=buckets)
+
+
+def record_batch_size(batch_size):
+    """Records the size of a batch processed by the current stage in the
+    ``batch_size`` histogram of the active :class:`MetricsSink`, if any.
+
+    Args:
+        batch_size: the number of items in the batch
+    """
+    observe("batch_size", batch_size, buckets=_BATCH_SIZE_BUCKETS)
+
+
+def _stage_metric(name):
+    stage_name = _STAGE.get()
+    if stage_name is None:
+        return name
+
+    return stage_name + "." + name
+
+
+def _prometheus_name(prefix, name):
+    name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+    if prefix:
+        name = prefix + "_" + name
+
+    return name
+
+
+def _prometheus_value(value):
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(value) if isinstance(value, float) else str(value)
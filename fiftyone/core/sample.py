@@ -640,6 +640,246 @@ class SampleView(_SampleMixin, DocumentView):
         super().save()
 
 
+class ReadOnlySample(object):
+    """A lightweight, read-only view into a sample in a collection.
+
+    Instances of this class are generated by
+    :meth:`fiftyone.core.collections.SampleCollection.iter_samples` when
+    ``read_only=True`` is passed. They differ from :class:`Sample` and
+    :class:`SampleView` instances in the following ways:
+
+    -   Field values are only decoded from the underlying database document
+        when they are first accessed
+    -   Read-only samples are not registered with their dataset, so they are
+        not updated when their source samples are modified or reloaded
+    -   Read-only samples cannot be modified or saved
+    -   The frames of video samples are not available
+
+    .. note::
+
+        Read-only samples should never be created manually.
+
+    Args:
+        d: a sample dict from the database
+        collection: the :class:`fiftyone.core.collections.SampleCollection`
+            from which the sample was taken
+        doc_cls: the :class:`fiftyone.core.odm.mixins.DatasetSampleDocument`
+            class of the collection's dataset
+        selected_fields (None): a set of field names that are selected on the
+            collection, if any
+        excluded_fields (None): a set of field names that are excluded from
+            the collection, if any
+    """
+
+    __slots__ = (
+        "_d",
+        "_collection",
+        "_doc_cls",
+        "_values",
+        "_selected_fields",
+        "_excluded_fields",
+    )
+
+    def __init__(
+        self,
+        d,
+        collection,
+        doc_cls,
+        selected_fields=None,
+        excluded_fields=None,
+    ):
+        if selected_fields is not None and excluded_fields is not None:
+            selected_fields = selected_fields.difference(excluded_fields)
+            excluded_fields = None
+
+        self._d = d
+        self._collection = collection
+        self._doc_cls = doc_cls
+        self._values = {}
+        self._selected_fields = selected_fields
+        self._excluded_fields = excluded_fields
+
+    def __repr__(self):
+        return "<%s: id=%s, filepath=%s>" % (
+            self.__class__.__name__,
+            self.id,
+            self.filepath,
+        )
+
+    def __dir__(self):
+        return super().__dir__() + list(self.field_names)
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return False
+
+        return self._d == other._d
+
+    def __hash__(self):
+        return hash(self._d["_id"])
+
+    def __getattr__(self, name):
+        # Slots that have not been assigned yet (e.g., while copying or
+        # unpickling) must not be resolved as sample fields
+        if name.startswith("__") or name in self.__slots__:
+            raise AttributeError(name)
+
+        return self.get_field(name)
+
+    def __setattr__(self, name, value):
+        if name in self.__slots__:
+            super().__setattr__(name, value)
+            return
+
+        raise ValueError("Read-only samples cannot be modified")
+
+    def __getitem__(self, field_name):
+        try:
+            return self.get_field(field_name)
+        except AttributeError as e:
+            raise KeyError(e.args[0])
+
+    def __setitem__(self, field_name, value):
+        raise ValueError("Read-only samples cannot be modified")
+
+    @property
+    def id(self):
+        """The ID of the sample."""
+        return str(self._d["_id"])
+
+    @property
+    def _id(self):
+        """The ObjectId of the sample."""
+        return self._d["_id"]
+
+    @property
+    def filename(self):
+        """The basename of the media's filepath."""
+        return os.path.basename(self.filepath)
+
+    @property
+    def media_type(self):
+        """The media type of the sample."""
+        return self._d["_media_type"]
+
+    @property
+    def dataset(self):
+        """The dataset to which the sample belongs."""
+        return self._collection._dataset
+
+    @property
+    def field_names(self):
+        """An ordered tuple of the names of the fields of this sample."""
+        # pylint: disable=protected-access
+        return tuple(
+            f
+            for f in self._doc_cls._fields_ordered
+            if self._get_field(f) is not None
+        )
+
+    def has_field(self, field_name):
+        """Determines whether the sample has a field of the given name.
+
+        Args:
+            field_name: the field name
+
+        Returns:
+            True/False
+        """
+        return self._get_field(field_name) is not None
+
+    def get_field(self, field_name):
+        """Gets the value of a field of the sample.
+
+        Args:
+            field_name: the field name
+
+        Returns:
+            the field value
+
+        Raises:
+            AttributeError: if the field does not exist
+        """
+        try:
+            return self._values[field_name]
+        except KeyError:
+            pass
+
+        if field_name == "frames" and self.media_type == fomm.VIDEO:
+            raise AttributeError(
+                "The frames of video samples are not available when "
+                "iterating in read-only mode"
+            )
+
+        if field_name == "id":
+            return self.id
+
+        field = self._get_field(field_name)
+        if field is None:
+            raise AttributeError(
+                "%s has no field '%s'" % (self.__class__.__name__, field_name)
+            )
+
+        # Fields that are in the schema but were never populated are None,
+        # just like on regular samples
+        value = self._d.get(field.db_field, None)
+        if value is not None:
+            value = field.to_python(value)
+
+        self._values[field_name] = value
+        return value
+
+    def iter_fields(self, include_id=False):
+        """Returns an iterator over the ``(name, value)`` pairs of the public
+        fields of the sample.
+
+        Args:
+            include_id (False): whether to include the ``id`` field
+
+        Returns:
+            an iterator that emits ``(name, value)`` tuples
+        """
+        for field_name in self.field_names:
+            if field_name == "id" and not include_id:
+                continue
+
+            yield field_name, self.get_field(field_name)
+
+    def to_mongo_dict(self, include_id=False):
+        """Returns the sample as a BSON dictionary, exactly as it was loaded
+        from the database.
+
+        Args:
+            include_id (False): whether to include the sample ID
+
+        Returns:
+            a BSON dict
+        """
+        d = dict(self._d)
+        if not include_id:
+            d.pop("_id", None)
+
+        return d
+
+    def _get_field(self, field_name):
+        if field_name.startswith("_"):
+            return None
+
+        # Frames are detached from read-only samples
+        if field_name == "frames":
+            return None
+
+        ef = self._excluded_fields
+        if ef is not None and field_name in ef:
+            return None
+
+        sf = self._selected_fields
+        if sf is not None and field_name not in sf:
+            return None
+
+        return self._doc_cls._fields.get(field_name, None)
+
+
 def _apply_confidence_thresh(label, confidence_thresh):
     if _is_frames_dict(label):
         label = {
@@ -9,7 +9,7 @@ from collections import defaultdict
 from dataclasses import asdict, dataclass
 import logging
 from retrying import retry
-from threading import Thread
+from threading import Lock, Thread
 import time
 import typing as t
 
@@ -25,6 +25,8 @@ from fiftyone.core.session.events import (
     Event,
     EventType,
     ListenPayload,
+    StatePatch,
+    StateUpdate,
     dict_factory,
 )
 
@@ -51,6 +53,12 @@ class Client:
         self._connected = True
         self._listeners: t.Dict[str, t.Set[t.Callable]] = defaultdict(set)
 
+        # The last state known to be shared with the server, from which state
+        # patches are generated
+        self._synced_lock = Lock()
+        self._synced_state: t.Optional[dict] = None
+        self._synced_version: t.Optional[int] = None
+
     def run(self, state: fos.StateDescription) -> None:
         """Runs the client subscription in a background thread
 
@@ -86,12 +94,18 @@ class Client:
                 source = sseclient.SSEClient(response)
                 for message in source.events():
                     event = Event.from_data(message.event, message.data)
+                    if isinstance(event, StateUpdate):
+                        self._set_synced_state(
+                            stringify(event.state.serialize()), event.version
+                        )
+
                     self._dispatch_event(event)
 
             while True:
                 try:
                     _ping(f"{self.origin}/fiftyone")
                     self._connected = True
+                    self._set_synced_state(None, None, force=True)
                     subscribe()
                 except Exception as e:
                     if foc.DEV_INSTALL:
@@ -154,17 +168,78 @@ class Client:
             listener(event)
 
     def _post_event(self, event: Event) -> None:
+        if isinstance(event, StateUpdate):
+            self._post_state_update(event)
+            return
+
+        self._post(
+            event.get_event_name(), asdict(event, dict_factory=dict_factory)
+        )
+
+    def _post_state_update(self, event: StateUpdate) -> None:
+        state = stringify(event.state.serialize())
+
+        with self._synced_lock:
+            synced_state = self._synced_state
+            synced_version = self._synced_version
+
+        # Send only the changes to the last shared state when possible. The
+        # server rejects patches that are not based on its current state, in
+        # which case we resend the full state
+        if synced_state is not None:
+            patch = fos.make_state_patch(synced_state, state)
+            response = self._post(
+                StatePatch.get_event_name(),
+                asdict(StatePatch(patch=patch, version=synced_version)),
+                raise_error=False,
+            )
+            version = response.get("version", None) if response else None
+            if version is not None:
+                self._set_synced_state(state, version)
+                return
+
+        response = self._post(event.get_event_name(), {"state": state})
+        self._set_synced_state(
+            state, response.get("version", None), force=True
+        )
+
+    def _set_synced_state(
+        self,
+        state: t.Optional[dict],
+        version: t.Optional[int],
+        force: bool = False,
+    ) -> None:
+        if version is None and not force:
+            return
+
+        with self._synced_lock:
+            if (
+                force
+                or self._synced_version is None
+                or version > self._synced_version
+            ):
+                self._synced_state = state if version is not None else None
+                self._synced_version = version
+
+    def _post(
+        self, event_name: str, data: dict, raise_error: bool = True
+    ) -> t.Optional[dict]:
         response = requests.post(
             f"{self.origin}/event",
             headers={"Content-type": "application/json"},
             json={
-                "event": event.get_event_name(),
-                "data": stringify(asdict(event, dict_factory=dict_factory)),
+                "event": event_name,
+                "data": stringify(data),
                 "subscription": self._subscription,
             },
         )
 
         if response.status_code != 200:
+            if not raise_error:
+                return None
+
             raise RuntimeError(
-                f"Failed to post event `{event.get_event_name()}` to {self.origin}/event"
+                f"Failed to post event `{event_name}` to {self.origin}/event"
             )
+
+        return response.json()
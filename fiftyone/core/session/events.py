@@ -23,6 +23,7 @@ EventType = t.Union[
     "DeactivateNotebookCell",
     "ReactivateNotebookCell",
     "RefreshApp",
+    "StatePatch",
     "StateUpdate",
 ]
 
@@ -87,11 +88,24 @@ class RefreshApp(Event):
     """Refresh app event"""
 
 
+@dataclass
+class StatePatch(Event):
+    """State patch event
+
+    Patches are generated by :func:`fiftyone.core.state.make_state_patch`
+    relative to the server state with the given version.
+    """
+
+    patch: dict
+    version: int
+
+
 @dataclass
 class StateUpdate(Event):
     """State update event"""
 
     state: fos.StateDescription
+    version: t.Optional[int] = None
 
 
 @dataclass
@@ -0,0 +1,870 @@
+"""
+Nearest neighbor indexes over embedding fields.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from datetime import datetime
+import logging
+import os
+import threading
+
+from bson import ObjectId
+import numpy as np
+
+import eta.core.serial as etas
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.core.fields as fof
+import fiftyone.core.utils as fou
+
+
+logger = logging.getLogger(__name__)
+
+_INDEXES = {}
+_INDEXES_LOCK = threading.Lock()
+
+_SUPPORTED_METRICS = ("cosine", "euclidean")
+
+# The dtype used to store sample IDs in indexes
+_ID_DTYPE = np.dtype("S24")
+
+# Number of vectors that are loaded from the database or scanned at a time
+_BATCH_SIZE = 16384
+
+
+class SimilarityIndex(object):
+    """An approximate nearest neighbor index over the vectors in a
+    :class:`fiftyone.core.fields.VectorField` of a dataset.
+
+    The index is an inverted file (IVF) index: the vectors are partitioned
+    into ``num_lists`` lists by k-means clustering, and queries only compute
+    exact distances to the vectors in the ``num_probes`` lists whose centroids
+    are nearest to the query.
+
+    Indexes are stored on disk in ``index_dir`` and their vectors are
+    memory-mapped, so opening an index is cheap and only the lists that are
+    probed by a query are read. New vectors can be appended to an existing
+    index via :meth:`add` without retraining it, and :meth:`sync` updates the
+    index to reflect the current contents of its dataset.
+
+    Indexes are typically created and retrieved via
+    :func:`compute_similarity_index` and :func:`get_similarity_index`.
+
+    Args:
+        index_dir: the directory in which the index is stored
+    """
+
+    def __init__(self, index_dir):
+        self.index_dir = index_dir
+
+        self._meta = None
+        self._centroids = None
+        self._vectors = None
+        self._ids = None
+        self._lists = None
+        self._order = None
+        self._offsets = None
+        self._lock = threading.RLock()
+
+        if os.path.isfile(self._meta_path):
+            self._load()
+
+    @property
+    def exists(self):
+        """Whether the index has been built."""
+        return self._meta is not None
+
+    @property
+    def metric(self):
+        """The distance metric of the index."""
+        return self._meta["metric"] if self.exists else None
+
+    @property
+    def dim(self):
+        """The dimension of the vectors in the index."""
+        return self._meta["dim"] if self.exists else None
+
+    @property
+    def num_lists(self):
+        """The number of lists in the index."""
+        return self._meta["num_lists"] if self.exists else 0
+
+    @property
+    def num_probes(self):
+        """The default number of lists that are probed by queries."""
+        return self._meta["num_probes"] if self.exists else 0
+
+    @num_probes.setter
+    def num_probes(self, value):
+        with self._lock:
+            self._meta["num_probes"] = max(1, min(value, self.num_lists))
+            self._write_meta()
+
+    @property
+    def last_synced_at(self):
+        """The UTC datetime that the index was last synced with its dataset,
+        or None.
+        """
+        if not self.exists or self._meta.get("last_synced_at", None) is None:
+            return None
+
+        return datetime.strptime(
+            self._meta["last_synced_at"], "%Y-%m-%dT%H:%M:%S.%f"
+        )
+
+    def __len__(self):
+        if not self.exists:
+            return 0
+
+        return int(np.count_nonzero(self._lists >= 0))
+
+    def build(
+        self, ids, vectors, metric="cosine", num_lists=None, num_probes=None
+    ):
+        """Builds the index from scratch.
+
+        Any existing index in :attr:`index_dir` is overwritten.
+
+        Args:
+            ids: an array-like of sample IDs
+            vectors: a ``num_vectors x dim`` array of vectors
+            metric ("cosine"): the distance metric to use. Supported values
+                are ``("cosine", "euclidean")``
+            num_lists (None): the number of lists to partition the vectors
+                into. By default, ``sqrt(num_vectors)`` is used
+            num_probes (None): the default number of lists to probe per query.
+                By default, ``num_lists / 16`` lists are probed, with a minimum
+                of 8
+        """
+        if metric not in _SUPPORTED_METRICS:
+            raise ValueError(
+                "Unsupported metric '%s'; supported values are %s"
+                % (metric, _SUPPORTED_METRICS)
+            )
+
+        ids = _to_ids_array(ids)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(ids):
+            raise ValueError("Expected a %d x dim array of vectors" % len(ids))
+
+        if metric == "cosine":
+            vectors = _normalize(vectors)
+
+        num_vectors = len(vectors)
+        if num_lists is None:
+            num_lists = int(np.sqrt(num_vectors))
+
+        num_lists = max(1, min(num_lists, num_vectors))
+
+        if num_probes is None:
+            num_probes = max(8, num_lists // 16)
+
+        num_probes = min(num_probes, num_lists)
+
+        if num_vectors > 0:
+            centroids = _kmeans(vectors, num_lists)
+        else:
+            centroids = np.zeros((1, 0), dtype=np.float32)
+
+        with self._lock:
+            etau.ensure_empty_dir(self.index_dir, cleanup=True)
+
+            np.save(self._centroids_path, centroids)
+            self._meta = {
+                "metric": metric,
+                "dim": vectors.shape[1],
+                "num_lists": len(centroids),
+                "num_probes": num_probes,
+                "count": 0,
+                "last_synced_at": None,
+            }
+            self._write_meta()
+            self._load()
+
+            self._append(ids, vectors)
+
+    def add(self, ids, vectors):
+        """Adds the given vectors to the index.
+
+        The vectors are assigned to the existing lists of the index. Any
+        vectors already in the index with the given IDs are replaced.
+
+        Args:
+            ids: an array-like of sample IDs
+            vectors: a ``num_vectors x dim`` array of vectors
+        """
+        self._ensure_exists()
+
+        ids = _to_ids_array(ids)
+        if ids.size == 0:
+            return
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+            raise ValueError(
+                "Expected vectors of dimension %d, but found %s"
+                % (self.dim, vectors.shape[1:])
+            )
+
+        if self.metric == "cosine":
+            vectors = _normalize(vectors)
+
+        with self._lock:
+            self._remove(ids)
+            self._append(ids, vectors)
+
+    def remove(self, ids):
+        """Removes the vectors with the given IDs from the index, if
+        necessary.
+
+        Args:
+            ids: an array-like of sample IDs
+        """
+        self._ensure_exists()
+
+        with self._lock:
+            self._remove(_to_ids_array(ids))
+
+    def get_vectors(self, ids):
+        """Returns the vectors in the index with the given IDs.
+
+        Args:
+            ids: an array-like of sample IDs
+
+        Returns:
+            a ``num_ids x dim`` array of vectors, or None if any IDs are not in
+            the index
+        """
+        self._ensure_exists()
+
+        ids = _to_ids_array(ids)
+        rows = np.nonzero(np.isin(self._ids, ids) & (self._lists >= 0))[0]
+        if len(rows) != len(np.unique(ids)):
+            return None
+
+        inds = {_id: row for _id, row in zip(self._ids[rows], rows)}
+        return np.asarray(self._vectors[[inds[_id] for _id in ids]])
+
+    def search(self, query_vectors, k=None, reverse=False, num_probes=None):
+        """Finds the vectors in the index that are closest to the given query
+        vector(s).
+
+        When multiple query vectors are provided, the distance of each vector
+        in the index is its mean distance to the queries.
+
+        Args:
+            query_vectors: a ``dim`` vector or ``num_queries x dim`` array of
+                query vectors
+            k (None): the number of results to return. By default, the entire
+                index is exhaustively ranked
+            reverse (False): whether to return the most distant vectors
+                instead
+            num_probes (None): the number of lists to probe. By default,
+                :attr:`num_probes` is used. Only applicable when ``k`` is
+                provided
+
+        Returns:
+            a tuple of
+
+            -   ids: an array of sample IDs, sorted by distance
+            -   dists: an array of the corresponding distances
+        """
+        self._ensure_exists()
+
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis, :]
+
+        if self.metric == "cosine":
+            queries = _normalize(queries)
+
+        with self._lock:
+            if k is None:
+                rows = np.nonzero(self._lists >= 0)[0]
+            else:
+                if num_probes is None:
+                    num_probes = self.num_probes
+
+                rows = self._get_candidates(queries, num_probes, reverse)
+
+            dists = self._compute_dists(rows, queries)
+            ids = self._ids[rows]
+
+        if k is not None and k < len(dists):
+            if reverse:
+                inds = np.argpartition(-dists, k - 1)[:k]
+            else:
+                inds = np.argpartition(dists, k - 1)[:k]
+
+            ids = ids[inds]
+            dists = dists[inds]
+
+        inds = np.argsort(dists, kind="stable")
+        if reverse:
+            inds = inds[::-1]
+
+        return ids[inds].astype(str), dists[inds]
+
+    def sync(self, sample_collection, embeddings_field):
+        """Syncs the index with the vectors in the given field of the
+        collection's dataset.
+
+        If the dataset tracks changes (see
+        :meth:`fiftyone.core.dataset.Dataset.enable_change_tracking`), only
+        samples that were added or modified since the last sync are read.
+        Otherwise, the IDs of all samples with vectors are read, and the
+        vectors of samples that are not yet in the index are added, while
+        samples that no longer exist are removed. In the latter case, vectors
+        that were modified in-place are not detected.
+
+        Args:
+            sample_collection: a
+                :class:`fiftyone.core.collections.SampleCollection`
+            embeddings_field: the name of the
+                :class:`fiftyone.core.fields.VectorField` containing the
+                vectors
+        """
+        self._ensure_exists()
+
+        dataset = sample_collection._dataset
+        coll = dataset._sample_collection
+        field = _parse_field(dataset, embeddings_field)
+
+        synced_at = datetime.utcnow()
+        last_synced_at = self.last_synced_at
+        has_field = {field: {"$ne": None}}
+
+        if dataset.tracks_changes and last_synced_at is not None:
+            query = {"last_modified_at": {"$gte": last_synced_at}}
+            changed = coll.find(query, {"_id": True, field: True})
+
+            add_ids = []
+            remove_ids = []
+            vectors = []
+            for d in changed:
+                if d.get(field, None) is None:
+                    remove_ids.append(str(d["_id"]))
+                else:
+                    add_ids.append(str(d["_id"]))
+                    vectors.append(fou.deserialize_numpy_array(d[field]))
+
+            with self._lock:
+                if remove_ids:
+                    self.remove(remove_ids)
+
+                if add_ids:
+                    self.add(add_ids, np.stack(vectors))
+
+                # Deleted samples leave no trace, so we only need to diff IDs
+                # when the counts disagree
+                if len(self) != coll.count_documents(has_field):
+                    self._remove_missing(coll, has_field)
+        else:
+            with self._lock:
+                curr_ids = self._remove_missing(coll, has_field)
+                in_index = self._ids[self._lists >= 0]
+
+                new_ids = curr_ids[~np.isin(curr_ids, in_index)]
+                for batch_ids in fou.iter_batches(new_ids, _BATCH_SIZE):
+                    ids, vectors = _load_vectors(
+                        coll,
+                        field,
+                        [ObjectId(_id.decode()) for _id in batch_ids],
+                    )
+                    self.add(ids, vectors)
+
+        with self._lock:
+            self._meta["last_synced_at"] = synced_at.isoformat(
+                timespec="microseconds"
+            )
+            self._write_meta()
+
+    def _is_stale(self, coll, query):
+        # Samples that were added or deleted change the count, unless both
+        # happened, in which case the newest sample is not in the index
+        in_index = self._ids[self._lists >= 0]
+        if len(in_index) != coll.count_documents(query):
+            return True
+
+        newest = list(coll.find(query, {"_id": True}).sort("_id", -1).limit(1))
+        if not newest:
+            return False
+
+        return not np.any(in_index == str(newest[0]["_id"]).encode())
+
+    def _remove_missing(self, coll, query):
+        curr_ids = _to_ids_array(
+            str(d["_id"]) for d in coll.find(query, {"_id": True})
+        )
+
+        in_index = self._ids[self._lists >= 0]
+        self._remove(in_index[~np.isin(in_index, curr_ids)])
+
+        return curr_ids
+
+    def _ensure_exists(self):
+        if not self.exists:
+            raise ValueError("Index '%s' has not been built" % self.index_dir)
+
+    def _get_candidates(self, queries, num_probes, reverse):
+        num_probes = max(1, min(num_probes, self.num_lists))
+
+        dists = _pairwise_dists(queries, self._centroids, "euclidean")
+        if reverse:
+            dists = -dists
+
+        probes = np.unique(np.argsort(dists, axis=1)[:, :num_probes])
+
+        starts = self._offsets[probes]
+        ends = self._offsets[probes + 1]
+        rows = [self._order[s:e] for s, e in zip(starts, ends) if e > s]
+        if not rows:
+            return np.array([], dtype=int)
+
+        return np.sort(np.concatenate(rows))
+
+    def _compute_dists(self, rows, queries):
+        dists = np.empty(len(rows), dtype=np.float32)
+        for start in range(0, len(rows), _BATCH_SIZE):
+            batch = rows[start : start + _BATCH_SIZE]
+            vectors = np.asarray(self._vectors[batch])
+            batch_dists = _pairwise_dists(vectors, queries, self.metric)
+            dists[start : start + len(batch)] = batch_dists.mean(axis=1)
+
+        return dists
+
+    def _append(self, ids, vectors):
+        if ids.size == 0:
+            return
+
+        lists = _nearest(vectors, self._centroids).astype(np.int32)
+
+        with open(self._vectors_path, "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+
+        with open(self._ids_path, "ab") as f:
+            f.write(ids.tobytes())
+
+        with open(self._lists_path, "ab") as f:
+            f.write(lists.tobytes())
+
+        self._meta["count"] += len(ids)
+        self._write_meta()
+        self._load()
+
+    def _remove(self, ids):
+        if ids.size == 0 or self._meta["count"] == 0:
+            return
+
+        rows = np.nonzero(np.isin(self._ids, ids) & (self._lists >= 0))[0]
+        if rows.size == 0:
+            return
+
+        lists = np.memmap(
+            self._lists_path,
+            dtype=np.int32,
+            mode="r+",
+            shape=(self._meta["count"],),
+        )
+        lists[rows] = -1
+        lists.flush()
+        del lists
+
+        self._load()
+
+    def _load(self):
+        self._meta = etas.read_json(self._meta_path)
+        self._centroids = np.load(self._centroids_path)
+
+        count = self._meta["count"]
+        dim = self._meta["dim"]
+
+        if count > 0:
+            self._vectors = np.memmap(
+                self._vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(count, dim),
+            )
+            self._ids = np.memmap(
+                self._ids_path, dtype=_ID_DTYPE, mode="r", shape=(count,)
+            )
+            self._lists = np.array(
+                np.memmap(
+                    self._lists_path, dtype=np.int32, mode="r", shape=(count,)
+                )
+            )
+        else:
+            self._vectors = np.zeros((0, dim), dtype=np.float32)
+            self._ids = np.zeros(0, dtype=_ID_DTYPE)
+            self._lists = np.zeros(0, dtype=np.int32)
+
+        # Removed vectors have list -1 and sort first, so they are never
+        # contained in any list's range
+        self._order = np.argsort(self._lists, kind="stable")
+        self._offsets = np.searchsorted(
+            self._lists[self._order], np.arange(self.num_lists + 1)
+        )
+
+    def _write_meta(self):
+        etas.write_json(self._meta, self._meta_path)
+
+    @property
+    def _meta_path(self):
+        return os.path.join(self.index_dir, "index.json")
+
+    @property
+    def _centroids_path(self):
+        return os.path.join(self.index_dir, "centroids.npy")
+
+    @property
+    def _vectors_path(self):
+        return os.path.join(self.index_dir, "vectors.bin")
+
+    @property
+    def _ids_path(self):
+        return os.path.join(self.index_dir, "ids.bin")
+
+    @property
+    def _lists_path(self):
+        return os.path.join(self.index_dir, "lists.bin")
+
+
+def compute_similarity_index(
+    sample_collection,
+    embeddings_field,
+    metric="cosine",
+    num_lists=None,
+    num_probes=None,
+):
+    """Builds a :class:`SimilarityIndex` over the vectors in the given field
+    of the collection's dataset.
+
+    Once built, the index can be used via
+    :meth:`sort_by_similarity(..., embeddings_field=embeddings_field) <fiftyone.core.collections.SampleCollection.sort_by_similarity>`.
+
+    Any existing index for the field is rebuilt.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        embeddings_field: the name of a
+            :class:`fiftyone.core.fields.VectorField` of the dataset
+        metric ("cosine"): the distance metric to use. Supported values are
+            ``("cosine", "euclidean")``
+        num_lists (None): the number of lists to partition the vectors into.
+            By default, ``sqrt(num_vectors)`` is used
+        num_probes (None): the default number of lists to probe per query. By
+            default, ``num_lists / 16`` lists are probed, with a minimum of 8
+
+    Returns:
+        a :class:`SimilarityIndex`
+    """
+    dataset = sample_collection._dataset
+    field = _parse_field(dataset, embeddings_field)
+    coll = dataset._sample_collection
+
+    synced_at = datetime.utcnow()
+
+    ids = []
+    vectors = []
+    cursor = coll.find({field: {"$ne": None}}, {"_id": True, field: True})
+    for d in cursor:
+        ids.append(str(d["_id"]))
+        vectors.append(fou.deserialize_numpy_array(d[field]))
+
+    if vectors:
+        vectors = np.stack(vectors)
+    else:
+        vectors = np.zeros((0, 0), dtype=np.float32)
+
+    index = get_similarity_index(dataset, embeddings_field, create=False)
+    index.build(
+        ids,
+        vectors,
+        metric=metric,
+        num_lists=num_lists,
+        num_probes=num_probes,
+    )
+
+    index._meta["last_synced_at"] = synced_at.isoformat(
+        timespec="microseconds"
+    )
+    index._write_meta()
+
+    return index
+
+
+def get_similarity_index(dataset, embeddings_field, create=True):
+    """Returns the :class:`SimilarityIndex` for the given field of the
+    dataset.
+
+    Indexes are cached, so repeated calls return the same instance.
+
+    Args:
+        dataset: a :class:`fiftyone.core.dataset.Dataset`
+        embeddings_field: the name of a
+            :class:`fiftyone.core.fields.VectorField` of the dataset
+        create (True): whether to build the index via
+            :func:`compute_similarity_index` with its default parameters if it
+            does not exist
+
+    Returns:
+        a :class:`SimilarityIndex`
+    """
+    index_dir = _get_index_dir(dataset, embeddings_field)
+
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(index_dir, None)
+        if index is None:
+            index = SimilarityIndex(index_dir)
+            _INDEXES[index_dir] = index
+
+    # Empty indexes are rebuilt since they could not be trained
+    if create and not index.dim:
+        index = compute_similarity_index(dataset, embeddings_field)
+
+    return index
+
+
+def delete_similarity_index(dataset, embeddings_field=None):
+    """Deletes the :class:`SimilarityIndex` for the given field of the
+    dataset, if it exists.
+
+    Args:
+        dataset: a :class:`fiftyone.core.dataset.Dataset`
+        embeddings_field (None): the name of the field whose index to delete.
+            By default, all indexes of the dataset are deleted
+    """
+    if embeddings_field is not None:
+        index_dir = _get_index_dir(dataset, embeddings_field)
+    else:
+        index_dir = _get_dataset_index_dir(dataset)
+
+    with _INDEXES_LOCK:
+        for key in list(_INDEXES.keys()):
+            if key == index_dir or key.startswith(index_dir + os.sep):
+                _INDEXES.pop(key)
+
+    etau.delete_dir(index_dir)
+
+
+def sort_by_similarity(
+    sample_collection,
+    query_ids,
+    embeddings_field,
+    k=None,
+    reverse=False,
+    dist_field=None,
+):
+    """Returns the IDs of the samples in the collection sorted by similarity
+    to the given query ID(s), using the :class:`SimilarityIndex` for the
+    given field.
+
+    The index is built if necessary, and it is synced with the dataset first
+    if the dataset tracks changes, or if samples with vectors have been added
+    to or deleted from the dataset since the index was last synced.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        query_ids: a list of sample IDs
+        embeddings_field: the name of a
+            :class:`fiftyone.core.fields.VectorField` of the dataset
+        k (None): the number of matches to return. By default, the entire
+            collection is sorted
+        reverse (False): whether to sort by least similarity
+        dist_field (None): the name of a float field in which to store the
+            distance of each returned sample to the query
+
+    Returns:
+        the list of sample IDs
+    """
+    dataset = sample_collection._dataset
+    index = get_similarity_index(dataset, embeddings_field)
+
+    # Without change tracking, we can still cheaply detect added and deleted
+    # samples, which would otherwise be missing from or returned by searches
+    if dataset.tracks_changes:
+        index.sync(dataset, embeddings_field)
+    else:
+        field = _parse_field(dataset, embeddings_field)
+        query = {field: {"$ne": None}}
+        if index._is_stale(dataset._sample_collection, query):
+            index.sync(dataset, embeddings_field)
+
+    if not query_ids:
+        raise ValueError("At least one query ID must be provided")
+
+    queries = index.get_vectors(query_ids)
+    if queries is None:
+        field = _parse_field(dataset, embeddings_field)
+        _, queries = _load_vectors(
+            dataset._sample_collection,
+            field,
+            [ObjectId(_id) for _id in query_ids],
+        )
+        if len(queries) != len(set(query_ids)):
+            raise ValueError(
+                "Query IDs must be samples with a `%s` vector"
+                % embeddings_field
+            )
+
+    is_dataset = sample_collection is dataset
+
+    if k is None:
+        ids, dists = index.search(queries, reverse=reverse)
+        ids, dists = _filter_ids(sample_collection, ids, dists, is_dataset)
+    else:
+        # When the collection is a view, some of the nearest neighbors may
+        # not be in it, so we oversample and probe more lists until enough
+        # matches are found
+        num_probes = index.num_probes
+        k_search = k
+        while True:
+            ids, dists = index.search(
+                queries, k=k_search, reverse=reverse, num_probes=num_probes
+            )
+            ids, dists = _filter_ids(sample_collection, ids, dists, is_dataset)
+
+            if len(ids) >= k or (
+                num_probes >= index.num_lists and k_search >= len(index)
+            ):
+                break
+
+            num_probes *= 4
+            k_search *= 4
+
+        ids = ids[:k]
+        dists = dists[:k]
+
+    ids = ids.tolist()
+
+    if dist_field is not None:
+        values = dict(zip(ids, (float(d) for d in dists)))
+        sample_collection.set_values(dist_field, values, key_field="id")
+
+    return ids
+
+
+def _filter_ids(sample_collection, ids, dists, is_dataset):
+    if len(ids) == 0:
+        return ids, dists
+
+    if len(ids) > _BATCH_SIZE:
+        found = set(sample_collection.values("id"))
+    else:
+        # The IDs are matched inline rather than via `select()`, which would
+        # store large ID lists in a collection
+        query = {"_id": {"$in": [ObjectId(_id) for _id in ids]}}
+        if is_dataset:
+            coll = sample_collection._dataset._sample_collection
+            cursor = coll.find(query, {"_id": True})
+        else:
+            cursor = sample_collection._aggregate(
+                pipeline=[{"$match": query}, {"$project": {"_id": True}}]
+            )
+
+        found = {str(d["_id"]) for d in cursor}
+
+    keep = np.array([_id in found for _id in ids], dtype=bool)
+    return ids[keep], dists[keep]
+
+
+def _parse_field(dataset, embeddings_field):
+    field = dataset.get_field(embeddings_field)
+    if not isinstance(field, fof.VectorField):
+        raise ValueError(
+            "Field '%s' must be a %s; found %s"
+            % (embeddings_field, fof.VectorField, field)
+        )
+
+    return dataset._get_db_fields_map().get(embeddings_field, embeddings_field)
+
+
+def _get_dataset_index_dir(dataset):
+    return os.path.join(
+        fo.config.default_dataset_dir, "__indexes__", str(dataset._doc.id)
+    )
+
+
+def _get_index_dir(dataset, embeddings_field):
+    return os.path.join(_get_dataset_index_dir(dataset), embeddings_field)
+
+
+def _load_vectors(coll, field, ids):
+    ids_out = []
+    vectors = []
+    for d in coll.find({"_id": {"$in": ids}}, {"_id": True, field: True}):
+        if d.get(field, None) is not None:
+            ids_out.append(str(d["_id"]))
+            vectors.append(fou.deserialize_numpy_array(d[field]))
+
+    if vectors:
+        vectors = np.stack(vectors)
+    else:
+        vectors = np.zeros((0, 0), dtype=np.float32)
+
+    return ids_out, vectors
+
+
+def _to_ids_array(ids):
+    return np.array([str(_id).encode() for _id in ids], dtype=_ID_DTYPE)
+
+
+def _normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _pairwise_dists(X, Y, metric):
+    if metric == "cosine":
+        return 1.0 - X @ Y.T
+
+    dists = (
+        np.sum(X**2, axis=1)[:, np.newaxis]
+        - 2 * X @ Y.T
+        + np.sum(Y**2, axis=1)[np.newaxis, :]
+    )
+    return np.sqrt(np.maximum(dists, 0))
+
+
+def _nearest(vectors, centroids):
+    inds = np.empty(len(vectors), dtype=int)
+    for start in range(0, len(vectors), _BATCH_SIZE):
+        batch = vectors[start : start + _BATCH_SIZE]
+        dists = _pairwise_dists(batch, centroids, "euclidean")
+        inds[start : start + len(batch)] = np.argmin(dists, axis=1)
+
+    return inds
+
+
+def _kmeans(vectors, num_clusters, num_iters=10, seed=51):
+    rng = np.random.default_rng(seed)
+
+    # Train on a subsample of the vectors
+    num_train = min(len(vectors), max(64 * num_clusters, 10000))
+    if num_train < len(vectors):
+        inds = rng.choice(len(vectors), num_train, replace=False)
+        train = vectors[np.sort(inds)]
+    else:
+        train = vectors
+
+    inds = rng.choice(len(train), num_clusters, replace=False)
+    centroids = np.array(train[inds], dtype=np.float32)
+
+    for _ in range(num_iters):
+        assignments = _nearest(train, centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=num_clusters)
+
+        nonempty = counts > 0
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[nonempty]
+        sums = np.add.reduceat(train[order], starts, axis=0)
+        centroids[nonempty] = sums / counts[nonempty, np.newaxis]
+
+    return centroids
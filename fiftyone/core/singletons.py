@@ -8,6 +8,11 @@ FiftyOne singleton implementations.
 from collections import defaultdict
 import weakref
 
+import fiftyone.core.media as fomm
+
+
+_RELOAD_BATCH_SIZE = 10000
+
 
 class DatasetSingleton(type):
     """Singleton metaclass for :class:`fiftyone.core.dataset.Dataset`.
@@ -155,20 +160,26 @@ class SampleSingleton(DocumentSingleton):
         collection.
 
         If ``sample_ids`` are provided, only those samples are reloaded.
+
+        Unless ``hard=True``, the documents are reloaded via batched queries
+        rather than one query per sample.
         """
         if collection_name not in cls._instances:
             return
 
-        samples = cls._instances[collection_name]
+        samples = _select_instances(
+            cls._instances[collection_name], sample_ids
+        )
 
-        if sample_ids is not None:
-            sample_ids = set(sample_ids)
-            for sample in samples.values():
-                if sample.id in sample_ids:
-                    sample.reload(hard=hard)
+        if hard:
+            for sample in samples:
+                sample.reload(hard=True)
         else:
-            for sample in samples.values():
-                sample.reload(hard=hard)
+            for sample in samples:
+                if sample.media_type == fomm.VIDEO:
+                    sample.frames.reload()
+
+            _reload_backing_docs(samples)
 
     def _sync_docs(cls, collection_name, sample_ids, hard=False):
         """Syncs the backing documents for all in-memory samples in the
@@ -366,22 +377,43 @@ class FrameSingleton(DocumentSingleton):
 
         If ``sample_ids`` are provided, only frames attached to samples with
         these IDs are reloaded.
+
+        Unless ``hard=True``, the documents are reloaded via batched queries
+        rather than one query per frame.
         """
         if collection_name not in cls._instances:
             return
 
-        samples = cls._instances[collection_name]
+        samples = _select_instances(
+            cls._instances[collection_name], sample_ids
+        )
+        frames = [f for _frames in samples for f in _frames.values()]
 
-        if sample_ids is not None:
-            sample_ids = set(sample_ids)
-            for sample_id in sample_ids:
-                frames = samples.get(sample_id, {})
-                for frame in frames.values():
-                    frame.reload(hard=hard)
+        if hard:
+            for frame in frames:
+                frame.reload(hard=True)
         else:
-            for frames in samples.values():
-                for frame in frames.values():
-                    frame.reload(hard=hard)
+            _reload_backing_docs(frames, frames=True)
+
+    def _reload_docs_by_frame_id(cls, collection_name, frame_ids):
+        """Reloads the backing documents for all in-memory frames with the
+        given frame IDs.
+        """
+        if collection_name not in cls._instances:
+            return
+
+        frame_ids = {str(_id) for _id in frame_ids}
+        if not frame_ids:
+            return
+
+        frames = [
+            frame
+            for _frames in list(cls._instances[collection_name].values())
+            for frame in _frames.values()
+            if frame.id in frame_ids
+        ]
+
+        _reload_backing_docs(frames, frames=True)
 
     def _reset_docs(cls, collection_name, sample_ids=None):
         """Resets the backing documents for in-memory frames in the collection.
@@ -466,3 +498,56 @@ class FrameSingleton(DocumentSingleton):
 
         for sample_id, fn in reset:
             samples[sample_id].pop(fn)
+
+
+def _select_instances(instances, ids):
+    if ids is None:
+        return list(instances.values())
+
+    ids = {str(_id) for _id in ids}
+    if len(ids) < len(instances):
+        objs = (instances.get(_id, None) for _id in ids)
+        return [obj for obj in objs if obj is not None]
+
+    return [obj for _id, obj in list(instances.items()) if _id in ids]
+
+
+def _reload_backing_docs(objs, frames=False):
+    # Reloads the field values of the given in-database documents via one
+    # `$in` query per batch rather than one query per document. Like
+    # `Document.reload(hard=False)`, only fields in the documents' current
+    # schemas are reloaded
+    objs = [obj for obj in objs if obj._in_db]
+    for i in range(0, len(objs), _RELOAD_BATCH_SIZE):
+        batch = objs[i : (i + _RELOAD_BATCH_SIZE)]
+
+        # All documents in a collection belong to the same dataset
+        dataset = batch[0]._dataset
+        if frames:
+            coll = dataset._frame_collection
+        else:
+            coll = dataset._sample_collection
+
+        doc_cls = type(batch[0]._doc)
+        projection = {f.db_field: True for f in doc_cls._fields.values()}
+
+        ids = [obj._id for obj in batch]
+        docs = {
+            d["_id"]: d for d in coll.find({"_id": {"$in": ids}}, projection)
+        }
+        for obj in batch:
+            d = docs.get(obj._id, None)
+            if d is not None:
+                _reload_backing_doc(obj._doc, d)
+
+
+def _reload_backing_doc(doc, d):
+    # Like `mongoengine.Document.reload()`, the field values are updated in
+    # place so that all references to the backing document stay valid
+    fields = list(doc)
+    db_doc = type(doc).from_dict(d, extended=False)
+    for field in fields:
+        setattr(doc, field, doc._reload(field, db_doc._data.get(field)))
+
+    doc._changed_fields = list(set(doc._changed_fields) - set(fields))
+    doc._created = False
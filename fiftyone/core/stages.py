@@ -26,8 +26,10 @@ import fiftyone.core.fields as fof
 import fiftyone.core.frame as fofr
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
 from fiftyone.core.odm.document import MongoEngineBaseDocument
 import fiftyone.core.sample as fos
+import fiftyone.core.similarity as fosi
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fova
 
@@ -40,6 +42,16 @@ fovi = fou.lazy_import("fiftyone.core.video")
 foug = fou.lazy_import("fiftyone.utils.geojson")
 
 
+# ID lists larger than this are joined via `$lookup` rather than being inlined
+# in view stage pipelines
+_MAX_INLINE_IDS = 10000
+
+# Number of seconds after their last use that the IDs collections of
+# `SortBySimilarity` results expire. Query results are rarely reused, so they
+# expire sooner than the default of `make_ids_collection()`
+_SIMILARITY_IDS_TTL = 3600
+
+
 class ViewStage(object):
     """Abstract base class for all view stages.
 
@@ -456,8 +468,14 @@ class Exclude(ViewStage):
         """The list of sample IDs to exclude."""
         return self._sample_ids
 
-    def to_mongo(self, _):
+    def to_mongo(self, sample_collection):
         sample_ids = [ObjectId(_id) for _id in self._sample_ids]
+
+        if len(sample_ids) > _MAX_INLINE_IDS:
+            return _make_lookup_ids_pipeline(
+                sample_collection, sample_ids, exclude=True
+            )
+
         return [{"$match": {"_id": {"$not": {"$in": sample_ids}}}}]
 
     def _kwargs(self):
@@ -473,6 +491,9 @@ class Exclude(ViewStage):
             }
         ]
 
+    def validate(self, sample_collection):
+        _make_ids_collection(sample_collection, self._sample_ids)
+
 
 class ExcludeBy(ViewStage):
     """Excludes the samples with the given field values from a collection.
@@ -4337,23 +4358,15 @@ class Select(ViewStage):
         """Whether to sort the samples in the same order as the IDs."""
         return self._ordered
 
-    def to_mongo(self, _):
+    def to_mongo(self, sample_collection):
         if self._bools:
             raise ValueError(
                 "`validate()` must be called before using this stage"
             )
 
-        ids = [ObjectId(_id) for _id in self._sample_ids]
-
-        if not self._ordered:
-            return [{"$match": {"_id": {"$in": ids}}}]
-
-        return [
-            {"$set": {"_select_order": {"$indexOfArray": [ids, "$_id"]}}},
-            {"$match": {"_select_order": {"$gt": -1}}},
-            {"$sort": {"_select_order": 1}},
-            {"$unset": "_select_order"},
-        ]
+        return _make_select_pipeline(
+            sample_collection, self._sample_ids, ordered=self._ordered
+        )
 
     def _kwargs(self):
         return [["sample_ids", self._sample_ids], ["ordered", self._ordered]]
@@ -4381,6 +4394,8 @@ class Select(ViewStage):
             self._sample_ids = list(itertools.compress(ids, selectors))
             self._bools = False
 
+        _make_ids_collection(sample_collection, self._sample_ids)
+
 
 class SelectBy(ViewStage):
     """Selects the samples with the given field values from a collection.
@@ -5438,7 +5453,9 @@ class SortBySimilarity(ViewStage):
 
     In order to use this stage, you must first use
     :meth:`fiftyone.brain.compute_similarity` to index your dataset by visual
-    similiarity.
+    similiarity, or you must provide the ``embeddings_field`` of your dataset
+    that contains the embeddings to use, in which case a
+    :class:`fiftyone.core.similarity.SimilarityIndex` is used.
 
     Examples::
 
@@ -5459,6 +5476,19 @@ class SortBySimilarity(ViewStage):
         stage = fo.SortBySimilarity(query_id)
         view = dataset.add_stage(stage)
 
+        #
+        # Sort the samples by similarity of their embeddings in a vector
+        # field, without a brain run
+        #
+
+        model = foz.load_zoo_model("mobilenet-v2-imagenet-torch")
+        dataset.compute_embeddings(model, embeddings_field="embeddings")
+
+        stage = fo.SortBySimilarity(
+            query_id, k=10, embeddings_field="embeddings"
+        )
+        view = dataset.add_stage(stage)
+
     Args:
         query_ids: an ID or iterable of query IDs. These may be sample IDs or
             label IDs depending on ``brain_key``
@@ -5470,8 +5500,13 @@ class SortBySimilarity(ViewStage):
             created if necessary
         brain_key (None): the brain key of an existing
             :meth:`fiftyone.brain.compute_similarity` run on the dataset. If
-            not specified, the dataset must have an applicable run, which will
-            be used by default
+            not specified and ``embeddings_field`` is not provided, the
+            dataset must have an applicable run, which will be used by default
+        embeddings_field (None): the name of a
+            :class:`fiftyone.core.fields.VectorField` of the dataset
+            containing sample embeddings to use instead of a brain run. A
+            :class:`fiftyone.core.similarity.SimilarityIndex` is built for the
+            field if necessary. In this case, ``query_ids`` must be sample IDs
     """
 
     def __init__(
@@ -5481,6 +5516,7 @@ class SortBySimilarity(ViewStage):
         reverse=False,
         dist_field=None,
         brain_key=None,
+        embeddings_field=None,
         _state=None,
     ):
         if etau.is_str(query_ids):
@@ -5493,8 +5529,10 @@ class SortBySimilarity(ViewStage):
         self._reverse = reverse
         self._dist_field = dist_field
         self._brain_key = brain_key
+        self._embeddings_field = embeddings_field
         self._state = _state
         self._pipeline = None
+        self._ids = None
 
     @property
     def query_ids(self):
@@ -5523,7 +5561,20 @@ class SortBySimilarity(ViewStage):
         """
         return self._brain_key
 
-    def to_mongo(self, _):
+    @property
+    def embeddings_field(self):
+        """The vector field containing the embeddings to use, if any."""
+        return self._embeddings_field
+
+    def to_mongo(self, sample_collection):
+        if self._ids is not None:
+            return _make_select_pipeline(
+                sample_collection,
+                self._ids,
+                ordered=True,
+                ttl=_SIMILARITY_IDS_TTL,
+            )
+
         if self._pipeline is None:
             raise ValueError(
                 "`validate()` must be called before using a %s stage"
@@ -5539,6 +5590,7 @@ class SortBySimilarity(ViewStage):
             ["reverse", self._reverse],
             ["dist_field", self._dist_field],
             ["brain_key", self._brain_key],
+            ["embeddings_field", self._embeddings_field],
             ["_state", self._state],
         ]
 
@@ -5574,10 +5626,32 @@ class SortBySimilarity(ViewStage):
                 "default": "None",
                 "placeholder": "brain key",
             },
+            {
+                "name": "embeddings_field",
+                "type": "NoneType|field|str",
+                "default": "None",
+                "placeholder": "embeddings_field (default=None)",
+            },
             {"name": "_state", "type": "NoneType|json", "default": "None"},
         ]
 
     def validate(self, sample_collection):
+        if self._embeddings_field is not None and self._brain_key is None:
+            # Index searches are fast and must reflect the current contents of
+            # the dataset, so their results are not cached in the state
+            self._ids = fosi.sort_by_similarity(
+                sample_collection,
+                self._query_ids,
+                self._embeddings_field,
+                k=self._k,
+                reverse=self._reverse,
+                dist_field=self._dist_field,
+            )
+            _make_ids_collection(
+                sample_collection, self._ids, ttl=_SIMILARITY_IDS_TTL
+            )
+            return
+
         state = {
             "dataset": sample_collection.dataset_name,
             "stages": sample_collection.view()._serialize(include_uuids=False),
@@ -5586,6 +5660,7 @@ class SortBySimilarity(ViewStage):
             "reverse": self._reverse,
             "dist_field": self._dist_field,
             "brain_key": self._brain_key,
+            "embeddings_field": self._embeddings_field,
         }
 
         last_state = deepcopy(self._state)
@@ -6332,6 +6407,84 @@ class ToFrames(ViewStage):
         ]
 
 
+def _make_ids_collection(sample_collection, ids, ttl=None):
+    # Large ID lists are stored in a collection when the stage is validated,
+    # so that the collection is populated before any pipeline uses it
+    if len(ids) > _MAX_INLINE_IDS:
+        foo.make_ids_collection(
+            sample_collection._dataset._sample_collection_name,
+            [ObjectId(_id) for _id in ids],
+            ttl=ttl,
+        )
+
+
+def _make_select_pipeline(sample_collection, ids, ordered=False, ttl=None):
+    ids = [ObjectId(_id) for _id in ids]
+
+    if len(ids) > _MAX_INLINE_IDS:
+        return _make_lookup_ids_pipeline(
+            sample_collection, ids, ordered=ordered, ttl=ttl
+        )
+
+    if not ordered:
+        return [{"$match": {"_id": {"$in": ids}}}]
+
+    return [
+        {"$match": {"_id": {"$in": ids}}},
+        {"$set": {"_select_order": {"$indexOfArray": [ids, "$_id"]}}},
+        {"$sort": {"_select_order": 1}},
+        {"$unset": "_select_order"},
+    ]
+
+
+def _make_lookup_ids_pipeline(
+    sample_collection, ids, ordered=False, exclude=False, ttl=None
+):
+    # Rather than inlining large ID lists in the pipeline, we store them in an
+    # indexed collection and join against it. The stored ranks allow for
+    # sorting without `$indexOfArray`, which is linear in the number of IDs.
+    # Unused collections expire, so each use periodically records that the
+    # collection is in use and recreates it if necessary
+    coll_name = foo.make_ids_collection(
+        sample_collection._dataset._sample_collection_name, ids, ttl=ttl
+    )
+
+    if exclude:
+        match = {"_ids_lookup": {"$size": 0}}
+    else:
+        match = {"_ids_lookup": {"$ne": []}}
+
+    pipeline = [
+        {
+            "$lookup": {
+                "from": coll_name,
+                "localField": "_id",
+                "foreignField": "_id",
+                "as": "_ids_lookup",
+            }
+        },
+        {"$match": match},
+    ]
+
+    if ordered:
+        pipeline.extend(
+            [
+                {
+                    "$set": {
+                        "_ids_lookup": {
+                            "$arrayElemAt": ["$_ids_lookup.rank", 0]
+                        }
+                    }
+                },
+                {"$sort": {"_ids_lookup": 1}},
+            ]
+        )
+
+    pipeline.append({"$unset": "_ids_lookup"})
+
+    return pipeline
+
+
 def _parse_sample_ids(arg):
     if etau.is_str(arg):
         return [arg], False
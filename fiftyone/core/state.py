@@ -14,6 +14,7 @@ import eta.core.utils as etau
 
 import fiftyone as fo
 import fiftyone.core.dataset as fod
+import fiftyone.core.stages as fosg
 import fiftyone.core.utils as fou
 import fiftyone.core.view as fov
 
@@ -111,3 +112,154 @@ class StateDescription(etas.Serializable):
             selected_labels=d.get("selected_labels", []),
             view=view,
         )
+
+    def apply_patch(self, patch):
+        """Applies a patch generated by :func:`make_state_patch` to this
+        state.
+
+        The patch is fully resolved before any changes are made, so the state
+        is not modified if a ``ValueError`` is raised.
+
+        Args:
+            patch: a patch dict
+
+        Raises:
+            ValueError: if the patch cannot be applied to this state
+        """
+        try:
+            changes = self._resolve_patch(patch)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError("Failed to apply state patch: %s" % e) from e
+
+        dataset, view, selected, selected_labels, config = changes
+
+        self.dataset = dataset
+        self.view = view
+        self.selected = selected
+        self.selected_labels = selected_labels
+
+        if config is not None:
+            for field, value in config.items():
+                setattr(self.config, field, value)
+
+            timezone = config.get("timezone", None)
+            if timezone:
+                fo.config.timezone = timezone
+
+    def _resolve_patch(self, patch):
+        selected = self.selected
+        if "selected" in patch:
+            selected = _apply_list_patch(selected, patch["selected"])
+
+        selected_labels = self.selected_labels
+        if "selected_labels" in patch:
+            selected_labels = _apply_list_patch(
+                selected_labels, patch["selected_labels"]
+            )
+
+        dataset = self.dataset
+        view = self.view
+        if "dataset" in patch:
+            name = patch["dataset"]["set"]
+            dataset = fod.load_dataset(name) if name is not None else None
+            view = None
+
+        if "view" in patch:
+            view_patch = patch["view"]
+            if "append" in view_patch:
+                if view is None:
+                    raise ValueError("There is no view to append stages to")
+
+                for stage_dict in view_patch["append"]:
+                    stage = fosg.ViewStage._from_dict(stage_dict)
+                    view = view.add_stage(stage)
+            elif dataset is not None and view_patch["set"]:
+                view = fov.DatasetView._build(dataset, view_patch["set"])
+            else:
+                view = None
+
+        config = None
+        if "config" in patch:
+            config = patch["config"]["set"] or {}
+            if not isinstance(config, dict):
+                raise ValueError("Invalid config patch %s" % config)
+
+        return dataset, view, selected, selected_labels, config
+
+
+def make_state_patch(old, new):
+    """Generates a patch that transforms the serialized
+    :class:`StateDescription` ``old`` into ``new``.
+
+    Selections are patched by the values that were added and removed, views
+    whose stages extend the previous view are patched by their new stages, and
+    any other changed attributes are patched by their new values.
+
+    Args:
+        old: a serialized :class:`StateDescription`
+        new: a serialized :class:`StateDescription`
+
+    Returns:
+        a patch dict that can be applied via
+        :meth:`StateDescription.apply_patch`
+    """
+    patch = {}
+    for key in ("config", "dataset", "selected", "selected_labels", "view"):
+        old_value = old.get(key, None)
+        new_value = new.get(key, None)
+        if old_value == new_value:
+            continue
+
+        if key in ("selected", "selected_labels"):
+            patch[key] = _make_list_patch(old_value or [], new_value or [])
+        elif (
+            key == "view"
+            and old_value
+            and new_value
+            and "dataset" not in patch
+            and new_value[: len(old_value)] == old_value
+        ):
+            patch[key] = {"append": new_value[len(old_value) :]}
+        else:
+            patch[key] = {"set": new_value}
+
+    return patch
+
+
+def _make_list_patch(old, new):
+    new_keys = set(_get_list_key(v) for v in new)
+    kept = [v for v in old if _get_list_key(v) in new_keys]
+
+    if new[: len(kept)] != kept:
+        return {"set": new}
+
+    removed = [v for v in old if _get_list_key(v) not in new_keys]
+    added = new[len(kept) :]
+
+    if len(removed) + len(added) >= len(new):
+        return {"set": new}
+
+    return {"remove": removed, "add": added, "count": len(new)}
+
+
+def _apply_list_patch(values, patch):
+    if "set" in patch:
+        return list(patch["set"] or [])
+
+    removed = set(_get_list_key(v) for v in patch["remove"])
+    values = [v for v in values if _get_list_key(v) not in removed]
+    values.extend(patch["add"])
+
+    if len(values) != patch["count"]:
+        raise ValueError("The patch does not match the current selection")
+
+    return values
+
+
+def _get_list_key(value):
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True)
+
+    return value
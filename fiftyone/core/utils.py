@@ -8,6 +8,7 @@ Core utilities.
 import atexit
 from base64 import b64encode, b64decode
 from collections import defaultdict
+import contextlib
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import date, datetime
@@ -22,11 +23,14 @@ import ntpath
 import os
 import posixpath
 import platform
+import queue
 import signal
 import struct
 import subprocess
 import sys
+import threading
 import timeit
+import traceback
 import types
 from xml.parsers.expat import ExpatError
 import zlib
@@ -49,6 +53,7 @@ import eta.core.utils as etau
 
 import fiftyone as fo
 import fiftyone.core.context as foc
+import fiftyone.core.profiling as fopf
 
 
 logger = logging.getLogger(__name__)
@@ -825,6 +830,15 @@ class ProgressBar(etau.ProgressBar):
 
         super().__init__(*args, **kwargs)
 
+    def close(self, *args):
+        record = self.is_running and not self.is_finalized
+
+        super().close(*args)
+
+        # Record the number of items processed by the current profiling stage
+        if record:
+            fopf.increment("items", self.iteration)
+
 
 class DynamicBatcher(object):
     """Class for iterating over the elements of an iterable with a dynamic
@@ -919,6 +933,8 @@ class DynamicBatcher(object):
             offset = self._last_offset
             self._last_offset += batch_size
 
+            fopf.record_batch_size(min(batch_size, self._num_samples - offset))
+
             return self.iterable[offset : (offset + batch_size)]
 
         batch = []
@@ -933,6 +949,8 @@ class DynamicBatcher(object):
             if not batch:
                 raise StopIteration
 
+        fopf.record_batch_size(len(batch))
+
         return batch
 
     def _compute_batch_size(self):
@@ -941,6 +959,8 @@ class DynamicBatcher(object):
         if self._last_batch_size is None:
             batch_size = self.init_batch_size
         else:
+            fopf.observe("batch_latency", current_time - self._last_time)
+
             # Compute optimal batch size
             try:
                 beta = self.target_latency / (current_time - self._last_time)
@@ -1007,6 +1027,9 @@ class UniqueFilenameMaker(object):
             output paths
         ignore_exts (False): whether to omit file extensions when checking for
             duplicate filenames
+        ignore_filenames (None): an optional iterable of filenames in
+            ``output_dir`` to disregard when checking for existing files. This
+            is useful when resuming a previous run that populated these files
     """
 
     def __init__(
@@ -1015,11 +1038,13 @@ class UniqueFilenameMaker(object):
         rel_dir=None,
         default_ext=None,
         ignore_exts=False,
+        ignore_filenames=None,
     ):
         self.output_dir = output_dir
         self.rel_dir = rel_dir
         self.default_ext = default_ext
         self.ignore_exts = ignore_exts
+        self.ignore_filenames = ignore_filenames
 
         self._filepath_map = {}
         self._filename_counts = defaultdict(int)
@@ -1037,6 +1062,10 @@ class UniqueFilenameMaker(object):
         etau.ensure_dir(self.output_dir)
         filenames = etau.list_files(self.output_dir)
 
+        if self.ignore_filenames:
+            ignore_filenames = set(self.ignore_filenames)
+            filenames = [f for f in filenames if f not in ignore_filenames]
+
         self._idx = len(filenames)
         for filename in filenames:
             self._filename_counts[filename] += 1
@@ -1189,6 +1218,62 @@ def iter_batches(iterable, batch_size):
         yield chunk
 
 
+def iter_prefetched(iterable, max_size):
+    """Iterates over the given iterable, fetching up to ``max_size`` elements
+    ahead of the consumer in a background thread.
+
+    Any exception raised by the iterable is re-raised by this generator after
+    all elements emitted prior to the exception have been yielded.
+
+    Args:
+        iterable: an iterable
+        max_size: the maximum number of elements to fetch ahead
+
+    Returns:
+        a generator that emits the elements of the input
+    """
+    buffer = queue.Queue(maxsize=max(max_size, 1))
+    stop = threading.Event()
+    done = object()
+
+    def _put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _fetch():
+        try:
+            for element in iterable:
+                if not _put((element, None)):
+                    return
+        except BaseException as e:
+            _put((done, e))
+            return
+
+        _put((done, None))
+
+    thread = threading.Thread(target=_fetch, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            element, error = buffer.get()
+            if element is done:
+                if error is not None:
+                    raise error
+
+                return
+
+            yield element
+    finally:
+        stop.set()
+
+
 def iter_slices(sliceable, batch_size):
     """Iterates over batches of the given object via slicing.
 
@@ -1367,6 +1452,199 @@ def get_multiprocessing_context():
     return multiprocessing.get_context()
 
 
+class ParallelShardsWriter(object):
+    """Class for writing items to sharded outputs via worker processes.
+
+    Items are assigned to shards using a round robin strategy. Each worker
+    owns a disjoint subset of the shards, so each shard receives its items in
+    the order in which they were written.
+
+    Example Usage::
+
+        import functools
+
+        open_fcn = functools.partial(open, mode="w")
+        paths = ["/tmp/shard-%d.txt" % i for i in range(4)]
+
+        with ParallelShardsWriter(paths, open_fcn, num_workers=2) as writer:
+            for idx in range(100):
+                writer.write("%d\\n" % idx)
+
+    Args:
+        shard_paths: a list of output paths, one per shard
+        open_fcn: a picklable function that accepts a shard path and returns
+            a context manager whose value provides a ``write()`` method
+        serialize_fcn (None): an optional picklable function to apply to each
+            item in the worker processes before it is written
+        num_workers (None): the number of worker processes to use. By
+            default, ``multiprocessing.cpu_count()`` is used. This is capped
+            at the number of shards
+        context (None): the ``multiprocessing`` context to use. By default,
+            :func:`get_multiprocessing_context` is used
+    """
+
+    def __init__(
+        self,
+        shard_paths,
+        open_fcn,
+        serialize_fcn=None,
+        num_workers=None,
+        context=None,
+    ):
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+
+        num_workers = max(1, min(num_workers, len(shard_paths)))
+
+        if context is None:
+            context = get_multiprocessing_context()
+
+        self.shard_paths = shard_paths
+        self.open_fcn = open_fcn
+        self.serialize_fcn = serialize_fcn
+        self.num_workers = num_workers
+        self.context = context
+
+        self._idx = None
+        self._workers = None
+        self._queues = None
+        self._errors = None
+
+    def __enter__(self):
+        self._idx = -1
+        self._errors = self.context.Queue()
+        self._queues = []
+        self._workers = []
+
+        with _disable_services():
+            self._start_workers()
+
+        return self
+
+    def __exit__(self, *args):
+        for task_queue, worker in zip(self._queues, self._workers):
+            if worker.is_alive():
+                self._put(task_queue, worker, None)
+
+        for worker in self._workers:
+            worker.join()
+
+        self._raise_errors()
+
+    def write(self, item):
+        """Writes the given item to the next shard.
+
+        Args:
+            item: a picklable item
+        """
+        self._idx += 1
+        shard_idx = self._idx % len(self.shard_paths)
+        worker_idx = shard_idx % self.num_workers
+
+        self._put(
+            self._queues[worker_idx],
+            self._workers[worker_idx],
+            (shard_idx, item),
+        )
+
+    def _start_workers(self):
+        num_shards = len(self.shard_paths)
+        for worker_idx in range(self.num_workers):
+            shard_paths = {
+                i: self.shard_paths[i]
+                for i in range(worker_idx, num_shards, self.num_workers)
+            }
+            task_queue = self.context.Queue(maxsize=64)
+            worker = self.context.Process(
+                target=_write_shards,
+                args=(
+                    shard_paths,
+                    self.open_fcn,
+                    self.serialize_fcn,
+                    task_queue,
+                    self._errors,
+                ),
+                daemon=True,
+            )
+            worker.start()
+
+            self._queues.append(task_queue)
+            self._workers.append(worker)
+
+    def _put(self, task_queue, worker, task):
+        while True:
+            try:
+                task_queue.put(task, timeout=1)
+                return
+            except queue.Full:
+                if not worker.is_alive():
+                    self._raise_errors()
+                    raise RuntimeError("Shard worker exited unexpectedly")
+
+    def _raise_errors(self):
+        errors = []
+        while True:
+            try:
+                errors.append(self._errors.get(timeout=0.1))
+            except queue.Empty:
+                break
+
+        if errors:
+            for task_queue in self._queues:
+                task_queue.cancel_join_thread()
+
+            raise RuntimeError(
+                "Failed to write shards:\n\n%s" % "\n".join(errors)
+            )
+
+        for worker in self._workers:
+            if worker.exitcode not in (None, 0):
+                for task_queue in self._queues:
+                    task_queue.cancel_join_thread()
+
+                raise RuntimeError(
+                    "Shard worker exited with code %d" % worker.exitcode
+                )
+
+
+@contextmanager
+def _disable_services():
+    # Prevents worker processes from connecting to the database, which they
+    # do not need
+    disable_services = os.environ.get("FIFTYONE_DISABLE_SERVICES", None)
+    os.environ["FIFTYONE_DISABLE_SERVICES"] = "1"
+
+    try:
+        yield
+    finally:
+        if disable_services is None:
+            del os.environ["FIFTYONE_DISABLE_SERVICES"]
+        else:
+            os.environ["FIFTYONE_DISABLE_SERVICES"] = disable_services
+
+
+def _write_shards(shard_paths, open_fcn, serialize_fcn, task_queue, errors):
+    try:
+        with contextlib.ExitStack() as c:
+            writers = {
+                i: c.enter_context(open_fcn(path))
+                for i, path in shard_paths.items()
+            }
+
+            while True:
+                task = task_queue.get()
+                if task is None:
+                    break
+
+                shard_idx, item = task
+                if serialize_fcn is not None:
+                    item = serialize_fcn(item)
+
+                writers[shard_idx].write(item)
+    except:
+        errors.put(traceback.format_exc())
+
+
 def datetime_to_timestamp(dt):
     """Converts a `datetime.date` or `datetime.datetime` to milliseconds since
     epoch.
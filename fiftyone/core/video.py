@@ -845,7 +845,9 @@ def _init_frames(
         ops = [
             UpdateOne(
                 {"_sample_id": _sample_id, "frame_number": fn},
-                {"$set": {"filepath": filepath}},
+                src_dataset._stamp_update(
+                    {"$set": {"filepath": filepath}}, frames=True
+                ),
             )
             for _sample_id, fn, filepath in missing_filepaths
         ]
@@ -8,6 +8,7 @@ Dataset views.
 from collections import OrderedDict
 from copy import copy, deepcopy
 import numbers
+import timeit
 
 from bson import ObjectId
 from pymongo.errors import CursorNotFound
@@ -25,6 +26,11 @@ import fiftyone.core.utils as fou
 fost = fou.lazy_import("fiftyone.core.stages")
 
 
+# Number of seconds for which the cached pipelines of a view's stages are
+# reused. This must be much smaller than the TTL of any IDs collection
+_PIPELINE_CACHE_TTL = 300
+
+
 class DatasetView(foc.SampleCollection):
     """A view into a :class:`fiftyone.core.dataset.Dataset`.
 
@@ -54,6 +60,9 @@ class DatasetView(foc.SampleCollection):
             view
     """
 
+    # Cache of the pipelines generated by each stage of the view
+    _pipeline_cache = None
+
     def __init__(self, dataset, _stages=None):
         if _stages is None:
             _stages = []
@@ -275,42 +284,75 @@ class DatasetView(foc.SampleCollection):
         """
         return copy(self)
 
-    def iter_samples(self, progress=False):
+    def iter_samples(
+        self, progress=False, batch_size=None, prefetch=False, read_only=False
+    ):
         """Returns an iterator over the samples in the view.
 
         Args:
             progress (False): whether to render a progress bar tracking the
                 iterator's progress
+            batch_size (None): the number of samples to fetch from the
+                database per round trip. By default, the server's default is
+                used
+            prefetch (False): whether to fetch upcoming samples from the
+                database in a background thread while the current samples are
+                being processed
+            read_only (False): whether to generate lightweight
+                :class:`fiftyone.core.sample.ReadOnlySample` instances whose
+                fields are decoded only when they are accessed. Read-only
+                samples cannot be edited and do not include the frames of
+                video samples
 
         Returns:
-            an iterator over :class:`fiftyone.core.sample.SampleView` instances
+            an iterator over :class:`fiftyone.core.sample.SampleView` or
+            :class:`fiftyone.core.sample.ReadOnlySample` instances
         """
+        samples = self._iter_samples(
+            batch_size=batch_size, prefetch=prefetch, read_only=read_only
+        )
+
         if progress:
             with fou.ProgressBar(total=len(self)) as pb:
-                for sample in pb(self._iter_samples()):
+                for sample in pb(samples):
                     yield sample
         else:
-            for sample in self._iter_samples():
+            for sample in samples:
                 yield sample
 
-    def _iter_samples(self):
+    def _iter_samples(self, batch_size=None, prefetch=False, read_only=False):
         sample_cls = self._sample_cls
+        doc_cls = self._dataset._sample_doc_cls
         selected_fields, excluded_fields = self._get_selected_excluded_fields()
         filtered_fields = self._get_filtered_fields()
 
         index = 0
 
+        docs = self._aggregate(detach_frames=True, batch_size=batch_size)
+        if prefetch:
+            docs = fou.iter_prefetched(docs, batch_size or 1000)
+
         try:
-            for d in self._aggregate(detach_frames=True):
+            for d in docs:
                 try:
-                    doc = self._dataset._sample_dict_to_doc(d)
-                    sample = sample_cls(
-                        doc,
-                        self,
-                        selected_fields=selected_fields,
-                        excluded_fields=excluded_fields,
-                        filtered_fields=filtered_fields,
-                    )
+                    if read_only:
+                        sample = fos.ReadOnlySample(
+                            d,
+                            self,
+                            doc_cls,
+                            selected_fields=selected_fields,
+                            excluded_fields=excluded_fields,
+                        )
+                    else:
+                        doc = self._dataset._sample_dict_to_doc(d)
+                        sample = sample_cls(
+                            doc,
+                            self,
+                            selected_fields=selected_fields,
+                            excluded_fields=excluded_fields,
+                            filtered_fields=filtered_fields,
+                        )
+
                     index += 1
                     yield sample
 
@@ -322,10 +364,14 @@ class DatasetView(foc.SampleCollection):
 
         except CursorNotFound:
             # The cursor has timed out so we yield from a new one after
-            # skipping to the last offset
+            # skipping to the last offset. Unlike datasets, views cannot
+            # resume by ID in general because their stages may depend on the
+            # samples that precede the offset
 
             view = self.skip(index)
-            for sample in view.iter_samples():
+            for sample in view._iter_samples(
+                batch_size=batch_size, prefetch=prefetch, read_only=read_only
+            ):
                 yield sample
 
     def get_field_schema(
@@ -784,10 +830,8 @@ class DatasetView(foc.SampleCollection):
         frames_only=False,
     ):
         _pipeline = []
-        _view = self._base_view
-        for stage in self._stages:
-            _pipeline.extend(stage.to_mongo(_view))
-            _view._stages.append(stage)
+        for stage_pipeline in self._get_stage_pipelines():
+            _pipeline.extend(stage_pipeline)
 
         if pipeline is not None:
             _pipeline.extend(pipeline)
@@ -801,12 +845,91 @@ class DatasetView(foc.SampleCollection):
             frames_only=frames_only,
         )
 
+    def _get_stage_pipelines(self):
+        # The pipeline of each stage is cached along with the schema token of
+        # the dataset at the time that it was generated. Views created by
+        # appending stages to this view inherit the cache, so only the new
+        # stages need to be compiled. Cached pipelines are regenerated after
+        # `_PIPELINE_CACHE_TTL` seconds so that stages can refresh the
+        # database resources that they use, e.g., IDs collections
+        token = self._dataset._schema_token
+        stages = self._stages
+        now = timeit.default_timer()
+
+        num_cached = 0
+        stage_pipelines = []
+        cache_time = now
+        if self._pipeline_cache is not None:
+            (
+                cached_token,
+                cached_stages,
+                cached_pipelines,
+                cached_time,
+            ) = self._pipeline_cache
+            if (
+                _tokens_match(token, cached_token)
+                and now - cached_time < _PIPELINE_CACHE_TTL
+            ):
+                for stage, cached_stage, stage_pipeline in zip(
+                    stages, cached_stages, cached_pipelines
+                ):
+                    if stage is not cached_stage:
+                        break
+
+                    stage_pipelines.append(stage_pipeline)
+                    num_cached += 1
+
+                if num_cached > 0:
+                    cache_time = cached_time
+
+        if num_cached < len(stages):
+            _view = self._base_view
+            _view._stages.extend(stages[:num_cached])
+            for stage in stages[num_cached:]:
+                stage_pipelines.append(stage.to_mongo(_view))
+                _view._stages.append(stage)
+
+            self._pipeline_cache = (
+                token,
+                list(stages),
+                stage_pipelines,
+                cache_time,
+            )
+
+        return stage_pipelines
+
+    def _inherit_pipeline_cache(self, view):
+        # `view` must contain copies of this view's stages, optionally followed
+        # by additional stages
+        if self._pipeline_cache is None:
+            return
+
+        (
+            token,
+            cached_stages,
+            cached_pipelines,
+            cached_time,
+        ) = self._pipeline_cache
+        num_stages = len(self._stages)
+        if len(cached_stages) != num_stages or any(
+            s is not c for s, c in zip(self._stages, cached_stages)
+        ):
+            return
+
+        view._pipeline_cache = (
+            token,
+            view._stages[:num_stages],
+            cached_pipelines,
+            cached_time,
+        )
+
     def _aggregate(
         self,
         pipeline=None,
         attach_frames=False,
         detach_frames=False,
         frames_only=False,
+        batch_size=None,
     ):
         _pipeline = self._pipeline(
             pipeline=pipeline,
@@ -814,7 +937,9 @@ class DatasetView(foc.SampleCollection):
             detach_frames=detach_frames,
             frames_only=frames_only,
         )
-        return foo.aggregate(self._dataset._sample_collection, _pipeline)
+        return foo.aggregate(
+            self._dataset._sample_collection, _pipeline, batch_size=batch_size
+        )
 
     def _serialize(self, include_uuids=True):
         return [
@@ -874,6 +999,7 @@ class DatasetView(foc.SampleCollection):
         else:
             view = copy(self)
             view._stages.append(stage)
+            self._inherit_pipeline_cache(view)
 
         return view
 
@@ -1002,3 +1128,9 @@ def make_optimized_select_view(sample_collection, sample_ids, ordered=False):
             optimized_view._stages.append(stage)
 
     return optimized_view
+
+
+def _tokens_match(token, other_token):
+    return len(token) == len(other_token) and all(
+        t is o for t, o in zip(token, other_token)
+    )
@@ -5,26 +5,19 @@ FiftyOne v0.15.1 revision.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import fiftyone.migrations.utils as fomu
 
 
-def up(db, dataset_name):
-    match_d = {"name": dataset_name}
-    dataset_dict = db.datasets.find_one(match_d)
+def up_pipeline():
+    return [
+        {
+            "$set": {
+                "skeletons": fomu.set_default("skeletons", {}),
+                "default_skeleton": fomu.set_default("default_skeleton", None),
+            }
+        }
+    ]
 
-    if "skeletons" not in dataset_dict:
-        dataset_dict["skeletons"] = {}
 
-    if "default_skeleton" not in dataset_dict:
-        dataset_dict["default_skeleton"] = None
-
-    db.datasets.replace_one(match_d, dataset_dict)
-
-
-def down(db, dataset_name):
-    match_d = {"name": dataset_name}
-    dataset_dict = db.datasets.find_one(match_d)
-
-    dataset_dict.pop("skeletons", None)
-    dataset_dict.pop("default_skeleton", None)
-
-    db.datasets.replace_one(match_d, dataset_dict)
+def down_pipeline():
+    return [{"$unset": ["skeletons", "default_skeleton"]}]
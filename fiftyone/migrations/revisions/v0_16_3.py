@@ -11,10 +11,5 @@ def up(db, dataset_name):
     pass
 
 
-def down(db, dataset_name):
-    match_d = {"name": dataset_name}
-    dataset_dict = db.datasets.find_one(match_d)
-
-    dataset_dict.pop("tags", None)
-
-    db.datasets.replace_one(match_d, dataset_dict)
+def down_pipeline():
+    return [{"$unset": "tags"}]
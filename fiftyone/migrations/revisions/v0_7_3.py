@@ -5,19 +5,12 @@ FiftyOne v0.7.3 revision.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import fiftyone.migrations.utils as fomu
 
 
-def up(db, dataset_name):
-    match_d = {"name": dataset_name}
-    dataset_dict = db.datasets.find_one(match_d)
-    if "evaluations" not in dataset_dict:
-        dataset_dict["evaluations"] = {}
+def up_pipeline():
+    return [{"$set": {"evaluations": fomu.set_default("evaluations", {})}}]
 
-    db.datasets.replace_one(match_d, dataset_dict)
 
-
-def down(db, dataset_name):
-    match_d = {"name": dataset_name}
-    dataset_dict = db.datasets.find_one(match_d)
-    dataset_dict.pop("evaluations", None)
-    db.datasets.replace_one(match_d, dataset_dict)
+def down_pipeline():
+    return [{"$unset": "evaluations"}]
@@ -6,6 +6,8 @@ FiftyOne migrations runner.
 |
 """
 import bisect
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 import logging
 import os
 from packaging.version import Version as V
@@ -16,6 +18,7 @@ import eta.core.utils as etau
 import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.odm as foo
+import fiftyone.core.utils as fou
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,12 @@ logger = logging.getLogger(__name__)
 DOWN = "down"
 UP = "up"
 
+# The first version of FiftyOne that stored dataset versions
+_FIRST_VERSIONED_REVISION = "0.6.2"
+
+# Default maximum number of datasets that `migrate_all()` migrates at once
+_DEFAULT_NUM_WORKERS = 4
+
 
 def Version(version: str) -> V:
     """Version proxy to ensure only base versions are used (strip rc versions)"""
@@ -61,24 +70,78 @@ def get_dataset_revision(name):
     return dataset_doc.get("version", None)
 
 
-def migrate_all(destination=None, verbose=False):
+def migrate_all(destination=None, verbose=False, num_workers=None):
     """Migrates the database and all datasets to the specified destination
     revision.
 
+    Datasets are migrated concurrently, and each dataset's revision is
+    recorded after every revision that is applied to it, so an interrupted
+    migration can be resumed by calling this method again.
+
     Args:
         destination (None): the destination revision. By default, the
             ``fiftyone`` package version is used
         verbose (False): whether to log incremental migrations that are run
+        num_workers (None): the maximum number of datasets to migrate
+            concurrently. The default is 4
     """
     if destination is None:
         destination = foc.VERSION
 
     migrate_database_if_necessary(destination=destination, verbose=verbose)
 
-    for name in fo.list_datasets():
-        migrate_dataset_if_necessary(
-            name, destination=destination, verbose=verbose
+    if _migrations_disabled():
+        return
+
+    names = fo.list_datasets()
+    if not names:
+        return
+
+    conn = foo.get_db_conn()
+    heads = {
+        d["name"]: d.get("version", None)
+        for d in conn.datasets.find(
+            {"name": {"$in": names}}, {"name": True, "version": True}
         )
+    }
+
+    # Group datasets by their current revision so that each group can be
+    # migrated by a single runner
+    groups = {}
+    for name in names:
+        head = heads.get(name, None) or "0.0"
+        if head == destination:
+            continue
+
+        _validate_dataset_migration(name, head, destination)
+
+        groups.setdefault(head, []).append(name)
+
+    if not groups:
+        return
+
+    num_datasets = sum(len(n) for n in groups.values())
+    logger.info("Migrating %d datasets to v%s", num_datasets, destination)
+
+    errors = {}
+    for head, group_names in groups.items():
+        runner = MigrationRunner(head=head, destination=destination)
+        if runner.has_revisions:
+            errors.update(
+                runner.run_all(
+                    group_names, verbose=verbose, num_workers=num_workers
+                )
+            )
+
+        migrated = [n for n in group_names if n not in errors]
+        _set_dataset_revisions(conn, migrated, destination)
+
+    if errors:
+        name, error = next(iter(errors.items()))
+        raise ValueError(
+            "Failed to migrate %d dataset(s): %s"
+            % (len(errors), ", ".join("'%s'" % n for n in errors))
+        ) from error
 
 
 def migrate_database_if_necessary(destination=None, verbose=False):
@@ -186,28 +249,15 @@ def migrate_dataset_if_necessary(name, destination=None, verbose=False):
     if head == destination:
         return
 
-    if not fo.config.database_admin and destination != foc.VERSION:
-        raise EnvironmentError(
-            "Cannot migrate dataset '%s' from v%s to v%s. Datasets can only "
-            "be migrated to the current revision (v%s) when database_admin=%s."
-            "See https://voxel51.com/docs/fiftyone/user_guide/config.html#database-migrations "
-            "for more information"
-            % (name, head, destination, foc.VERSION, fo.config.database_admin)
-        )
+    _validate_dataset_migration(name, head, destination)
 
     runner = MigrationRunner(head=head, destination=destination)
     if runner.has_revisions:
         logger.info("Migrating dataset '%s' to v%s", name, destination)
         runner.run(name, verbose=verbose)
 
-    if Version(destination) >= Version("0.6.2"):
-        conn = foo.get_db_conn()
-        conn.datasets.update_one(
-            {"name": name}, {"$set": {"version": destination}}
-        )
-    else:
-        # Old version of FiftyOne that didn't store dataset versions
-        pass
+    conn = foo.get_db_conn()
+    _set_dataset_revisions(conn, [name], destination)
 
 
 class MigrationRunner(object):
@@ -300,13 +350,99 @@ class MigrationRunner(object):
             dataset_name: the name of the dataset to migrate
             verbose (False): whether to log incremental migrations that are run
         """
+        errors = self.run_all([dataset_name], verbose=verbose, num_workers=1)
+        if errors:
+            raise errors[dataset_name]
+
+    def run_all(self, dataset_names, verbose=False, num_workers=None):
+        """Runs any required migrations on the specified datasets, which must
+        all currently be at revision :meth:`head`.
+
+        Revisions are applied in order. Revisions that declare an update
+        pipeline via an ``up_pipeline()`` or ``down_pipeline()`` function are
+        applied to all datasets via a single server-side update, while all
+        other revisions are applied to up to ``num_workers`` datasets
+        concurrently.
+
+        After each revision is applied to a dataset, the dataset's revision is
+        updated, so that interrupted migrations can be resumed.
+
+        If a revision fails for a dataset, no further revisions are applied to
+        that dataset, but the other datasets continue to be migrated.
+
+        Args:
+            dataset_names: a list of dataset names
+            verbose (False): whether to log incremental migrations that are run
+            num_workers (None): the maximum number of datasets to migrate
+                concurrently. The default is 4
+
+        Returns:
+            a dict mapping the names of any datasets that could not be
+            migrated to the exceptions that were raised
+        """
+        if num_workers is None:
+            num_workers = _DEFAULT_NUM_WORKERS
+
         conn = foo.get_db_conn()
-        for rev, module in self._revisions:
-            if verbose:
-                logger.info("Running v%s %s migration", rev, self.direction)
+        names = list(dataset_names)
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=max(num_workers, 1)) as executor:
+            for idx, (rev, module) in enumerate(self._revisions):
+                if not names:
+                    break
+
+                if verbose:
+                    logger.info(
+                        "Running v%s %s migration on %d dataset(s)",
+                        rev,
+                        self.direction,
+                        len(names),
+                    )
+
+                # The revision that datasets are at after this revision runs
+                if self.direction == UP:
+                    progress = rev
+                elif idx + 1 < len(self._revisions):
+                    progress = self._revisions[idx + 1][0]
+                else:
+                    progress = self.destination
+
+                module = importlib.import_module(module)
+                pipeline_fcn = getattr(
+                    module, self.direction + "_pipeline", None
+                )
 
-            fcn = etau.get_function(self.direction, module)
-            fcn(conn, dataset_name)
+                if pipeline_fcn is not None:
+                    _run_pipeline_revision(
+                        conn, names, pipeline_fcn(), progress
+                    )
+                    continue
+
+                fcn = getattr(module, self.direction)
+                run_fcn = lambda name: _run_revision(conn, name, fcn, progress)
+
+                quiet = len(names) == 1 or not fo.config.show_progress_bars
+                with fou.ProgressBar(
+                    total=len(names), iters_str="datasets", quiet=quiet
+                ) as pb:
+                    for name, error in pb(
+                        zip(names, executor.map(run_fcn, names))
+                    ):
+                        if error is not None:
+                            logger.warning(
+                                "Failed to run v%s %s migration on dataset "
+                                "'%s': %s",
+                                rev,
+                                self.direction,
+                                name,
+                                error,
+                            )
+                            errors[name] = error
+
+                names = [n for n in names if n not in errors]
+
+        return errors
 
     def run_admin(self, verbose=False):
         """Runs any required admin revisions.
@@ -341,6 +477,48 @@ class DatabaseConfig(etas.Serializable):
         return cls(**d)
 
 
+def _validate_dataset_migration(name, head, destination):
+    if not fo.config.database_admin and destination != foc.VERSION:
+        raise EnvironmentError(
+            "Cannot migrate dataset '%s' from v%s to v%s. Datasets can only "
+            "be migrated to the current revision (v%s) when database_admin=%s. "
+            "See https://voxel51.com/docs/fiftyone/user_guide/config.html#database-migrations "
+            "for more information"
+            % (name, head, destination, foc.VERSION, fo.config.database_admin)
+        )
+
+
+def _run_revision(conn, dataset_name, fcn, progress):
+    try:
+        fcn(conn, dataset_name)
+    except Exception as e:
+        return e
+
+    _set_dataset_revisions(conn, [dataset_name], progress)
+    return None
+
+
+def _run_pipeline_revision(conn, dataset_names, pipeline, progress):
+    pipeline = list(pipeline)
+    if Version(progress) >= Version(_FIRST_VERSIONED_REVISION):
+        pipeline.append({"$set": {"version": progress}})
+
+    conn.datasets.update_many({"name": {"$in": dataset_names}}, pipeline)
+
+
+def _set_dataset_revisions(conn, dataset_names, version):
+    if not dataset_names:
+        return
+
+    if Version(version) < Version(_FIRST_VERSIONED_REVISION):
+        # Old version of FiftyOne that didn't store dataset versions
+        return
+
+    conn.datasets.update_many(
+        {"name": {"$in": dataset_names}}, {"$set": {"version": version}}
+    )
+
+
 def _database_exists():
     client = foo.get_db_client()
     return fo.config.database_name in client.list_database_names()
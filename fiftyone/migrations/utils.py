@@ -0,0 +1,29 @@
+"""
+Migration utilities.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+
+
+def set_default(field, value):
+    """Returns an aggregation expression that evaluates to the given field of
+    a document, or to the given default value if the field is missing.
+
+    This is intended for use in the ``$set`` stages of revision pipelines.
+
+    Args:
+        field: the name of the field
+        value: the default value
+
+    Returns:
+        an aggregation expression
+    """
+    return {
+        "$cond": [
+            {"$eq": [{"$type": "$" + field}, "missing"]},
+            {"$literal": value},
+            "$" + field,
+        ]
+    }
@@ -26,6 +26,7 @@ from fiftyone.core.session.events import (
 import fiftyone.core.state as fos
 from fiftyone.core.view import DatasetView
 from fiftyone.server.query import serialize_dataset
+import fiftyone.server.view as fosv
 
 
 @dataclass(frozen=True)
@@ -39,6 +40,7 @@ _polling_listener: t.Optional[
     t.Tuple[str, t.Set[t.Tuple[str, Listener]]]
 ] = None
 _state: t.Optional[fos.StateDescription] = None
+_state_version = 0
 _app_count = 0
 
 
@@ -53,7 +55,13 @@ async def dispatch_event(
     """
     if isinstance(event, StateUpdate):
         global _state
+        global _state_version
         _state = event.state
+        _state_version += 1
+        event.version = _state_version
+
+        # The dataset may have been modified by the sender
+        fosv.clear_view_cache()
 
     events = []
     for listener in _listeners[event.get_event_name()]:
@@ -81,7 +89,7 @@ async def add_event_listener(
     try:
         if data.is_app:
             d = asdict(
-                StateUpdate(state=data.state),
+                StateUpdate(state=data.state, version=_state_version),
                 dict_factory=dict_factory,
             )
             if data.state.dataset is not None:
@@ -170,7 +178,7 @@ async def dispatch_polling_event_listener(
                 {
                     "event": StateUpdate.get_event_name(),
                     "data": asdict(
-                        StateUpdate(state=data.state),
+                        StateUpdate(state=data.state, version=_state_version),
                         dict_factory=dict_factory,
                     ),
                 }
@@ -198,6 +206,16 @@ async def dispatch_polling_event_listener(
     }
 
 
+def get_state_version() -> int:
+    """Get the version of the current state description on the server, which
+    is incremented whenever the state is updated
+
+    Returns:
+        the state version
+    """
+    return _state_version
+
+
 def get_state() -> fos.StateDescription:
     """Get the current state description singleton on the server
 
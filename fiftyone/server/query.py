@@ -31,6 +31,7 @@ from fiftyone.server.dataloader import get_dataloader_resolver
 from fiftyone.server.mixins import HasCollection
 from fiftyone.server.paginator import Connection, get_paginator_resolver
 from fiftyone.server.scalars import BSONArray
+import fiftyone.server.view as fosv
 
 ID = gql.scalar(
     t.NewType("ID", str),
@@ -175,6 +176,9 @@ class Dataset(HasCollection):
 
         ds = fo.load_dataset(name)
         ds.reload()
+
+        # The App refetches the dataset when it may have changed
+        fosv.clear_view_cache(name)
         view = fov.DatasetView._build(ds, view or [])
         if view._dataset != ds:
             d = view._dataset._serialize()
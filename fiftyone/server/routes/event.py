@@ -13,15 +13,32 @@ from starlette.requests import Request
 import fiftyone.core.session.events as fose
 
 from fiftyone.server.decorators import route
-from fiftyone.server.events import dispatch_event
+from fiftyone.server.events import (
+    dispatch_event,
+    get_state,
+    get_state_version,
+)
 
 
 class Event(HTTPEndpoint):
     @route
     async def post(self, request: Request, data: t.Dict) -> t.Dict:
-        await dispatch_event(
-            data["subscription"],
-            fose.Event.from_data(data["event"], data["data"]),
-        )
+        event = fose.Event.from_data(data["event"], data["data"])
 
-        return {}
+        if isinstance(event, fose.StatePatch):
+            # Patches can only be applied to the state they were generated
+            # from, otherwise the client must resend its full state
+            if event.version != get_state_version():
+                return {"resync": True}
+
+            state = get_state()
+            try:
+                state.apply_patch(event.patch)
+            except ValueError:
+                return {"resync": True}
+
+            event = fose.StateUpdate(state=state)
+
+        await dispatch_event(data["subscription"], event)
+
+        return {"version": get_state_version()}
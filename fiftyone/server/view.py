@@ -5,12 +5,20 @@ FiftyOne Server view
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import OrderedDict
+import hashlib
+import threading
+import time
+
+from bson import json_util
 from numpy import full
+
 import fiftyone.core.dataset as fod
 from fiftyone.core.expressions import ViewField as F, VALUE
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
 import fiftyone.core.stages as fosg
 import fiftyone.core.utils as fou
 import fiftyone.core.view as fov
@@ -20,6 +28,11 @@ from fiftyone.server.utils import iter_label_fields
 
 _LABEL_TAGS = "_label_tags"
 
+_VIEW_CACHE_SIZE = 32
+_VIEW_CACHE_TTL = 10  # seconds
+_view_cache = OrderedDict()
+_view_cache_lock = threading.Lock()
+
 
 def get_view(
     dataset_name,
@@ -42,11 +55,7 @@ def get_view(
             labels
         similarity (None): sort by similarity paramters
     """
-    view = fod.load_dataset(dataset_name)
-    view.reload()
-
-    if stages:
-        view = fov.DatasetView._build(view, stages)
+    view = _get_cached_view(dataset_name, stages)
 
     if filters or similarity or count_label_tags:
         view = get_extended_view(
@@ -60,6 +69,83 @@ def get_view(
     return view
 
 
+def clear_view_cache(dataset_name=None):
+    """Clears the cache of views that :func:`get_view` maintains.
+
+    The cache is cleared whenever the App's state changes, since that is when
+    the dataset is most likely to have been modified by another process.
+
+    Args:
+        dataset_name (None): the name of a dataset whose views to clear. By
+            default, all views are cleared
+    """
+    with _view_cache_lock:
+        if dataset_name is None:
+            _view_cache.clear()
+            return
+
+        for key in list(_view_cache.keys()):
+            if key[0] == dataset_name:
+                _view_cache.pop(key)
+
+
+def _get_cached_view(dataset_name, stages):
+    # Views are cached by their dataset and stages. Entries are served without
+    # querying the database for `_VIEW_CACHE_TTL` seconds, after which they are
+    # only rebuilt if the dataset's document has changed
+    key = _get_view_key(dataset_name, stages)
+    now = time.monotonic()
+
+    with _view_cache_lock:
+        entry = _view_cache.get(key, None)
+        if entry is not None:
+            _view_cache.move_to_end(key)
+
+    if entry is not None:
+        token, checked_at, view = entry
+        if now - checked_at < _VIEW_CACHE_TTL:
+            return view
+
+        curr_token = _get_dataset_token(dataset_name)
+        if curr_token == token:
+            with _view_cache_lock:
+                _view_cache[key] = (token, now, view)
+
+            return view
+    else:
+        curr_token = _get_dataset_token(dataset_name)
+
+    view = fod.load_dataset(dataset_name)
+    view.reload()
+
+    if stages:
+        view = fov.DatasetView._build(view, stages)
+
+        # Compile the view's stages now so that extended views of it only
+        # need to compile their additional stages
+        view._get_stage_pipelines()
+
+    with _view_cache_lock:
+        _view_cache[key] = (curr_token, now, view)
+        _view_cache.move_to_end(key)
+        while len(_view_cache) > _VIEW_CACHE_SIZE:
+            _view_cache.popitem(last=False)
+
+    return view
+
+
+def _get_view_key(dataset_name, stages):
+    h = hashlib.md5(json_util.dumps(stages or [], sort_keys=True).encode())
+    return dataset_name, h.hexdigest()
+
+
+def _get_dataset_token(dataset_name):
+    conn = foo.get_db_conn()
+    return conn.datasets.find_one(
+        {"name": dataset_name}, {"last_loaded_at": False}
+    )
+
+
 def get_extended_view(
     view,
     filters=None,
@@ -6,11 +6,17 @@ Dataset exporters.
 |
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import inspect
 import logging
 import os
+import threading
+import timeit
 import warnings
 
+from datetime import datetime
+
 from bson import json_util
 import numpy as np
 
@@ -28,6 +34,7 @@ import fiftyone.core.labels as fol
 import fiftyone.core.metadata as fom
 import fiftyone.core.media as fomm
 import fiftyone.core.odm as foo
+import fiftyone.core.profiling as fopf
 import fiftyone.core.utils as fou
 import fiftyone.utils.eta as foue
 import fiftyone.utils.patches as foup
@@ -44,6 +51,9 @@ from .parsers import (
 
 logger = logging.getLogger(__name__)
 
+# Hidden file in which resumable media exports record the files they write
+_RESUME_MANIFEST_FILENAME = ".fiftyone_media.json"
+
 
 def export_samples(
     samples,
@@ -345,6 +355,7 @@ def export_samples(
     )
 
 
+@fopf.stage("export_samples")
 def write_dataset(
     samples,
     sample_parser,
@@ -753,7 +764,7 @@ def _write_batch_dataset(dataset_exporter, samples):
             % (type(dataset_exporter), foc.SampleCollection)
         )
 
-    with dataset_exporter:
+    with fopf.stage("export_samples"), dataset_exporter:
         dataset_exporter.export_samples(samples)
 
 
@@ -972,6 +983,15 @@ class MediaExporter(object):
             output paths
         ignore_exts (False): whether to omit file extensions when generating
             UUIDs for files
+        num_workers (None): the number of threads to use when copying or
+            writing media files. By default,
+            ``fiftyone.config.media_export_workers`` is used
+        resume (None): whether to resume a previous export into the same
+            directory. When enabled, the media files written are recorded in
+            a hidden manifest in the output directory, and recorded files
+            whose source media has not changed are not copied again. Other
+            existing files are never overwritten. By default,
+            ``fiftyone.config.media_export_resume`` is used
     """
 
     def __init__(
@@ -981,6 +1001,8 @@ class MediaExporter(object):
         supported_modes=None,
         default_ext=None,
         ignore_exts=False,
+        num_workers=None,
+        resume=None,
     ):
         if supported_modes is None:
             supported_modes = (True, False, "move", "symlink", "manifest")
@@ -994,15 +1016,63 @@ class MediaExporter(object):
         if export_path is not None:
             export_path = fou.normalize_path(export_path)
 
+        if num_workers is None:
+            num_workers = fo.config.media_export_workers
+
+        if num_workers is None:
+            num_workers = 1
+
+        if resume is None:
+            resume = fo.config.media_export_resume
+
         self.export_mode = export_mode
         self.export_path = export_path
         self.supported_modes = supported_modes
         self.default_ext = default_ext
         self.ignore_exts = ignore_exts
+        self.num_workers = num_workers
+        self.resume = resume
 
         self._filename_maker = None
         self._manifest = None
         self._manifest_path = None
+        self._resume_path = None
+        self._resume_records = None
+        self._executor = None
+        self._slots = None
+        self._num_pending = 0
+        self._error = None
+        self._exported = None
+        self._lock = threading.Lock()
+        self._start_time = None
+        self._metrics = None
+
+    @property
+    def metrics(self):
+        """A dict of throughput metrics for the media exported so far.
+
+        The dict contains the following keys:
+
+        -   ``num_files``: the number of media files written
+        -   ``num_skipped``: the number of media files whose existing outputs
+            were reused
+        -   ``num_bytes``: the number of bytes written
+        -   ``duration``: the elapsed time, in seconds
+        -   ``bytes_per_sec``: the write throughput, in bytes per second
+        """
+        if self._metrics is None:
+            return None
+
+        with self._lock:
+            metrics = dict(self._metrics)
+
+        duration = timeit.default_timer() - self._start_time
+        metrics["duration"] = duration
+        metrics["bytes_per_sec"] = (
+            metrics["num_bytes"] / duration if duration > 0 else 0.0
+        )
+
+        return metrics
 
     def _write_media(self, media, outpath):
         raise NotImplementedError("subclass must implement _write_media()")
@@ -1028,6 +1098,8 @@ class MediaExporter(object):
         output_dir = None
         manifest_path = None
         manifest = None
+        resume_path = None
+        resume_records = None
 
         if self.export_mode in (True, "move", "symlink"):
             output_dir = self.export_path
@@ -1035,13 +1107,31 @@ class MediaExporter(object):
             manifest_path = self.export_path
             manifest = {}
 
+        if self.resume and self.export_mode in (True, "symlink"):
+            resume_path = os.path.join(output_dir, _RESUME_MANIFEST_FILENAME)
+            resume_records = _read_resume_manifest(resume_path)
+
         self._filename_maker = fou.UniqueFilenameMaker(
             output_dir=output_dir,
             default_ext=self.default_ext,
             ignore_exts=self.ignore_exts,
+            ignore_filenames=resume_records,
         )
         self._manifest_path = manifest_path
         self._manifest = manifest
+        self._resume_path = resume_path
+        self._resume_records = resume_records
+
+        if self.export_mode == True and self.num_workers > 1:
+            # Bound the number of pending writes so that in-memory media
+            # cannot accumulate faster than it can be written
+            self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
+            self._slots = threading.BoundedSemaphore(4 * self.num_workers)
+
+        self._error = None
+        self._exported = set()
+        self._start_time = timeit.default_timer()
+        self._metrics = {"num_files": 0, "num_skipped": 0, "num_bytes": 0}
 
     def export(self, media_or_path, outpath=None):
         """Exports the given media.
@@ -1058,6 +1148,8 @@ class MediaExporter(object):
             -   the path to the exported media
             -   the UUID of the exported media
         """
+        self._raise_error()
+
         if etau.is_str(media_or_path):
             media_path = media_or_path
 
@@ -1071,11 +1163,13 @@ class MediaExporter(object):
                 uuid = self._get_uuid(media_path)
 
             if self.export_mode == True:
-                etau.copy_file(media_path, outpath)
+                if (media_path, outpath) not in self._exported:
+                    self._exported.add((media_path, outpath))
+                    self._submit(self._copy_file, media_path, outpath)
             elif self.export_mode == "move":
                 etau.move_file(media_path, outpath)
             elif self.export_mode == "symlink":
-                etau.symlink_file(media_path, outpath)
+                self._symlink_file(media_path, outpath)
             elif self.export_mode == "manifest":
                 outpath = None
                 self._manifest[uuid] = media_path
@@ -1088,7 +1182,7 @@ class MediaExporter(object):
             uuid = self._get_uuid(outpath)
 
             if self.export_mode == True:
-                self._write_media(media, outpath)
+                self._submit(self._write_media_file, media, outpath)
             elif self.export_mode != False:
                 raise ValueError(
                     "Cannot export in-memory media when 'export_mode=%s'"
@@ -1099,9 +1193,141 @@ class MediaExporter(object):
 
     def close(self):
         """Performs any necessary actions to complete the export."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._slots = None
+
         if self.export_mode == "manifest":
             etas.write_json(self._manifest, self._manifest_path)
 
+        if self._resume_records is not None:
+            etas.write_json(self._resume_records, self._resume_path)
+
+        if self._metrics is not None:
+            metrics = self.metrics
+
+            fopf.increment("media_files", metrics["num_files"])
+            fopf.increment("media_skipped", metrics["num_skipped"])
+            fopf.increment("media_bytes", metrics["num_bytes"])
+
+            logger.debug(
+                "Exported %d media files (%d skipped, %d bytes) in %.2fs "
+                "(%.1f MB/s)",
+                metrics["num_files"],
+                metrics["num_skipped"],
+                metrics["num_bytes"],
+                metrics["duration"],
+                metrics["bytes_per_sec"] / 1e6,
+            )
+
+        self._raise_error()
+
+    def _submit(self, fcn, *args):
+        if self._executor is None:
+            fcn(*args)
+            return
+
+        self._slots.acquire()
+        try:
+            # Workers run in a copy of the current context so that their
+            # metrics are attributed to the caller's stage
+            ctx = contextvars.copy_context()
+            future = self._executor.submit(ctx.run, fcn, *args)
+        except:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._num_pending += 1
+            num_pending = self._num_pending
+
+        fopf.set_gauge("media_queue_depth", num_pending)
+
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        with self._lock:
+            self._num_pending -= 1
+
+        self._slots.release()
+
+        e = future.exception()
+        if e is not None:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+
+    def _raise_error(self):
+        with self._lock:
+            e = self._error
+            self._error = None
+
+        if e is not None:
+            raise e
+
+    def _record(self, outpath, num_bytes=None, record=None):
+        with self._lock:
+            if num_bytes is None:
+                self._metrics["num_skipped"] += 1
+            else:
+                self._metrics["num_files"] += 1
+                self._metrics["num_bytes"] += num_bytes
+
+            if self._resume_records is not None:
+                filename = os.path.relpath(outpath, self.export_path)
+                self._resume_records[filename] = record
+
+    def _is_resumable(self, outpath, record):
+        if self._resume_records is None:
+            return False
+
+        filename = os.path.relpath(outpath, self.export_path)
+        with self._lock:
+            return self._resume_records.get(filename, None) == record
+
+    def _copy_file(self, inpath, outpath):
+        st = os.stat(inpath)
+        record = [inpath, st.st_size, st.st_mtime]
+
+        if self._is_resumable(outpath, record) and _is_file(outpath, st):
+            self._record(outpath, record=record)
+            return
+
+        etau.copy_file(inpath, outpath)
+        self._record(outpath, num_bytes=st.st_size, record=record)
+
+    def _symlink_file(self, inpath, outpath):
+        record = [inpath, None, None]
+
+        if self._is_resumable(outpath, record) and os.path.islink(outpath):
+            if os.readlink(outpath) == os.path.realpath(inpath):
+                self._record(outpath, record=record)
+                return
+
+        etau.symlink_file(inpath, outpath)
+        self._record(outpath, num_bytes=0, record=record)
+
+    def _write_media_file(self, media, outpath):
+        self._write_media(media, outpath)
+
+        num_bytes = os.path.getsize(outpath)
+        self._record(outpath, num_bytes=num_bytes, record=[None, None, None])
+
+
+def _read_resume_manifest(resume_path):
+    if not os.path.isfile(resume_path):
+        return {}
+
+    return etas.read_json(resume_path)
+
+
+def _is_file(outpath, st):
+    try:
+        return os.path.getsize(outpath) == st.st_size
+    except OSError:
+        return False
+
 
 class ImageExporter(MediaExporter):
     """Utility class for :class:`DatasetExporter` instances that export images.
@@ -1157,7 +1383,14 @@ class DatasetExporter(object):
         return self
 
     def __exit__(self, *args):
-        self.close(*args)
+        try:
+            self.close(*args)
+        except Exception:
+            # Don't mask the error that interrupted the export, if any
+            if args[0] is None:
+                raise
+
+            logger.warning("Failed to close exporter", exc_info=True)
 
     def setup(self):
         """Performs any necessary setup before exporting the first sample in
@@ -1670,16 +1903,37 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             lives in a single directory and you wish to serialize relative,
             rather than absolute, paths to the data within that directory.
             Only applicable when ``export_media`` is False
+        incremental (False): whether to update an existing export in
+            ``export_dir`` by only serializing the records (and frames) and
+            exporting the media of samples that were added or modified since
+            the previous export. Records of deleted samples and their media
+            are removed. Changes are detected via
+            :meth:`fiftyone.core.collections.SampleCollection.changes_since`,
+            so datasets without
+            :meth:`change tracking <fiftyone.core.dataset.Dataset.enable_change_tracking>`
+            have all of their records rewritten, although unchanged media is
+            still reused. A ``manifest.json`` file is maintained in
+            ``export_dir`` to track the contents of each sample. Not supported
+            when ``export_media="move"``
     """
 
-    def __init__(self, export_dir, export_media=None, rel_dir=None):
+    def __init__(
+        self, export_dir, export_media=None, rel_dir=None, incremental=False
+    ):
         if export_media is None:
             export_media = True
 
+        if incremental and export_media == "move":
+            raise ValueError(
+                "Incremental exports are not supported when "
+                "`export_media='move'`"
+            )
+
         super().__init__(export_dir=export_dir)
 
         self.export_media = export_media
         self.rel_dir = rel_dir
+        self.incremental = incremental
 
         self._data_dir = None
         self._anno_dir = None
@@ -1688,6 +1942,8 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self._metadata_path = None
         self._samples_path = None
         self._frames_path = None
+        self._manifest_path = None
+        self._rel_data_dir = None
         self._media_exporter = None
 
     def setup(self):
@@ -1698,17 +1954,66 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self._metadata_path = os.path.join(self.export_dir, "metadata.json")
         self._samples_path = os.path.join(self.export_dir, "samples.json")
         self._frames_path = os.path.join(self.export_dir, "frames.json")
+        self._manifest_path = os.path.join(self.export_dir, "manifest.json")
+        self._rel_data_dir = os.path.relpath(self._data_dir, self.export_dir)
+
+        # Incremental exports always reuse existing media that is unchanged
+        resume = True if self.incremental else None
 
         self._media_exporter = MediaExporter(
             self.export_media,
             export_path=self._data_dir,
             supported_modes=(True, False, "move", "symlink"),
+            resume=resume,
         )
         self._media_exporter.setup()
 
     def export_samples(self, sample_collection):
         etau.ensure_dir(self.export_dir)
 
+        if self.incremental:
+            self._export_samples_incremental(sample_collection)
+        else:
+            self._export_samples(sample_collection)
+
+        if sample_collection.media_type == fomm.VIDEO and not self.incremental:
+            logger.info("Exporting frames...")
+            coll, pipeline = fod._get_frames_pipeline(sample_collection)
+            num_frames = foo.count_documents(coll, pipeline)
+            frames = foo.aggregate(coll, pipeline)
+            foo.export_collection(
+                frames, self._frames_path, key="frames", num_docs=num_frames
+            )
+
+        conn = foo.get_db_conn()
+        dataset = sample_collection._dataset
+        dataset_dict = conn.datasets.find_one({"name": dataset.name})
+
+        # Exporting runs only makes sense if the entire dataset is being
+        # exported, otherwise the view for the run cannot be reconstructed
+        # based on the information encoded in the run's document
+
+        export_runs = sample_collection == sample_collection._root_dataset
+
+        if not export_runs:
+            dataset_dict["annotation_runs"] = {}
+            dataset_dict["brain_methods"] = {}
+            dataset_dict["evaluations"] = {}
+
+        foo.export_document(dataset_dict, self._metadata_path)
+
+        if export_runs and sample_collection.has_annotation_runs:
+            _export_annotation_results(sample_collection, self._anno_dir)
+
+        if export_runs and sample_collection.has_brain_runs:
+            _export_brain_results(sample_collection, self._brain_dir)
+
+        if export_runs and sample_collection.has_evaluations:
+            _export_evaluation_results(sample_collection, self._eval_dir)
+
+        self._media_exporter.close()
+
+    def _export_samples(self, sample_collection):
         inpaths = sample_collection.values("filepath")
 
         if self.export_media != False:
@@ -1720,7 +2025,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             outpaths = [self._media_exporter.export(p)[0] for p in inpaths]
 
             # Replace filepath prefixes with `data/` for samples export
-            _outpaths = ["data/" + os.path.basename(p) for p in outpaths]
+            _outpaths = [self._get_rel_outpath(p) for p in outpaths]
         elif self.rel_dir is not None:
             # Remove `rel_dir` prefix from filepaths
             rel_dir = fou.normalize_path(self.rel_dir) + os.path.sep
@@ -1747,42 +2052,365 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             samples, self._samples_path, key="samples", num_docs=num_samples
         )
 
+        # A manifest from a previous incremental export is no longer valid
+        if os.path.isfile(self._manifest_path):
+            etau.delete_file(self._manifest_path)
+
+    def _get_rel_outpath(self, outpath):
+        return self._rel_data_dir + "/" + os.path.basename(outpath)
+
+    def _export_samples_incremental(self, sample_collection):
+        # The manifest records, for each sample ID, a list of:
+        #   [offset, length, frames_offset, frames_length, filepath, outpath]
+        # where `offset` and `length` locate the sample's serialized record in
+        # `samples.json`, `frames_offset` and `frames_length` locate its
+        # serialized frames in `frames.json` (if any), `filepath` is the
+        # source media path and `outpath` is the path that was serialized in
+        # the record
+        started_at = datetime.utcnow()
+        is_video = sample_collection.media_type == fomm.VIDEO
+        tracks_changes = sample_collection._dataset.tracks_changes
+        settings = self._get_manifest_settings(sample_collection)
+
+        prev_samples, exported_at = self._read_manifest(settings, is_video)
+
+        if self.export_media != False:
+            if self.rel_dir is not None:
+                logger.warning(
+                    "Ignoring `rel_dir` since `export_media` is True"
+                )
+
+            rel_dir = None
+        elif self.rel_dir is not None:
+            rel_dir = fou.normalize_path(self.rel_dir) + os.path.sep
+        else:
+            rel_dir = None
+
+        # Media exported by previous exports can be reused by any sample that
+        # shares its source path, and no new media may overwrite it
+        media_outpaths = {}
+        reserved_outpaths = set()
+        if self.export_media != False:
+            for prev in prev_samples.values():
+                filepath, outpath = prev[4:]
+                media_outpaths[filepath] = outpath
+                reserved_outpaths.add(outpath)
+
+        sample_ids = sample_collection.values("id")
+
+        # Only the samples that changed since the previous export began are
+        # loaded from the database
+        if exported_at is not None and tracks_changes:
+            changed_view = sample_collection.changes_since(exported_at)
+        else:
+            if prev_samples:
+                logger.info(
+                    "Unable to detect changes since the previous export; all "
+                    "samples will be rewritten"
+                )
+
+            changed_view = sample_collection.view()
+            prev_samples = {}
+
+        logger.info("Exporting samples...")
+
+        coll, pipeline = fod._get_samples_pipeline(changed_view)
+        docs = foo.aggregate(coll, pipeline)
+
+        if is_video:
+            # Frames are grouped by sample since they are aggregated via a view
+            coll, pipeline = fod._get_frames_pipeline(changed_view)
+            frames = _PeekableIterator(foo.aggregate(coll, pipeline))
+        else:
+            frames = None
+
+        samples = {}
+        exported_paths = set()
+        num_new = 0
+        num_modified = 0
+
+        writer = _IncrementalWriter(self._samples_path, "samples")
+        if is_video:
+            frames_writer = _IncrementalWriter(self._frames_path, "frames")
+        else:
+            frames_writer = None
+
+        try:
+            doc = next(docs, None)
+            with fou.ProgressBar(total=len(sample_ids)) as pb:
+                for sample_id in pb(sample_ids):
+                    prev = prev_samples.get(sample_id, None)
+
+                    if doc is not None and str(doc["_id"]) == sample_id:
+                        sample_doc = doc
+                        sample_frames = _iter_sample_frames(frames, sample_id)
+                        doc = next(docs, None)
+                    elif prev is None:
+                        # New samples that were not stamped as changed
+                        sample_doc, sample_frames = _load_sample(
+                            sample_collection, sample_id
+                        )
+                        if sample_doc is None:
+                            # The sample was deleted during the export
+                            continue
+                    else:
+                        sample_doc = None
+
+                    if sample_doc is None:
+                        filepath = prev[4]
+                    else:
+                        filepath = sample_doc["filepath"]
+                        if prev is None:
+                            num_new += 1
+                        else:
+                            num_modified += 1
+
+                    if self.export_media != False:
+                        outpath = self._export_media_incremental(
+                            filepath,
+                            sample_id,
+                            sample_doc is None,
+                            media_outpaths,
+                            reserved_outpaths,
+                            exported_paths,
+                        )
+                    elif rel_dir is not None and filepath.startswith(rel_dir):
+                        outpath = filepath[len(rel_dir) :]
+                    else:
+                        outpath = filepath
+
+                    if sample_doc is None:
+                        offset, length = writer.copy(prev[0], prev[1])
+                    else:
+                        sample_doc["filepath"] = outpath
+                        offset, length = writer.write(
+                            json_util.dumps(sample_doc).encode()
+                        )
+
+                    if frames_writer is None:
+                        frames_offset, frames_length = None, None
+                    elif sample_doc is None:
+                        frames_offset, frames_length = frames_writer.copy(
+                            prev[2], prev[3]
+                        )
+                    else:
+                        frames_offset, frames_length = frames_writer.write(
+                            b",".join(
+                                json_util.dumps(f).encode()
+                                for f in sample_frames
+                            )
+                        )
+
+                    samples[sample_id] = [
+                        offset,
+                        length,
+                        frames_offset,
+                        frames_length,
+                        filepath,
+                        outpath,
+                    ]
+
+            writer.commit()
+            if frames_writer is not None:
+                frames_writer.commit()
+        finally:
+            writer.close()
+            if frames_writer is not None:
+                frames_writer.close()
+
+        num_deleted = len(set(prev_samples.keys()) - set(samples.keys()))
+
+        if self.export_media != False:
+            # Delete media that is no longer referenced by any sample
+            outpaths = set(s[5] for s in samples.values())
+            for outpath in reserved_outpaths - outpaths:
+                etau.delete_file(os.path.join(self.export_dir, outpath))
+
+        logger.info(
+            "Wrote %d new and %d modified samples and removed %d deleted "
+            "samples",
+            num_new,
+            num_modified,
+            num_deleted,
+        )
+
+        manifest = dict(settings)
+        manifest["exported_at"] = started_at.isoformat()
+        manifest["samples_size"] = os.path.getsize(self._samples_path)
+        if is_video:
+            manifest["frames_size"] = os.path.getsize(self._frames_path)
+
+        manifest["samples"] = samples
+        etas.write_json(manifest, self._manifest_path)
+
+    def _get_manifest_settings(self, sample_collection):
+        # Records that were serialized under different settings, views, or
+        # schemas cannot be reused
+        view = sample_collection.view()
+        settings = {
+            "export_media": self.export_media,
+            "rel_dir": self.rel_dir,
+            "view": json_util.dumps(view._serialize(include_uuids=False)),
+            "schema": json_util.dumps(view._serialize_field_schema()),
+        }
+
         if sample_collection.media_type == fomm.VIDEO:
-            logger.info("Exporting frames...")
-            coll, pipeline = fod._get_frames_pipeline(sample_collection)
-            num_frames = foo.count_documents(coll, pipeline)
-            frames = foo.aggregate(coll, pipeline)
-            foo.export_collection(
-                frames, self._frames_path, key="frames", num_docs=num_frames
+            settings["frame_schema"] = json_util.dumps(
+                view._serialize_frame_field_schema()
             )
 
-        conn = foo.get_db_conn()
-        dataset = sample_collection._dataset
-        dataset_dict = conn.datasets.find_one({"name": dataset.name})
+        return settings
 
-        # Exporting runs only makes sense if the entire dataset is being
-        # exported, otherwise the view for the run cannot be reconstructed
-        # based on the information encoded in the run's document
+    def _read_manifest(self, settings, is_video):
+        if not os.path.isfile(self._manifest_path) or not os.path.isfile(
+            self._samples_path
+        ):
+            return {}, None
 
-        export_runs = sample_collection == sample_collection._root_dataset
+        manifest = etas.read_json(self._manifest_path)
 
-        if not export_runs:
-            dataset_dict["annotation_runs"] = {}
-            dataset_dict["brain_methods"] = {}
-            dataset_dict["evaluations"] = {}
+        is_valid = all(manifest.get(k, None) == v for k, v in settings.items())
+        is_valid &= manifest.get("samples_size", None) == os.path.getsize(
+            self._samples_path
+        )
+        if is_video:
+            is_valid &= os.path.isfile(self._frames_path) and manifest.get(
+                "frames_size", None
+            ) == os.path.getsize(self._frames_path)
 
-        foo.export_document(dataset_dict, self._metadata_path)
+        samples = manifest.get("samples", {})
 
-        if export_runs and sample_collection.has_annotation_runs:
-            _export_annotation_results(sample_collection, self._anno_dir)
+        if not is_valid:
+            logger.info(
+                "Existing export in '%s' does not match its manifest or "
+                "export settings; all samples will be rewritten",
+                self.export_dir,
+            )
 
-        if export_runs and sample_collection.has_brain_runs:
-            _export_brain_results(sample_collection, self._brain_dir)
+            # Existing media can still be reused
+            return samples, None
 
-        if export_runs and sample_collection.has_evaluations:
-            _export_evaluation_results(sample_collection, self._eval_dir)
+        exported_at = manifest.get("exported_at", None)
+        if exported_at is not None:
+            exported_at = datetime.fromisoformat(exported_at)
 
-        self._media_exporter.close()
+        return samples, exported_at
+
+    def _export_media_incremental(
+        self,
+        filepath,
+        sample_id,
+        unchanged,
+        media_outpaths,
+        reserved_outpaths,
+        exported_paths,
+    ):
+        outpath = media_outpaths.get(filepath, None)
+
+        if outpath is None:
+            filename_maker = self._media_exporter._filename_maker
+            outpath = self._get_rel_outpath(
+                filename_maker.get_output_path(filepath)
+            )
+
+            if outpath in reserved_outpaths:
+                name, ext = os.path.splitext(outpath)
+                outpath = name + "-" + sample_id + ext
+
+            media_outpaths[filepath] = outpath
+            unchanged = False
+
+        if filepath in exported_paths:
+            return outpath
+
+        exported_paths.add(filepath)
+
+        abs_outpath = os.path.join(self.export_dir, outpath)
+        if not unchanged or not os.path.lexists(abs_outpath):
+            self._media_exporter.export(filepath, outpath=abs_outpath)
+
+        return outpath
+
+
+class _IncrementalWriter(object):
+    """Writes a ``{"<key>": [...]}`` JSON file of serialized records that may
+    be copied from the previous version of the file, which is replaced when
+    the writer is committed.
+    """
+
+    def __init__(self, path, key):
+        self.path = path
+        self._tmp_path = path + ".tmp"
+        self._prev_f = open(path, "rb") if os.path.isfile(path) else None
+        self._f = open(self._tmp_path, "wb")
+        self._f.write(b'{"%s": [' % key.encode())
+        self._empty = True
+
+    def copy(self, offset, length):
+        self._prev_f.seek(offset)
+        return self.write(self._prev_f.read(length))
+
+    def write(self, data):
+        if not data:
+            return self._f.tell(), 0
+
+        if not self._empty:
+            self._f.write(b",")
+
+        self._empty = False
+
+        offset = self._f.tell()
+        self._f.write(data)
+        return offset, len(data)
+
+    def commit(self):
+        self._f.write(b"]}")
+        self._f.close()
+        os.replace(self._tmp_path, self.path)
+
+    def close(self):
+        if self._prev_f is not None:
+            self._prev_f.close()
+
+        if not self._f.closed:
+            self._f.close()
+            etau.delete_file(self._tmp_path)
+
+
+class _PeekableIterator(object):
+    def __init__(self, iterable):
+        self._it = iter(iterable)
+        self._next = next(self._it, None)
+
+    def peek(self):
+        return self._next
+
+    def __next__(self):
+        value = self._next
+        self._next = next(self._it, None)
+        return value
+
+
+def _iter_sample_frames(frames, sample_id):
+    while True:
+        frame = frames.peek()
+        if frame is None or str(frame["_sample_id"]) != sample_id:
+            return
+
+        yield next(frames)
+
+
+def _load_sample(sample_collection, sample_id):
+    view = sample_collection.select(sample_id)
+
+    coll, pipeline = fod._get_samples_pipeline(view)
+    doc = next(foo.aggregate(coll, pipeline), None)
+
+    if doc is None or sample_collection.media_type != fomm.VIDEO:
+        return doc, []
+
+    coll, pipeline = fod._get_frames_pipeline(view)
+    return doc, list(foo.aggregate(coll, pipeline))
 
 
 def _export_annotation_results(sample_collection, anno_dir):
@@ -2737,7 +3365,7 @@ class ImageSegmentationDirectoryExporter(
             return  # unlabeled
 
         if isinstance(label, fol.Segmentation):
-            mask = label.mask
+            mask = label.get_mask()
         elif isinstance(label, (fol.Detections, fol.Polylines)):
             if self.mask_size is not None:
                 frame_size = self.mask_size
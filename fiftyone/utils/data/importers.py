@@ -29,6 +29,7 @@ import fiftyone.core.labels as fol
 import fiftyone.core.metadata as fom
 import fiftyone.core.media as fomm
 import fiftyone.core.odm as foo
+import fiftyone.core.profiling as fopf
 import fiftyone.core.runs as fors
 from fiftyone.core.sample import Sample
 import fiftyone.core.utils as fou
@@ -108,14 +109,14 @@ def import_samples(
                 BatchDatasetImporter,
             )
 
-        with dataset_importer:
+        with fopf.stage("import_samples"), dataset_importer:
             return dataset_importer.import_samples(dataset, tags=tags)
 
     #
     # Non-batch imports
     #
 
-    with dataset_importer:
+    with fopf.stage("import_samples"), dataset_importer:
         parse_sample, expand_schema = _build_parse_sample_fcn(
             dataset, dataset_importer, label_field, tags, expand_schema
         )
@@ -259,7 +260,7 @@ def merge_samples(
 
     if isinstance(dataset_importer, BatchDatasetImporter):
         tmp = fod.Dataset()
-        with dataset_importer:
+        with fopf.stage("merge_samples"), dataset_importer:
             dataset_importer.import_samples(tmp, tags=tags)
 
         dataset.merge_samples(
@@ -285,7 +286,7 @@ def merge_samples(
     # Non-batch imports
     #
 
-    with dataset_importer:
+    with fopf.stage("merge_samples"), dataset_importer:
         parse_sample, expand_schema = _build_parse_sample_fcn(
             dataset, dataset_importer, label_field, tags, expand_schema
         )
@@ -16,11 +16,13 @@ from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.plots as fop
+import fiftyone.core.profiling as fopf
 import fiftyone.core.validation as fov
 
 from .base import BaseEvaluationResults
 
 
+@fopf.stage("evaluate_classifications")
 def evaluate_classifications(
     samples,
     pred_field,
@@ -5,6 +5,7 @@ Detection evaluation.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from datetime import datetime
 import itertools
 import logging
 
@@ -13,6 +14,8 @@ import numpy as np
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.odm as foo
+import fiftyone.core.profiling as fopf
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 import fiftyone.utils.iou as foui
@@ -23,6 +26,8 @@ from .base import BaseEvaluationResults
 logger = logging.getLogger(__name__)
 
 
+@fopf.stage("evaluate_detections")
+@foo.pause_change_tracking()
 def evaluate_detections(
     samples,
     pred_field,
@@ -35,6 +40,7 @@ def evaluate_detections(
     use_masks=False,
     use_boxes=False,
     classwise=True,
+    incremental=False,
     **kwargs,
 ):
     """Evaluates the predicted detections in the given samples with respect to
@@ -119,6 +125,15 @@ def evaluate_detections(
             rather than using their actual geometries
         classwise (True): whether to only match objects with the same class
             label (True) or allow matches between classes (False)
+        incremental (False): whether to only re-evaluate the samples that have
+            been added or modified since the existing evaluation with the given
+            ``eval_key`` was performed. The stored matches of all other samples
+            are reused and the aggregate results are recomputed from them.
+            Requires an ``eval_key`` and a dataset with
+            :meth:`change tracking <fiftyone.core.dataset.Dataset.enable_change_tracking>`
+            enabled. If no compatible evaluation exists, a full evaluation is
+            performed. Not supported with ``compute_mAP=True``, since mAP
+            requires re-matching all samples
         **kwargs: optional keyword arguments for the constructor of the
             :class:`DetectionEvaluationConfig` being used
 
@@ -153,13 +168,29 @@ def evaluate_detections(
     eval_method = config.build()
     eval_method.ensure_requirements()
 
-    eval_method.register_run(samples, eval_key)
+    if incremental:
+        prev_results = _load_incremental_results(samples, eval_key, config)
+    else:
+        prev_results = None
+
+    # Re-registering the run would cleanup the existing evaluation fields, so
+    # we only do so for full evaluations
+    if prev_results is None:
+        eval_method.register_run(samples, eval_key)
+
     eval_method.register_samples(samples)
 
-    if config.requires_additional_fields:
-        _samples = samples
+    if prev_results is not None:
+        _samples, matches, sample_ids = _parse_incremental_samples(
+            samples, eval_key, prev_results
+        )
     else:
-        _samples = samples.select_fields([gt_field, pred_field])
+        _samples = samples
+        matches = []
+        sample_ids = [] if incremental else None
+
+    if not config.requires_additional_fields:
+        _samples = _samples.select_fields([gt_field, pred_field])
 
     processing_frames = samples._is_frame_field(pred_field)
 
@@ -171,15 +202,18 @@ def evaluate_detections(
         # note: fields are manually declared so they'll exist even when
         # `samples` is empty
         dataset = samples._dataset
-        dataset.add_sample_field(tp_field, fof.IntField)
-        dataset.add_sample_field(fp_field, fof.IntField)
-        dataset.add_sample_field(fn_field, fof.IntField)
+        dataset._add_sample_field_if_necessary(tp_field, fof.IntField)
+        dataset._add_sample_field_if_necessary(fp_field, fof.IntField)
+        dataset._add_sample_field_if_necessary(fn_field, fof.IntField)
         if processing_frames:
-            dataset.add_frame_field(tp_field, fof.IntField)
-            dataset.add_frame_field(fp_field, fof.IntField)
-            dataset.add_frame_field(fn_field, fof.IntField)
+            dataset._add_frame_field_if_necessary(tp_field, fof.IntField)
+            dataset._add_frame_field_if_necessary(fp_field, fof.IntField)
+            dataset._add_frame_field_if_necessary(fn_field, fof.IntField)
+
+    # Any changes made after this point will be re-evaluated by the next
+    # incremental evaluation, while our own writes are not change-tracked
+    started_at = datetime.utcnow()
 
-    matches = []
     logger.info("Evaluating detections...")
     for sample in _samples.iter_samples(progress=True):
         if processing_frames:
@@ -193,6 +227,8 @@ def evaluate_detections(
         for doc in docs:
             doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
             matches.extend(doc_matches)
+            if sample_ids is not None:
+                sample_ids.extend([sample.id] * len(doc_matches))
             tp, fp, fn = _tally_matches(doc_matches)
             sample_tp += tp
             sample_fp += fp
@@ -212,6 +248,11 @@ def evaluate_detections(
     results = eval_method.generate_results(
         samples, matches, eval_key=eval_key, classes=classes, missing=missing
     )
+
+    if eval_key is not None and sample_ids is not None:
+        results.sample_ids = np.array(sample_ids)
+        results.started_at = started_at
+
     eval_method.save_run_results(samples, eval_key, results)
 
     return results
@@ -464,6 +505,10 @@ class DetectionResults(BaseEvaluationResults):
         )
         self.ious = np.array(ious)
 
+        # Populated by `evaluate_detections()` to support incremental runs
+        self.sample_ids = None
+        self.started_at = None
+
     @classmethod
     def _from_dict(cls, d, samples, config, **kwargs):
         ytrue = d["ytrue"]
@@ -490,7 +535,7 @@ class DetectionResults(BaseEvaluationResults):
 
         matches = list(zip(ytrue, ypred, ious, confs, ytrue_ids, ypred_ids))
 
-        return cls(
+        results = cls(
             matches,
             eval_key=eval_key,
             gt_field=gt_field,
@@ -501,6 +546,14 @@ class DetectionResults(BaseEvaluationResults):
             **kwargs,
         )
 
+        sample_ids = d.get("sample_ids", None)
+        if sample_ids is not None:
+            results.sample_ids = np.array(sample_ids)
+
+        results.started_at = d.get("started_at", None)
+
+        return results
+
 
 def _parse_config(pred_field, gt_field, method, is_temporal, **kwargs):
     if method is None:
@@ -527,6 +580,111 @@ def _parse_config(pred_field, gt_field, method, is_temporal, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
+def _load_incremental_results(samples, eval_key, config):
+    if eval_key is None:
+        raise ValueError("Incremental evaluation requires an `eval_key`")
+
+    if not samples._dataset.tracks_changes:
+        raise ValueError(
+            "Incremental evaluation requires change tracking. Use "
+            "`dataset.enable_change_tracking()` to enable it"
+        )
+
+    # mAP and PR curves are computed by re-matching every sample at multiple
+    # IoU thresholds, which cannot be done incrementally
+    if getattr(config, "compute_mAP", False):
+        raise ValueError(
+            "Incremental evaluation does not support `compute_mAP=True`"
+        )
+
+    if eval_key not in samples.list_evaluations():
+        return None
+
+    info = samples.get_evaluation_info(eval_key)
+    if info.config.serialize() != config.serialize():
+        logger.info(
+            "Evaluation '%s' has a different config; performing a full "
+            "evaluation",
+            eval_key,
+        )
+        return None
+
+    # Samples that enter the collection because other samples changed are not
+    # detected by `changes_since()`, so the view itself must be the same
+    prev_view = foe.EvaluationMethod.load_run_view(samples, eval_key)
+    if prev_view._serialize(include_uuids=False) != samples.view()._serialize(
+        include_uuids=False
+    ):
+        logger.info(
+            "Evaluation '%s' was performed on a different view; performing a "
+            "full evaluation",
+            eval_key,
+        )
+        return None
+
+    try:
+        results = samples.load_evaluation_results(eval_key)
+    except Exception as e:
+        logger.warning(
+            "Failed to load results for evaluation '%s': %s", eval_key, e
+        )
+        return None
+
+    if (
+        not isinstance(results, DetectionResults)
+        or results.sample_ids is None
+        or results.started_at is None
+    ):
+        logger.info(
+            "Evaluation '%s' does not support incremental updates; "
+            "performing a full evaluation",
+            eval_key,
+        )
+        return None
+
+    return results
+
+
+def _parse_incremental_samples(samples, eval_key, results):
+    # Samples that were modified since the last evaluation, or that have never
+    # been evaluated
+    changed_ids = set(samples.changes_since(results.started_at).values("id"))
+    changed_ids.update(samples.exists("%s_tp" % eval_key, False).values("id"))
+
+    # Reuse the matches of unchanged samples that are still in the collection
+    keep_ids = set(samples.values("id")) - changed_ids
+
+    missing = results.missing
+
+    matches = []
+    sample_ids = []
+    for row in zip(
+        results.ytrue,
+        results.ypred,
+        results.ious,
+        results.confs,
+        results.ytrue_ids,
+        results.ypred_ids,
+        results.sample_ids,
+    ):
+        if row[-1] not in keep_ids:
+            continue
+
+        gt_label = row[0] if row[0] != missing else None
+        pred_label = row[1] if row[1] != missing else None
+
+        matches.append((gt_label, pred_label) + tuple(row[2:-1]))
+        sample_ids.append(row[-1])
+
+    logger.info(
+        "Found %d new or modified samples since evaluation '%s'",
+        len(changed_ids),
+        eval_key,
+    )
+
+    return samples.select(changed_ids), matches, sample_ids
+
+
 def _tally_matches(matches):
     tp = 0
     fp = 0
@@ -19,12 +19,14 @@ import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.plots as fop
+import fiftyone.core.profiling as fopf
 import fiftyone.core.validation as fov
 
 
 logger = logging.getLogger(__name__)
 
 
+@fopf.stage("evaluate_regressions")
 def evaluate_regressions(
     samples,
     pred_field,
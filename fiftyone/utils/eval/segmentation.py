@@ -9,13 +9,14 @@ import logging
 import warnings
 
 import numpy as np
-import sklearn.metrics as skm
 
 import eta.core.image as etai
 
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.profiling as fopf
+import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
 from .base import BaseEvaluationResults
@@ -23,7 +24,12 @@ from .base import BaseEvaluationResults
 
 logger = logging.getLogger(__name__)
 
+# Averaging strategies whose per-sample metrics do not depend on the mask
+# values that do not appear in the sample
+_LOCAL_AVERAGES = ("micro", "weighted")
 
+
+@fopf.stage("evaluate_segmentations")
 def evaluate_segmentations(
     samples,
     pred_field,
@@ -31,6 +37,7 @@ def evaluate_segmentations(
     eval_key=None,
     mask_targets=None,
     method="simple",
+    num_workers=1,
     **kwargs,
 ):
     """Evaluates the specified semantic segmentation masks in the given
@@ -78,6 +85,8 @@ def evaluate_segmentations(
             provided, the observed pixel values are used
         method ("simple"): a string specifying the evaluation method to use.
             Supported values are ``("simple")``
+        num_workers (1): the number of processes to use to compute the pixel
+            confusion matrices
         **kwargs: optional keyword arguments for the constructor of the
             :class:`SegmentationEvaluationConfig` being used
 
@@ -95,7 +104,10 @@ def evaluate_segmentations(
     eval_method.register_run(samples, eval_key)
 
     results = eval_method.evaluate_samples(
-        samples, eval_key=eval_key, mask_targets=mask_targets
+        samples,
+        eval_key=eval_key,
+        mask_targets=mask_targets,
+        num_workers=num_workers,
     )
     eval_method.save_run_results(samples, eval_key, results)
 
@@ -125,7 +137,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
         config: a :class:`SegmentationEvaluationConfig`
     """
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=1
+    ):
         """Evaluates the predicted segmentation masks in the given samples with
         respect to the specified ground truth masks.
 
@@ -136,6 +150,8 @@ class SegmentationEvaluation(foe.EvaluationMethod):
                 contain a subset of the possible classes if you wish to
                 evaluate a subset of the semantic classes. By default, the
                 observed pixel values are used as labels
+            num_workers (1): the number of processes to use to compute the
+                pixel confusion matrices
 
         Returns:
             a :class:`SegmentationResults` instance
@@ -215,24 +231,27 @@ class SimpleEvaluation(SegmentationEvaluation):
         config: a :class:`SimpleEvaluationConfig`
     """
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=1
+    ):
         pred_field = self.config.pred_field
         gt_field = self.config.gt_field
 
         if mask_targets is not None:
             values, classes = zip(*sorted(mask_targets.items()))
+            values = np.array(values)
         else:
-            logger.info("Computing possible mask values...")
-            values = _get_mask_values(samples, pred_field, gt_field)
-            classes = [str(v) for v in values]
+            # The observed mask values are computed while evaluating
+            values = None
+            classes = None
+
+        if num_workers is None:
+            num_workers = 1
 
         _samples = samples.select_fields([gt_field, pred_field])
         pred_field, processing_frames = samples._handle_frame_field(pred_field)
         gt_field, _ = samples._handle_frame_field(gt_field)
 
-        nc = len(values)
-        confusion_matrix = np.zeros((nc, nc), dtype=int)
-
         bandwidth = self.config.bandwidth
         average = self.config.average
 
@@ -252,54 +271,108 @@ class SimpleEvaluation(SegmentationEvaluation):
                 dataset.add_frame_field(pre_field, fof.FloatField)
                 dataset.add_frame_field(rec_field, fof.FloatField)
 
+        if (
+            values is None
+            and eval_key is not None
+            and average not in _LOCAL_AVERAGES
+        ):
+            # Per-sample metrics depend on all possible mask values
+            logger.info("Computing possible mask values...")
+            values = _get_observed_values(
+                _samples, pred_field, gt_field, processing_frames
+            )
+            classes = [str(v) for v in values]
+
+        sample_ids = []
+        masks = _iter_masks(
+            _samples, pred_field, gt_field, processing_frames, sample_ids
+        )
+
         logger.info("Evaluating segmentations...")
-        for sample in _samples.iter_samples(progress=True):
-            if processing_frames:
-                images = sample.frames.values()
+        image_results = _compute_confusion_matrices(
+            masks, values, bandwidth, num_workers
+        )
+
+        all_values = values if values is not None else np.array([], int)
+        nc = len(all_values)
+        confusion_matrix = np.zeros((nc, nc), dtype=int)
+
+        # Results are emitted in sample order, so per-sample metrics are
+        # computed as soon as each sample is complete. When ``values`` is not
+        # known in advance, the metrics are computed with respect to the mask
+        # values observed in each sample/frame, which yields the same result
+        # for the averaging strategies in ``_LOCAL_AVERAGES``
+        sample_metrics = {}
+        frame_metrics = {}
+        curr_id = None
+        curr_values = None
+        curr_conf_mat = None
+
+        for sample_id, frame_number, image_values, conf_mat in image_results:
+            all_values, confusion_matrix = _merge_confusion_matrices(
+                all_values, confusion_matrix, image_values, conf_mat
+            )
+
+            if eval_key is None:
+                continue
+
+            if sample_id != curr_id:
+                if curr_id is not None:
+                    metrics = _compute_accuracy_precision_recall(
+                        curr_conf_mat, curr_values, average
+                    )
+                    sample_metrics[curr_id] = metrics
+
+                curr_id = sample_id
+                curr_values = image_values
+                curr_conf_mat = conf_mat
             else:
-                images = [sample]
-
-            sample_conf_mat = np.zeros((nc, nc), dtype=int)
-            for image in images:
-                gt_seg = image[gt_field]
-                if gt_seg is None or gt_seg.mask is None:
-                    msg = "Skipping sample with missing ground truth mask"
-                    warnings.warn(msg)
-                    continue
-
-                pred_seg = image[pred_field]
-                if pred_seg is None or pred_seg.mask is None:
-                    msg = "Skipping sample with missing prediction mask"
-                    warnings.warn(msg)
-                    continue
-
-                image_conf_mat = _compute_pixel_confusion_matrix(
-                    pred_seg.mask, gt_seg.mask, values, bandwidth=bandwidth
+                curr_values, curr_conf_mat = _merge_confusion_matrices(
+                    curr_values, curr_conf_mat, image_values, conf_mat
                 )
-                sample_conf_mat += image_conf_mat
 
-                # Record frame stats, if requested
-                if processing_frames and eval_key is not None:
-                    facc, fpre, frec = _compute_accuracy_precision_recall(
-                        image_conf_mat, values, average
-                    )
-                    image[acc_field] = facc
-                    image[pre_field] = fpre
-                    image[rec_field] = frec
+            if processing_frames:
+                _frame_metrics = frame_metrics.setdefault(sample_id, {})
+                _frame_metrics[
+                    frame_number
+                ] = _compute_accuracy_precision_recall(
+                    conf_mat, image_values, average
+                )
 
-            confusion_matrix += sample_conf_mat
+        if curr_id is not None:
+            sample_metrics[curr_id] = _compute_accuracy_precision_recall(
+                curr_conf_mat, curr_values, average
+            )
+
+        if values is None:
+            values = all_values
+            classes = [str(v) for v in values]
 
-            # Record sample stats, if requested
-            if eval_key is not None:
-                sacc, spre, srec = _compute_accuracy_precision_recall(
-                    sample_conf_mat, values, average
+        # Record stats, if requested
+        if eval_key is not None and sample_ids:
+            for sample_id in sample_ids:
+                if sample_id not in sample_metrics:
+                    sample_metrics[sample_id] = (None, None, None)
+
+            for idx, field in enumerate((acc_field, pre_field, rec_field)):
+                samples.set_values(
+                    field,
+                    {_id: m[idx] for _id, m in sample_metrics.items()},
+                    key_field="id",
                 )
-                sample[acc_field] = sacc
-                sample[pre_field] = spre
-                sample[rec_field] = srec
-                sample.save()
 
-        if nc > 0:
+            if processing_frames and frame_metrics:
+                for idx, field in enumerate((acc_field, pre_field, rec_field)):
+                    samples.set_values(
+                        samples._FRAMES_PREFIX + field,
+                        {
+                            _id: {fn: m[idx] for fn, m in fm.items()}
+                            for _id, fm in frame_metrics.items()
+                        },
+                        key_field="id",
+                    )
+
+        if len(values) > 0:
             missing = classes[0] if values[0] == 0 else None
         else:
             missing = None
@@ -409,6 +482,77 @@ def _parse_config(pred_field, gt_field, method, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
+def _iter_masks(samples, pred_field, gt_field, processing_frames, sample_ids):
+    for sample in samples.iter_samples(progress=True):
+        sample_ids.append(sample.id)
+
+        if processing_frames:
+            images = sample.frames.items()
+        else:
+            images = [(None, sample)]
+
+        for frame_number, image in images:
+            gt_seg = image[gt_field]
+            if gt_seg is None or not gt_seg.has_mask:
+                msg = "Skipping sample with missing ground truth mask"
+                warnings.warn(msg)
+                continue
+
+            pred_seg = image[pred_field]
+            if pred_seg is None or not pred_seg.has_mask:
+                msg = "Skipping sample with missing prediction mask"
+                warnings.warn(msg)
+                continue
+
+            yield (
+                sample.id,
+                frame_number,
+                pred_seg.get_mask(),
+                gt_seg.get_mask(),
+            )
+
+
+def _get_observed_values(samples, pred_field, gt_field, processing_frames):
+    values = np.array([], int)
+    for _, _, pred_mask, gt_mask in _iter_masks(
+        samples, pred_field, gt_field, processing_frames, []
+    ):
+        values = np.union1d(values, _get_mask_values(pred_mask.ravel()))
+        values = np.union1d(values, _get_mask_values(gt_mask.ravel()))
+
+    return values
+
+
+def _compute_confusion_matrices(masks, values, bandwidth, num_workers):
+    if num_workers <= 1:
+        for sample_id, frame_number, pred_mask, gt_mask in masks:
+            image_values, image_conf_mat = _compute_pixel_confusion_matrix(
+                pred_mask, gt_mask, values, bandwidth=bandwidth
+            )
+            yield sample_id, frame_number, image_values, image_conf_mat
+
+        return
+
+    # Masks are sent to the workers in bounded batches so that we never hold
+    # more than a few masks per worker in memory at once
+    batch_size = 4 * num_workers
+    with fou.get_multiprocessing_context().Pool(processes=num_workers) as pool:
+        for batch in fou.iter_batches(masks, batch_size):
+            inputs = [m + (values, bandwidth) for m in batch]
+            for result in pool.imap(
+                _do_compute_pixel_confusion_matrix, inputs
+            ):
+                yield result
+
+
+def _do_compute_pixel_confusion_matrix(args):
+    sample_id, frame_number, pred_mask, gt_mask, values, bandwidth = args
+    image_values, image_conf_mat = _compute_pixel_confusion_matrix(
+        pred_mask, gt_mask, values, bandwidth=bandwidth
+    )
+    return sample_id, frame_number, image_values, image_conf_mat
+
+
 def _compute_pixel_confusion_matrix(
     pred_mask, gt_mask, values, bandwidth=None
 ):
@@ -426,15 +570,87 @@ def _compute_pixel_confusion_matrix(
             pred_mask, gt_mask, bandwidth
         )
 
-    try:
-        return skm.confusion_matrix(
-            gt_mask.ravel(), pred_mask.ravel(), labels=values
+    gt_mask = gt_mask.ravel()
+    pred_mask = pred_mask.ravel()
+
+    if values is None:
+        values = np.union1d(
+            _get_mask_values(gt_mask), _get_mask_values(pred_mask)
         )
-    except ValueError:
-        # Assume that no `values` appear in `gt_mask`, which causes
-        # `skm.confusion_matrix` to raise an error
-        num_classes = len(values)
-        return np.zeros((num_classes, num_classes), dtype=int)
+
+    return values, _compute_confusion_matrix(gt_mask, pred_mask, values)
+
+
+def _compute_confusion_matrix(ytrue, ypred, values):
+    # Equivalent to `sklearn.metrics.confusion_matrix(..., labels=values)`,
+    # but implemented via a single `np.bincount()`, which is much faster on
+    # the millions of pixels in a typical mask
+    num_classes = len(values)
+    if num_classes == 0:
+        return np.zeros((0, 0), dtype=int)
+
+    true_inds, true_found = _get_value_indices(ytrue, values)
+    pred_inds, pred_found = _get_value_indices(ypred, values)
+
+    found = true_found & pred_found
+    inds = num_classes * true_inds[found] + pred_inds[found]
+    counts = np.bincount(inds, minlength=num_classes * num_classes)
+
+    return counts.reshape(num_classes, num_classes)
+
+
+def _get_value_indices(arr, values):
+    values = np.asarray(values)
+
+    if arr.size == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=bool)
+
+    if _is_small_uint(arr) and _is_small_uint(values):
+        # Lookup table
+        lut = np.full(max(arr.max(), values.max()) + 1, -1, dtype=int)
+        lut[values] = np.arange(len(values))
+        inds = lut[arr]
+        return inds, inds >= 0
+
+    # Binary search (`values` are sorted)
+    inds = np.searchsorted(values, arr)
+    inds[inds == len(values)] = 0
+    return inds, values[inds] == arr
+
+
+def _get_mask_values(mask):
+    if _is_small_uint(mask):
+        return np.flatnonzero(np.bincount(mask))
+
+    return np.unique(mask)
+
+
+def _is_small_uint(arr):
+    if arr.size == 0 or arr.dtype.kind not in ("u", "i"):
+        return False
+
+    return arr.min() >= 0 and arr.max() < 65536
+
+
+def _merge_confusion_matrices(values1, conf_mat1, values2, conf_mat2):
+    if len(values1) == len(values2) and np.array_equal(values1, values2):
+        return values1, conf_mat1 + conf_mat2
+
+    values = np.union1d(values1, values2)
+    conf_mat = _expand_confusion_matrix(values1, conf_mat1, values)
+    conf_mat += _expand_confusion_matrix(values2, conf_mat2, values)
+    return values, conf_mat
+
+
+def _expand_confusion_matrix(values, conf_mat, all_values):
+    if len(values) == len(all_values) and np.array_equal(values, all_values):
+        return conf_mat.copy()
+
+    num_classes = len(all_values)
+    inds = np.searchsorted(all_values, values)
+    expanded = np.zeros((num_classes, num_classes), dtype=int)
+    expanded[np.ix_(inds, inds)] = conf_mat
+    return expanded
 
 
 def _extract_contour_band_values(pred_mask, gt_mask, bandwidth):
@@ -443,6 +659,9 @@ def _extract_contour_band_values(pred_mask, gt_mask, bandwidth):
 
 
 def _compute_accuracy_precision_recall(confusion_matrix, values, average):
+    if len(values) == 0:
+        return None, None, None
+
     missing = 0 if values[0] == 0 else None
     results = SegmentationResults(confusion_matrix, values, missing=missing)
     metrics = results.metrics(average=average)
@@ -450,25 +669,3 @@ def _compute_accuracy_precision_recall(confusion_matrix, values, average):
         return None, None, None
 
     return metrics["accuracy"], metrics["precision"], metrics["recall"]
-
-
-def _get_mask_values(samples, pred_field, gt_field):
-    _samples = samples.select_fields([gt_field, pred_field])
-    pred_field, processing_frames = samples._handle_frame_field(pred_field)
-    gt_field, _ = samples._handle_frame_field(gt_field)
-
-    values = set()
-
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            for field in (pred_field, gt_field):
-                seg = image[field]
-                if seg is not None and seg.mask is not None:
-                    values.update(seg.mask.ravel())
-
-    return sorted(values)
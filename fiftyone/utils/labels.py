@@ -5,10 +5,24 @@ Label utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
+import os
+
+import eta.core.image as etai
+import eta.core.utils as etau
+
 import fiftyone.core.labels as fol
+import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
 
+# Default number of samples that are converted per task
+_DEFAULT_BATCH_SIZE = 16
+
+# Number of samples whose input labels are loaded per values() call
+_PAGE_SIZE = 1024
+
+
 def objects_to_segmentations(
     sample_collection,
     in_field,
@@ -16,6 +30,9 @@ def objects_to_segmentations(
     mask_size=None,
     mask_targets=None,
     thickness=1,
+    output_dir=None,
+    num_workers=1,
+    batch_size=None,
 ):
     """Converts the instance segmentations or polylines in the specified field
     of the collection into semantic segmentation masks.
@@ -40,6 +57,14 @@ def objects_to_segmentations(
             all objects are rendered with pixel value 255
         thickness (1): the thickness, in pixels, at which to render
             (non-filled) polylines
+        output_dir (None): an optional directory in which to write the
+            segmentation images. If provided, the masks are written to disk
+            and the ``mask_path`` attribute of the
+            :class:`fiftyone.core.labels.Segmentation` instances is populated
+            rather than storing the masks in the database
+        num_workers (1): the number of processes to use
+        batch_size (None): the number of samples to convert per task. By
+            default, a batch size of 16 is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -50,60 +75,30 @@ def objects_to_segmentations(
     if mask_size is None:
         sample_collection.compute_metadata()
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
+    if output_dir is not None:
+        etau.ensure_dir(output_dir)
 
-    for sample in samples.iter_samples(progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        if mask_size is not None:
-            frame_size = mask_size
-        elif processing_frames:
-            frame_size = (
-                sample.metadata.frame_width,
-                sample.metadata.frame_height,
-            )
-        else:
-            frame_size = (sample.metadata.width, sample.metadata.height)
-
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            segmentation = None
-
-            if isinstance(label, fol.Polyline):
-                label = fol.Polylines(polylines=[label])
-
-            if isinstance(label, fol.Detection):
-                label = fol.Detections(detections=[label])
-
-            if isinstance(label, fol.Polylines):
-                segmentation = label.to_segmentation(
-                    frame_size=frame_size,
-                    mask_targets=mask_targets,
-                    thickness=thickness,
-                )
-
-            if isinstance(label, fol.Detections):
-                segmentation = label.to_segmentation(
-                    frame_size=frame_size,
-                    mask_targets=mask_targets,
-                )
-
-            image[out_field] = segmentation
-
-        sample.save()
+    _convert_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _objects_to_segmentation,
+        dict(
+            mask_size=mask_size,
+            mask_targets=mask_targets,
+            thickness=thickness,
+            output_dir=output_dir,
+        ),
+        num_workers=num_workers,
+        batch_size=batch_size,
+        frame_sizes=mask_size is None,
+    )
 
     if mask_targets is not None:
         if not sample_collection.default_mask_targets:
             sample_collection.default_mask_targets = mask_targets
         else:
+            out_field, _ = sample_collection._handle_frame_field(out_field)
             sample_collection.mask_targets[out_field] = mask_targets
 
 
@@ -113,6 +108,8 @@ def segmentations_to_detections(
     out_field,
     mask_targets=None,
     mask_types="stuff",
+    num_workers=1,
+    batch_size=None,
 ):
     """Converts the semantic segmentations masks in the specified field of the
     collection into :class:`fiftyone.core.labels.Detections` with instance
@@ -146,6 +143,9 @@ def segmentations_to_detections(
             -   ``"thing"`` if all classes are thing classes
             -   a dict mapping pixel values to ``"stuff"`` or ``"thing"``
                 for each class
+        num_workers (1): the number of processes to use
+        batch_size (None): the number of samples to convert per task. By
+            default, a batch size of 16 is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -153,30 +153,25 @@ def segmentations_to_detections(
         fol.Segmentation,
     )
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
-
-    for sample in samples.iter_samples(progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            image[out_field] = label.to_detections(
-                mask_targets=mask_targets, mask_types=mask_types
-            )
-
-        sample.save()
+    _convert_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _segmentation_to_detections,
+        dict(mask_targets=mask_targets, mask_types=mask_types),
+        num_workers=num_workers,
+        batch_size=batch_size,
+    )
 
 
 def instances_to_polylines(
-    sample_collection, in_field, out_field, tolerance=2, filled=True
+    sample_collection,
+    in_field,
+    out_field,
+    tolerance=2,
+    filled=True,
+    num_workers=1,
+    batch_size=None,
 ):
     """Converts the instance segmentations in the specified field of the
     collection into :class:`fiftyone.core.labels.Polylines` instances.
@@ -195,6 +190,9 @@ def instances_to_polylines(
         tolerance (2): a tolerance, in pixels, when generating approximate
             polylines for each region. Typical values are 1-3 pixels
         filled (True): whether the polylines should be filled
+        num_workers (1): the number of processes to use
+        batch_size (None): the number of samples to convert per task. By
+            default, a batch size of 16 is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -202,26 +200,15 @@ def instances_to_polylines(
         fol.Detections,
     )
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
-
-    for sample in samples.iter_samples(progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            image[out_field] = label.to_polylines(
-                tolerance=tolerance, filled=filled
-            )
-
-        sample.save()
+    _convert_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _instances_to_polylines,
+        dict(tolerance=tolerance, filled=filled),
+        num_workers=num_workers,
+        batch_size=batch_size,
+    )
 
 
 def segmentations_to_polylines(
@@ -231,6 +218,8 @@ def segmentations_to_polylines(
     mask_targets=None,
     mask_types="stuff",
     tolerance=2,
+    num_workers=1,
+    batch_size=None,
 ):
     """Converts the semantic segmentations masks in the specified field of the
     collection into :class:`fiftyone.core.labels.Polylines` instances.
@@ -265,6 +254,9 @@ def segmentations_to_polylines(
                 for each class
         tolerance (2): a tolerance, in pixels, when generating approximate
                 polylines for each region. Typical values are 1-3 pixels
+        num_workers (1): the number of processes to use
+        batch_size (None): the number of samples to convert per task. By
+            default, a batch size of 16 is used
     """
     fov.validate_collection_label_fields(
         sample_collection,
@@ -272,28 +264,19 @@ def segmentations_to_polylines(
         fol.Segmentation,
     )
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
-
-    for sample in samples.iter_samples(progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
-
-            image[out_field] = label.to_polylines(
-                mask_targets=mask_targets,
-                mask_types=mask_types,
-                tolerance=tolerance,
-            )
-
-        sample.save()
+    _convert_labels(
+        sample_collection,
+        in_field,
+        out_field,
+        _segmentation_to_polylines,
+        dict(
+            mask_targets=mask_targets,
+            mask_types=mask_types,
+            tolerance=tolerance,
+        ),
+        num_workers=num_workers,
+        batch_size=batch_size,
+    )
 
 
 def classification_to_detections(sample_collection, in_field, out_field):
@@ -386,3 +369,175 @@ def classifications_to_detections(sample_collection, in_field, out_field):
             image[out_field] = fol.Detections(detections=detections)
 
         sample.save()
+
+
+def _convert_labels(
+    sample_collection,
+    in_field,
+    out_field,
+    convert_fcn,
+    kwargs,
+    num_workers=1,
+    batch_size=None,
+    frame_sizes=False,
+):
+    if num_workers is None:
+        num_workers = 1
+
+    if batch_size is None:
+        batch_size = _DEFAULT_BATCH_SIZE
+
+    samples = sample_collection.select_fields(in_field)
+    _, processing_frames = samples._handle_frame_field(in_field)
+
+    paths = [in_field]
+    if frame_sizes:
+        if processing_frames:
+            paths.extend(["metadata.frame_width", "metadata.frame_height"])
+        else:
+            paths.extend(["metadata.width", "metadata.height"])
+
+    # The IDs are loaded up front because writing the outputs may change the
+    # contents of the collection, e.g., if it is filtered by ``out_field``
+    sample_ids = samples.values("id")
+    num_samples = len(sample_ids)
+
+    def _iter_tasks():
+        # Input labels are loaded a page at a time, so that memory usage
+        # remains bounded for large collections
+        for start in range(0, num_samples, _PAGE_SIZE):
+            page_ids = sample_ids[start : (start + _PAGE_SIZE)]
+            page = samples.select(page_ids, ordered=True)
+            page_ids, *values = page.values(["id"] + paths)
+
+            labels = values[0]
+            if frame_sizes:
+                sizes = list(zip(values[1], values[2]))
+            else:
+                sizes = [None] * len(labels)
+
+            for offset in range(0, len(page_ids), batch_size):
+                _slice = slice(offset, offset + batch_size)
+                batch_ids = page_ids[_slice]
+                task = (
+                    convert_fcn,
+                    labels[_slice],
+                    sizes[_slice],
+                    processing_frames,
+                    kwargs,
+                )
+                yield batch_ids, task
+
+    def _write(batch_ids, labels):
+        if any(_iter_non_none(labels, processing_frames)):
+            sample_collection.set_values(
+                out_field, labels, skip_none=True, _sample_ids=batch_ids
+            )
+
+    # Conversions are performed in worker processes and the results are
+    # written in batches as they complete. The number of in-flight tasks is
+    # bounded so that memory usage remains bounded for large collections
+    with fou.ProgressBar(total=num_samples) as pb:
+        if num_workers <= 1:
+            for batch_ids, task in _iter_tasks():
+                _write(batch_ids, _convert_batch(task))
+                pb.update(count=len(batch_ids))
+        else:
+            ctx = fou.get_multiprocessing_context()
+            with ctx.Pool(processes=num_workers) as pool:
+                pending = deque()
+                for batch_ids, task in _iter_tasks():
+                    pending.append(
+                        (batch_ids, pool.apply_async(_convert_batch, (task,)))
+                    )
+
+                    if len(pending) >= 2 * num_workers:
+                        batch_ids, result = pending.popleft()
+                        _write(batch_ids, result.get())
+                        pb.update(count=len(batch_ids))
+
+                while pending:
+                    batch_ids, result = pending.popleft()
+                    _write(batch_ids, result.get())
+                    pb.update(count=len(batch_ids))
+
+
+def _convert_batch(task):
+    convert_fcn, labels, sizes, processing_frames, kwargs = task
+
+    if processing_frames:
+        return [
+            [_convert_label(convert_fcn, l, size, kwargs) for l in _labels]
+            for _labels, size in zip(labels, sizes)
+        ]
+
+    return [
+        _convert_label(convert_fcn, label, size, kwargs)
+        for label, size in zip(labels, sizes)
+    ]
+
+
+def _convert_label(convert_fcn, label, frame_size, kwargs):
+    if label is None:
+        return None
+
+    return convert_fcn(label, frame_size, **kwargs)
+
+
+def _iter_non_none(labels, processing_frames):
+    if processing_frames:
+        for _labels in labels:
+            for label in _labels:
+                yield label is not None
+    else:
+        for label in labels:
+            yield label is not None
+
+
+def _objects_to_segmentation(
+    label,
+    frame_size,
+    mask_size=None,
+    mask_targets=None,
+    thickness=1,
+    output_dir=None,
+):
+    if mask_size is not None:
+        frame_size = mask_size
+
+    if isinstance(label, fol.Polyline):
+        label = fol.Polylines(polylines=[label])
+
+    if isinstance(label, fol.Detection):
+        label = fol.Detections(detections=[label])
+
+    if isinstance(label, fol.Polylines):
+        segmentation = label.to_segmentation(
+            frame_size=frame_size,
+            mask_targets=mask_targets,
+            thickness=thickness,
+        )
+    else:
+        segmentation = label.to_segmentation(
+            frame_size=frame_size, mask_targets=mask_targets
+        )
+
+    if output_dir is not None:
+        mask_path = os.path.join(output_dir, str(segmentation.id) + ".png")
+        etai.write(segmentation.mask, mask_path)
+        segmentation.mask = None
+        segmentation.mask_path = mask_path
+
+    return segmentation
+
+
+def _segmentation_to_detections(label, frame_size, **kwargs):
+    return label.to_detections(**kwargs)
+
+
+def _instances_to_polylines(label, frame_size, **kwargs):
+    return label.to_polylines(**kwargs)
+
+
+def _segmentation_to_polylines(label, frame_size, **kwargs):
+    return label.to_polylines(**kwargs)
@@ -183,7 +183,9 @@ def from_tf_records(
         num_parallel_reads (None): an optional number of files to read in
             parallel. If a negative value is passed, this parameter is set to
             the number of CPU cores on the host machine. By default, the files
-            are read in series
+            are read in series. Note that, when multiple files are read in
+            parallel, their records are interleaved, so the records are not
+            emitted in the same order as when the files are read in series
 
     Returns:
         a ``tf.data.Dataset`` that emits ``tf.train.Example`` protos
@@ -198,7 +200,9 @@ def from_tf_records(
     )
 
 
-def write_tf_records(examples, tf_records_path, num_shards=None):
+def write_tf_records(
+    examples, tf_records_path, num_shards=None, num_workers=None
+):
     """Writes the given ``tf.train.Example`` protos to disk as TFRecords.
 
     Args:
@@ -207,7 +211,24 @@ def write_tf_records(examples, tf_records_path, num_shards=None):
             is requested ``-%%05d-of-%%05d`` is appended to the path
         num_shards (None): an optional number of shards to split the records
             into (using a round robin strategy)
+        num_workers (None): an optional number of worker processes to use to
+            write the shards in parallel. Only applicable when ``num_shards``
+            is provided. By default, the shards are written in the main
+            process
     """
+    if num_shards and num_workers is not None and num_workers > 1:
+        etau.ensure_basedir(tf_records_path)
+        with fou.ParallelShardsWriter(
+            _get_shard_paths(tf_records_path, num_shards),
+            tf.io.TFRecordWriter,
+            num_workers=num_workers,
+            context=multiprocessing.get_context("spawn"),
+        ) as writer:
+            for example in examples:
+                writer.write(example.SerializeToString())
+
+        return
+
     with TFRecordsWriter(tf_records_path, num_shards=num_shards) as writer:
         for example in examples:
             writer.write(example)
@@ -246,11 +267,9 @@ class TFRecordsWriter(object):
 
         if self.num_shards:
             self._num_shards = self.num_shards
-            tf_records_patt = self.tf_records_path + "-%05d-of-%05d"
-            tf_records_paths = [
-                tf_records_patt % (i, self.num_shards)
-                for i in range(self.num_shards)
-            ]
+            tf_records_paths = _get_shard_paths(
+                self.tf_records_path, self.num_shards
+            )
         else:
             self._num_shards = 1
             tf_records_paths = [self.tf_records_path]
@@ -280,6 +299,111 @@ class TFRecordsWriter(object):
         )
 
 
+class ParallelTFRecordsWriter(object):
+    """Class for writing TFRecords to disk that uses worker processes to
+    generate and serialize the ``tf.train.Example`` protos.
+
+    Samples are assigned to shards using the same round robin strategy as
+    :class:`TFRecordsWriter`, so each shard contains the same examples that
+    would be written serially. See
+    :class:`fiftyone.core.utils.ParallelShardsWriter` for details.
+
+    Example Usage::
+
+        generator = TFObjectDetectionExampleGenerator()
+        with ParallelTFRecordsWriter(
+            "/path/for/tf.records", generator, num_shards=8, num_workers=8
+        ) as writer:
+            for image_path, detections in samples:
+                writer.write(image_path, detections)
+
+    Args:
+        tf_records_path: the path to write the ``.tfrecords`` file.
+            ``-%%05d-of-%%05d`` is appended to the path
+        example_generator: the :class:`TFExampleGenerator` to use to generate
+            the ``tf.train.Example`` protos
+        num_shards (None): the number of shards to split the records into. By
+            default, ``num_workers`` is used
+        num_workers (None): the number of worker processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used. This is capped at
+            ``num_shards``
+    """
+
+    def __init__(
+        self,
+        tf_records_path,
+        example_generator,
+        num_shards=None,
+        num_workers=None,
+    ):
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+
+        if num_shards is None:
+            num_shards = num_workers
+
+        self.tf_records_path = tf_records_path
+        self.example_generator = example_generator
+        self.num_shards = num_shards
+        self.num_workers = num_workers
+
+        self._writer = None
+
+    def __enter__(self):
+        etau.ensure_basedir(self.tf_records_path)
+
+        # TensorFlow is not fork-safe, so workers must be spawned
+        self._writer = fou.ParallelShardsWriter(
+            _get_shard_paths(self.tf_records_path, self.num_shards),
+            tf.io.TFRecordWriter,
+            serialize_fcn=_TFExampleSerializer(self.example_generator),
+            num_workers=self.num_workers,
+            context=multiprocessing.get_context("spawn"),
+        )
+        self._writer.__enter__()
+
+        return self
+
+    def __exit__(self, *args):
+        self._writer.__exit__(*args)
+
+    def write(self, image_or_path, label, filename=None):
+        """Generates a ``tf.train.Example`` proto for the given data and
+        writes it to disk.
+
+        Args:
+            image_or_path: an image or the path to the image on disk
+            label: a :class:`fiftyone.core.labels.Label`, or ``None``
+            filename (None): a filename for the image. Required when
+                ``image_or_path`` is an image
+        """
+        # Class IDs must be assigned in sample order so that they are
+        # consistent across workers
+        class_ids = self.example_generator.assign_class_ids(label)
+
+        self._writer.write((image_or_path, label, filename, class_ids))
+
+
+class _TFExampleSerializer(object):
+    def __init__(self, example_generator):
+        self.example_generator = example_generator
+
+    def __call__(self, task):
+        image_or_path, label, filename, class_ids = task
+        if class_ids:
+            self.example_generator.add_class_ids(class_ids)
+
+        tf_example = self.example_generator.make_tf_example(
+            image_or_path, label, filename=filename
+        )
+        return tf_example.SerializeToString()
+
+
+def _get_shard_paths(tf_records_path, num_shards):
+    tf_records_patt = tf_records_path + "-%05d-of-%05d"
+    return [tf_records_patt % (i, num_shards) for i in range(num_shards)]
+
+
 class TFRecordSampleParser(foud.LabeledImageSampleParser):
     """Base class for sample parsers that ingest ``tf.train.Example`` protos
     containing labeled images.
@@ -318,6 +442,10 @@ class TFRecordSampleParser(foud.LabeledImageSampleParser):
         return self._current_features_cache
 
     def _parse_features(self, sample):
+        if isinstance(sample, dict):
+            # Features were already parsed by the input pipeline
+            return sample
+
         return tf.io.parse_single_example(sample, self._FEATURES)
 
     def _parse_image(self, features):
@@ -524,6 +652,12 @@ class TFRecordsLabeledImageDatasetImporter(
         image_format (None): the image format to use to write the images to
             disk. By default, ``fiftyone.config.default_image_ext`` is used
         force_rgb (False): whether to force convert all images to RGB
+        num_parallel_reads (None): an optional number of record files to
+            read in parallel. If provided, the records of each file are
+            interleaved and parsed in parallel, which changes the order in
+            which the samples are imported. If a negative value is passed,
+            this parameter is set to the number of CPU cores on the host
+            machine. By default, the files are read in series
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
     """
@@ -535,6 +669,7 @@ class TFRecordsLabeledImageDatasetImporter(
         images_dir=None,
         image_format=None,
         force_rgb=False,
+        num_parallel_reads=None,
         max_samples=None,
     ):
         if dataset_dir is None and tf_records_path is None:
@@ -561,6 +696,7 @@ class TFRecordsLabeledImageDatasetImporter(
         self.images_dir = images_dir
         self.image_format = image_format
         self.force_rgb = force_rgb
+        self.num_parallel_reads = num_parallel_reads
 
         self._sample_parser = self._make_sample_parser()
         self._dataset_ingestor = None
@@ -582,9 +718,26 @@ class TFRecordsLabeledImageDatasetImporter(
         return self._sample_parser.has_image_metadata
 
     def setup(self):
+        tf_dataset = from_tf_records(
+            self.tf_records_path, num_parallel_reads=self.num_parallel_reads
+        )
+
+        if self.num_parallel_reads:
+            if self.num_parallel_reads < 0:
+                num_parallel_calls = multiprocessing.cpu_count()
+            else:
+                num_parallel_calls = self.num_parallel_reads
+
+            # Parse the records in parallel as the shards are interleaved
+            features = self._sample_parser._FEATURES
+            tf_dataset = tf_dataset.map(
+                lambda record: tf.io.parse_single_example(record, features),
+                num_parallel_calls=num_parallel_calls,
+            ).prefetch(num_parallel_calls)
+
         self._dataset_ingestor = foud.LabeledImageDatasetIngestor(
             self.images_dir,
-            from_tf_records(self.tf_records_path),
+            tf_dataset,
             self._sample_parser,
             image_format=self.image_format,
             max_samples=self.max_samples,
@@ -635,6 +788,12 @@ class TFImageClassificationDatasetImporter(
         image_format (None): the image format to use to write the images to
             disk. By default, ``fiftyone.config.default_image_ext`` is used
         force_rgb (False): whether to force convert all images to RGB
+        num_parallel_reads (None): an optional number of record files to
+            read in parallel. If provided, the records of each file are
+            interleaved and parsed in parallel, which changes the order in
+            which the samples are imported. If a negative value is passed,
+            this parameter is set to the number of CPU cores on the host
+            machine. By default, the files are read in series
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
     """
@@ -677,6 +836,12 @@ class TFObjectDetectionDatasetImporter(TFRecordsLabeledImageDatasetImporter):
         image_format (None): the image format to use to write the images to
             disk. By default, ``fiftyone.config.default_image_ext`` is used
         force_rgb (False): whether to force convert all images to RGB
+        num_parallel_reads (None): an optional number of record files to
+            read in parallel. If provided, the records of each file are
+            interleaved and parsed in parallel, which changes the order in
+            which the samples are imported. If a negative value is passed,
+            this parameter is set to the number of CPU cores on the host
+            machine. By default, the files are read in series
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
     """
@@ -716,6 +881,11 @@ class TFRecordsDatasetExporter(
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
         force_rgb (False): whether to force convert all images to RGB
+        num_workers (None): an optional number of worker processes to use to
+            generate the records. If provided, each worker writes a disjoint
+            subset of the shards and ``num_shards`` defaults to
+            ``num_workers``. By default, the records are generated in the
+            main process
     """
 
     def __init__(
@@ -725,6 +895,7 @@ class TFRecordsDatasetExporter(
         num_shards=None,
         image_format=None,
         force_rgb=False,
+        num_workers=None,
     ):
         tf_records_path = self._parse_labels_path(
             export_dir=export_dir,
@@ -741,10 +912,12 @@ class TFRecordsDatasetExporter(
         self.num_shards = num_shards
         self.image_format = image_format
         self.force_rgb = force_rgb
+        self.num_workers = num_workers
 
         self._example_generator = None
         self._filename_maker = None
         self._tf_records_writer = None
+        self._parallel_writer = None
 
     @property
     def requires_image_metadata(self):
@@ -755,10 +928,20 @@ class TFRecordsDatasetExporter(
         self._filename_maker = fou.UniqueFilenameMaker(
             default_ext=self.image_format
         )
-        self._tf_records_writer = TFRecordsWriter(
-            self.tf_records_path, num_shards=self.num_shards
-        )
-        self._tf_records_writer.__enter__()
+
+        if self.num_workers:
+            self._parallel_writer = ParallelTFRecordsWriter(
+                self.tf_records_path,
+                self._example_generator,
+                num_shards=self.num_shards,
+                num_workers=self.num_workers,
+            )
+            self._parallel_writer.__enter__()
+        else:
+            self._tf_records_writer = TFRecordsWriter(
+                self.tf_records_path, num_shards=self.num_shards
+            )
+            self._tf_records_writer.__enter__()
 
     def export_sample(self, image_or_path, label, metadata=None):
         if etau.is_str(image_or_path):
@@ -766,13 +949,22 @@ class TFRecordsDatasetExporter(
         else:
             filename = self._filename_maker.get_output_path()
 
+        if self._parallel_writer is not None:
+            self._parallel_writer.write(
+                image_or_path, label, filename=filename
+            )
+            return
+
         tf_example = self._example_generator.make_tf_example(
             image_or_path, label, filename=filename
         )
         self._tf_records_writer.write(tf_example)
 
     def close(self, *args):
-        self._tf_records_writer.__exit__(*args)
+        if self._parallel_writer is not None:
+            self._parallel_writer.__exit__(*args)
+        else:
+            self._tf_records_writer.__exit__(*args)
 
     def _make_example_generator(self):
         """Returns a :class:`TFExampleGenerator` instance that will generate
@@ -810,6 +1002,11 @@ class TFImageClassificationDatasetExporter(TFRecordsDatasetExporter):
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
         force_rgb (False): whether to force convert all images to RGB
+        num_workers (None): an optional number of worker processes to use to
+            generate the records. If provided, each worker writes a disjoint
+            subset of the shards and ``num_shards`` defaults to
+            ``num_workers``. By default, the records are generated in the
+            main process
     """
 
     @property
@@ -846,6 +1043,11 @@ class TFObjectDetectionDatasetExporter(TFRecordsDatasetExporter):
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
         force_rgb (False): whether to force convert all images to RGB
+        num_workers (None): an optional number of worker processes to use to
+            generate the records. If provided, each worker writes a disjoint
+            subset of the shards and ``num_shards`` defaults to
+            ``num_workers``. By default, the records are generated in the
+            main process
         classes (None): the list of possible class labels
     """
 
@@ -856,6 +1058,7 @@ class TFObjectDetectionDatasetExporter(TFRecordsDatasetExporter):
         num_shards=None,
         image_format=None,
         force_rgb=False,
+        num_workers=None,
         classes=None,
     ):
         super().__init__(
@@ -864,6 +1067,7 @@ class TFObjectDetectionDatasetExporter(TFRecordsDatasetExporter):
             num_shards=num_shards,
             image_format=image_format,
             force_rgb=force_rgb,
+            num_workers=num_workers,
         )
 
         self.classes = classes
@@ -904,6 +1108,32 @@ class TFExampleGenerator(object):
             "subclasses must implement make_tf_example()"
         )
 
+    def assign_class_ids(self, label):
+        """Assigns IDs to any new classes in the given label, if this generator
+        assigns class IDs dynamically.
+
+        This allows class IDs to be assigned in sample order when the
+        ``tf.train.Example`` protos are generated by other processes; see
+        :class:`ParallelTFRecordsWriter`.
+
+        Args:
+            label: a :class:`fiftyone.core.labels.Label`, or ``None``
+
+        Returns:
+            a dict mapping the classes in the label to their IDs, or ``None``
+            if this generator does not assign class IDs dynamically
+        """
+        return None
+
+    def add_class_ids(self, class_ids):
+        """Adds the given class IDs, which were assigned via
+        :meth:`assign_class_ids` by another instance of this generator.
+
+        Args:
+            class_ids: a dict mapping classes to IDs
+        """
+        pass
+
     def _parse_image_or_path(self, image_or_path, filename=None):
         if etau.is_str(image_or_path):
             image_path = image_or_path
@@ -1027,6 +1257,23 @@ class TFObjectDetectionExampleGenerator(TFExampleGenerator):
         self._dynamic_classes = dynamic_classes
         self._labels_map_rev = labels_map_rev
 
+    def assign_class_ids(self, detections):
+        if not self._dynamic_classes or detections is None:
+            return None
+
+        class_ids = {}
+        for detection in detections.detections:
+            text = detection.label
+            if text not in self._labels_map_rev:
+                self._labels_map_rev[text] = len(self._labels_map_rev)
+
+            class_ids[text] = self._labels_map_rev[text]
+
+        return class_ids
+
+    def add_class_ids(self, class_ids):
+        self._labels_map_rev.update(class_ids)
+
     def make_tf_example(self, image_or_path, detections, filename=None):
         """Makes a ``tf.train.Example`` for the given data.
 
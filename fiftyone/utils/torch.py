@@ -8,7 +8,10 @@ PyTorch utilities.
 import logging
 import itertools
 import multiprocessing
+import numbers
+import os
 import sys
+import weakref
 
 import cv2
 import numpy as np
@@ -17,6 +20,7 @@ from PIL import Image
 import eta.core.geometry as etag
 import eta.core.image as etai
 import eta.core.learning as etal
+import eta.core.serial as etas
 import eta.core.utils as etau
 
 import fiftyone.core.config as foc
@@ -1540,6 +1544,386 @@ class TorchImagePatchesDataset(Dataset):
         return image_paths, sample_ids, patch_edges, patches
 
 
+def to_torch_dataset(
+    samples,
+    fields=None,
+    snapshot_dir=None,
+    transform=None,
+    use_numpy=False,
+    force_rgb=False,
+    skip_failures=False,
+):
+    """Creates a :class:`TorchImageSnapshotDataset` that serves the images and
+    the given fields of the provided samples.
+
+    The filepaths and field values of the samples are snapshotted into a
+    compact columnar store on disk, which is memory-mapped by the returned
+    dataset, so :class:`torch:torch.utils.data.DataLoader` workers can read
+    from it without copying it or querying the database.
+
+    If no ``snapshot_dir`` is provided, the snapshot is written to a temporary
+    directory in shared memory (``/dev/shm``), when available, which is
+    deleted when the returned dataset is garbage collected.
+
+    Args:
+        samples: a :class:`fiftyone.core.collections.SampleCollection`
+        fields (None): a field or ``embedded.field.name`` or iterable of them
+            to include in the snapshot. The values of each field must be
+            numbers, strings, lists of strings, or (nested) lists or arrays of
+            numbers, e.g., ``"ground_truth.label"`` or
+            ``"ground_truth.detections.bounding_box"``
+        snapshot_dir (None): a directory in which to write the snapshot. If
+            provided, the snapshot can later be reloaded by passing this
+            directory to :class:`TorchImageSnapshotDataset`
+        transform (None): an optional transform function to apply to each
+            image. When ``use_numpy == False``, this is typically a
+            torchvision transform
+        use_numpy (False): whether to use numpy arrays rather than PIL images
+            and Torch tensors when loading data
+        force_rgb (False): whether to force convert the images to RGB
+        skip_failures (False): whether to return an ``Exception`` object rather
+            than raising it if an error occurs while loading a sample
+
+    Returns:
+        a :class:`TorchImageSnapshotDataset`
+    """
+    if fields is None:
+        fields = []
+    elif etau.is_str(fields):
+        fields = [fields]
+    else:
+        fields = list(fields)
+
+    if snapshot_dir is None:
+        basedir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        snapshot_dir = etau.make_temp_dir(basedir=basedir)
+        cleanup = True
+    else:
+        etau.ensure_empty_dir(snapshot_dir)
+        cleanup = False
+
+    _write_snapshot(samples, fields, snapshot_dir)
+
+    dataset = TorchImageSnapshotDataset(
+        snapshot_dir,
+        transform=transform,
+        use_numpy=use_numpy,
+        force_rgb=force_rgb,
+        skip_failures=skip_failures,
+    )
+
+    if cleanup:
+        weakref.finalize(dataset, _delete_snapshot, snapshot_dir, os.getpid())
+
+    return dataset
+
+
+class TorchImageSnapshotDataset(Dataset):
+    """A :class:`torch:torch.utils.data.Dataset` of images and field values
+    backed by a memory-mapped columnar snapshot.
+
+    Instances of this dataset emit ``(img, values)`` pairs for each sample,
+    where ``values`` is a dict mapping the snapshotted field names to their
+    values for the sample. List/array values of numbers are emitted as numpy
+    arrays.
+
+    Snapshots are created via :func:`to_torch_dataset`. The snapshot files are
+    opened lazily in each process that accesses the dataset, so instances of
+    this class are cheap to send to
+    :class:`torch:torch.utils.data.DataLoader` workers.
+
+    Args:
+        snapshot_dir: the directory containing the snapshot
+        transform (None): an optional transform function to apply to each
+            image. When ``use_numpy == False``, this is typically a
+            torchvision transform
+        use_numpy (False): whether to use numpy arrays rather than PIL images
+            and Torch tensors when loading data
+        force_rgb (False): whether to force convert the images to RGB
+        skip_failures (False): whether to return an ``Exception`` object rather
+            than raising it if an error occurs while loading a sample
+    """
+
+    def __init__(
+        self,
+        snapshot_dir,
+        transform=None,
+        use_numpy=False,
+        force_rgb=False,
+        skip_failures=False,
+    ):
+        manifest = etas.read_json(
+            os.path.join(snapshot_dir, _SNAPSHOT_MANIFEST)
+        )
+
+        self.snapshot_dir = snapshot_dir
+        self.transform = transform
+        self.use_numpy = use_numpy
+        self.force_rgb = force_rgb
+        self.skip_failures = skip_failures
+
+        self._num_samples = manifest["num_samples"]
+        self._fields = manifest["fields"]
+        self._field_names = tuple(manifest["field_names"])
+        self._columns = None
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d["_columns"] = None
+        return d
+
+    def __len__(self):
+        return self._num_samples
+
+    def __getitem__(self, idx):
+        columns = self._get_columns()
+
+        try:
+            image_path = _read_column(columns["filepath"], idx)
+            img = _load_image(image_path, self.use_numpy, self.force_rgb)
+
+            if self.transform is not None:
+                img = self.transform(img)
+        except Exception as e:
+            if not self.skip_failures:
+                raise e
+
+            img = e
+
+        values = {
+            field: _read_column(columns[field], idx)
+            for field in self.field_names
+        }
+
+        return img, values
+
+    @property
+    def field_names(self):
+        """The names of the fields in the snapshot."""
+        return self._field_names
+
+    def _get_columns(self):
+        if self._columns is None:
+            self._columns = {
+                f["name"]: _load_column(self.snapshot_dir, idx, f["kind"])
+                for idx, f in enumerate(self._fields)
+            }
+
+        return self._columns
+
+
+_SNAPSHOT_MANIFEST = "manifest.json"
+
+
+def _write_snapshot(samples, fields, snapshot_dir):
+    # Each field is stored as a column of flat numpy arrays (data, offsets,
+    # and missing values) that can be memory-mapped. The filepaths are always
+    # stored, but they are only emitted as values if they were requested
+    field_names = list(dict.fromkeys(fields))
+    columns = ["filepath"] + [f for f in field_names if f != "filepath"]
+
+    num_samples = len(samples)
+    manifest = {
+        "num_samples": num_samples,
+        "field_names": field_names,
+        "fields": [],
+    }
+
+    for idx, field in enumerate(columns):
+        values = samples.values(field)
+        kind = _write_column(values, snapshot_dir, idx, field)
+        manifest["fields"].append({"name": field, "kind": kind})
+
+    etas.write_json(manifest, os.path.join(snapshot_dir, _SNAPSHOT_MANIFEST))
+
+
+def _write_column(values, snapshot_dir, idx, field):
+    kind = _get_column_kind(values, field)
+    missing = np.array([v is None for v in values], dtype=bool)
+
+    if kind == "scalar":
+        arrays = {"data": _encode_scalars(values)}
+    elif kind == "mixed":
+        # Integers and floats are stored separately so that neither is
+        # coerced to the other's type
+        is_int = np.array([_is_int(v) for v in values], dtype=bool)
+        arrays = {
+            "data": np.array(
+                [
+                    v if v is not None and not i else 0
+                    for v, i in zip(values, is_int)
+                ],
+                dtype=float,
+            ),
+            "int_data": np.array(
+                [v if i else 0 for v, i in zip(values, is_int)],
+                dtype=np.int64,
+            ),
+            "is_int": is_int,
+        }
+    elif kind == "str":
+        data, offsets = _encode_strs(values)
+        arrays = {"data": data, "offsets": offsets}
+    elif kind == "str_list":
+        lengths = [len(v) if v is not None else 0 for v in values]
+        strs = list(itertools.chain.from_iterable(v or [] for v in values))
+        data, offsets = _encode_strs(strs)
+        arrays = {
+            "data": data,
+            "offsets": offsets,
+            "list_offsets": _make_offsets(lengths),
+        }
+    else:
+        data, offsets = _encode_arrays(values, field)
+        arrays = {"data": data, "offsets": offsets}
+
+    arrays["missing"] = missing
+
+    for name, arr in arrays.items():
+        np.save(_get_column_path(snapshot_dir, idx, name), arr)
+
+    return kind
+
+
+def _get_column_kind(values, field):
+    values = [v for v in values if v is not None]
+
+    if all(etau.is_str(v) for v in values):
+        return "str" if values else "scalar"
+
+    if all(isinstance(v, (numbers.Number, np.number)) for v in values):
+        has_ints = any(_is_int(v) for v in values)
+        has_floats = any(not _is_int(v) for v in values)
+        return "mixed" if has_ints and has_floats else "scalar"
+
+    if all(isinstance(v, (list, tuple, np.ndarray)) for v in values):
+        items = [i for v in values for i in v if i is not None]
+        if items and all(etau.is_str(i) for i in items):
+            return "str_list"
+
+        return "array"
+
+    raise ValueError(
+        "Field '%s' contains unsupported values. Snapshots can only contain "
+        "numbers, strings, lists of strings, and lists or arrays of numbers"
+        % field
+    )
+
+
+def _is_int(value):
+    return isinstance(value, (numbers.Integral, np.integer, np.bool_))
+
+
+def _encode_scalars(values):
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, (bool, np.bool_)) for v in present):
+        dtype = bool
+    elif present and all(_is_int(v) for v in present):
+        dtype = np.int64
+    else:
+        dtype = float
+
+    return np.array([v if v is not None else 0 for v in values], dtype=dtype)
+
+
+def _encode_strs(strs):
+    encoded = [s.encode() if s is not None else b"" for s in strs]
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    offsets = _make_offsets([len(b) for b in encoded])
+    return data, offsets
+
+
+def _encode_arrays(values, field):
+    arrays = [np.asarray(v) if v is not None else None for v in values]
+    if any(a is not None and a.dtype == object for a in arrays):
+        # Lists containing `None` are stored as floats with `nan`
+        arrays = [
+            np.asarray(v, dtype=float) if v is not None else None
+            for v in values
+        ]
+
+    lengths = [len(a) if a is not None else 0 for a in arrays]
+    arrays = [a for a in arrays if a is not None and a.size > 0]
+
+    if not arrays:
+        return np.zeros(0), _make_offsets(lengths)
+
+    try:
+        data = np.concatenate(arrays, axis=0)
+    except ValueError as e:
+        raise ValueError(
+            "The values of field '%s' have inconsistent shapes" % field
+        ) from e
+
+    return data, _make_offsets(lengths)
+
+
+def _make_offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _get_column_path(snapshot_dir, idx, name):
+    return os.path.join(snapshot_dir, "%d_%s.npy" % (idx, name))
+
+
+def _load_column(snapshot_dir, idx, kind):
+    names = ["data", "missing"]
+    if kind == "mixed":
+        names.extend(["int_data", "is_int"])
+    elif kind in ("str", "array"):
+        names.append("offsets")
+    elif kind == "str_list":
+        names.extend(["offsets", "list_offsets"])
+
+    column = {
+        name: np.load(_get_column_path(snapshot_dir, idx, name), mmap_mode="r")
+        for name in names
+    }
+    column["kind"] = kind
+    return column
+
+
+def _read_column(column, idx):
+    if column["missing"][idx]:
+        return None
+
+    kind = column["kind"]
+
+    if kind == "scalar":
+        return column["data"][idx].item()
+
+    if kind == "mixed":
+        if column["is_int"][idx]:
+            return column["int_data"][idx].item()
+
+        return column["data"][idx].item()
+
+    if kind == "str":
+        return _decode_str(column, idx)
+
+    if kind == "str_list":
+        first, last = column["list_offsets"][idx : idx + 2]
+        return [_decode_str(column, i) for i in range(first, last)]
+
+    # Copy the slice so that the emitted array is writable
+    first, last = column["offsets"][idx : idx + 2]
+    return np.array(column["data"][first:last])
+
+
+def _decode_str(column, idx):
+    first, last = column["offsets"][idx : idx + 2]
+    return column["data"][first:last].tobytes().decode()
+
+
+def _delete_snapshot(snapshot_dir, pid):
+    # Forked DataLoader workers share the finalizer of their parent's dataset,
+    # so only the process that created the snapshot may delete it
+    if os.getpid() == pid:
+        etau.delete_dir(snapshot_dir)
+
+
 def _to_eta_bbox(bounding_box):
     tlx, tly, w, h = bounding_box
     return etag.BoundingBox.from_coords(tlx, tly, tlx + w, tly + h)
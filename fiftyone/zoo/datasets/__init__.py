@@ -9,6 +9,8 @@ download via FiftyOne.
 |
 """
 from collections import OrderedDict
+import hashlib
+import json
 import logging
 import os
 
@@ -16,6 +18,9 @@ import eta.core.serial as etas
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.constants as foc
+import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
 import fiftyone.core.utils as fou
 import fiftyone.utils.data as foud
 
@@ -133,6 +138,7 @@ def load_zoo_dataset(
     drop_existing_dataset=False,
     overwrite=False,
     cleanup=True,
+    snapshot=None,
     **kwargs,
 ):
     """Loads the dataset of the given name from the FiftyOne Dataset Zoo as
@@ -178,6 +184,10 @@ def load_zoo_dataset(
             dataset is to be downloaded
         cleanup (None): whether to cleanup any temporary files generated during
             download
+        snapshot (None): whether to restore the dataset from a cached snapshot
+            of a previous load with the same parameters, if one exists, and to
+            write such a snapshot otherwise. By default,
+            ``fiftyone.config.dataset_zoo_snapshots`` is used
         **kwargs: optional arguments to pass to the
             :class:`fiftyone.utils.data.importers.DatasetImporter` constructor.
             If ``download_if_necessary == True``, then ``kwargs`` can also
@@ -263,6 +273,30 @@ def load_zoo_dataset(
     if splits is None and zoo_dataset.has_splits:
         splits = zoo_dataset.supported_splits
 
+    if snapshot is None:
+        snapshot = fo.config.dataset_zoo_snapshots
+
+    if overwrite:
+        _delete_snapshots(dataset_dir)
+
+    if snapshot:
+        snapshot_dir = _get_snapshot_dir(
+            dataset_dir,
+            zoo_dataset.name,
+            splits,
+            label_field,
+            importer_kwargs,
+        )
+
+        if os.path.isdir(snapshot_dir):
+            logger.info("Loading '%s' from snapshot", zoo_dataset.name)
+            dataset = fo.Dataset(dataset_name)
+            _load_snapshot(dataset, snapshot_dir)
+            logger.info("Dataset '%s' created", dataset.name)
+            return dataset
+    else:
+        snapshot_dir = None
+
     dataset = fo.Dataset(dataset_name)
 
     if splits:
@@ -295,6 +329,9 @@ def load_zoo_dataset(
 
     logger.info("Dataset '%s' created", dataset.name)
 
+    if snapshot_dir is not None:
+        _write_snapshot(dataset, snapshot_dir)
+
     return dataset
 
 
@@ -435,12 +472,80 @@ def delete_zoo_dataset(name, split=None):
 
     # Remove split from ZooDatasetInfo
     dataset_dir = os.path.dirname(split_dir)
+    _delete_snapshots(dataset_dir)
     info = ZooDataset.load_info(dataset_dir)
     info.remove_split(split)
     info_path = ZooDataset.get_info_path(dataset_dir)
     info.write_json(info_path, pretty_print=True)
 
 
+def _get_snapshot_dir(dataset_dir, name, splits, label_field, importer_kwargs):
+    # Snapshots are keyed by everything that affects the contents of the
+    # loaded dataset, including the dataset directory, since snapshots store
+    # absolute filepaths
+    key = json.dumps(
+        {
+            "dataset_dir": dataset_dir,
+            "name": name,
+            "splits": splits,
+            "label_field": label_field,
+            "importer_kwargs": importer_kwargs,
+            "version": foc.VERSION,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    key_hash = hashlib.md5(key.encode()).hexdigest()
+    return os.path.join(dataset_dir, "__snapshots__", key_hash)
+
+
+def _write_snapshot(dataset, snapshot_dir):
+    logger.info("Writing snapshot of '%s'", dataset.name)
+
+    # Write to a temporary directory first so that interrupted writes never
+    # leave behind a partial snapshot
+    tmp_dir = snapshot_dir + ".tmp"
+    try:
+        etau.delete_dir(tmp_dir)
+        foo.export_document(
+            dataset._doc.to_dict(), os.path.join(tmp_dir, "metadata.json")
+        )
+        foo.dump_collection(
+            dataset._sample_collection, os.path.join(tmp_dir, "samples.bson")
+        )
+        if dataset.media_type == fom.VIDEO:
+            foo.dump_collection(
+                dataset._frame_collection,
+                os.path.join(tmp_dir, "frames.bson"),
+            )
+
+        etau.move_dir(tmp_dir, snapshot_dir)
+    except Exception as e:
+        etau.delete_dir(tmp_dir)
+        logger.warning("Failed to write snapshot of '%s': %s", dataset.name, e)
+
+
+def _load_snapshot(dataset, snapshot_dir):
+    # Snapshots are keyed by version, so their documents never need migration
+    # and are inserted as raw BSON without being parsed
+    dataset_dict = foo.import_document(
+        os.path.join(snapshot_dir, "metadata.json")
+    )
+    dataset._merge_doc(foo.DatasetDocument.from_dict(dataset_dict))
+
+    foo.restore_collection(
+        os.path.join(snapshot_dir, "samples.bson"), dataset._sample_collection
+    )
+
+    frames_path = os.path.join(snapshot_dir, "frames.bson")
+    if os.path.isfile(frames_path):
+        foo.restore_collection(frames_path, dataset._frame_collection)
+
+
+def _delete_snapshots(dataset_dir):
+    etau.delete_dir(os.path.join(dataset_dir, "__snapshots__"))
+
+
 def _parse_splits(split, splits):
     if split is None and splits is None:
         return None
@@ -0,0 +1,710 @@
+"""
+Benchmarks for the hot paths of :class:`fiftyone.core.dataset.Dataset`.
+
+Synthetic image and video datasets with dense detections are generated at the
+requested scales, and the runtime, throughput, and memory high-water mark of
+each benchmark are recorded as JSON so that results can be compared across
+commits.
+
+The benchmarks run against the database that FiftyOne is configured to use.
+To benchmark against a specific local ``mongod``, set the
+``FIFTYONE_DATABASE_URI`` environment variable.
+
+Usage::
+
+    # Run all benchmarks on 1k image and video datasets
+    python tests/benchmarking/core_benchmark.py
+
+    # Run specific benchmarks at larger scales and save the results
+    python tests/benchmarking/core_benchmark.py \\
+        --scales 100k 1m --media image \\
+        --benchmarks add_samples values aggregate \\
+        --output results/$(git rev-parse --short HEAD).json
+
+    # Compare with the results of another commit
+    python tests/benchmarking/core_benchmark.py --compare baseline.json
+
+Video datasets at a given scale contain the same total number of frames as
+image datasets contain samples, split into videos of ``--frames-per-video``
+frames.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import argparse
+from collections import OrderedDict
+from datetime import datetime
+import gc
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import eta.core.image as etai
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.constants as foc
+import fiftyone.core.odm as foo
+
+
+SCALES = OrderedDict([("1k", 1000), ("100k", 100000), ("1m", 1000000)])
+MEDIA_TYPES = ("image", "video")
+LABELS = ("cat", "dog", "bird", "car", "person", "tree", "boat", "plane")
+
+# Number of samples that are generated at a time when adding samples
+_GENERATE_BATCH_SIZE = 10000
+
+# Number of distinct media files that synthetic samples point to
+_NUM_MEDIA_FILES = 100
+
+# Number of `/samples` requests that are issued per benchmark
+_NUM_APP_REQUESTS = 10
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the hot paths of FiftyOne datasets"
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        choices=list(SCALES.keys()),
+        default=["1k"],
+        help="the dataset scales to benchmark",
+    )
+    parser.add_argument(
+        "--media",
+        nargs="+",
+        choices=MEDIA_TYPES,
+        default=list(MEDIA_TYPES),
+        help="the media types to benchmark",
+    )
+    parser.add_argument(
+        "--benchmarks",
+        nargs="+",
+        choices=list(BENCHMARKS.keys()),
+        default=list(BENCHMARKS.keys()),
+        help="the benchmarks to run. By default, all are run",
+    )
+    parser.add_argument(
+        "--num-objects",
+        type=int,
+        default=20,
+        help="the number of detections per image or frame",
+    )
+    parser.add_argument(
+        "--frames-per-video",
+        type=int,
+        default=10,
+        help="the number of frames per video",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="the number of times to run each read-only benchmark",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help=(
+            "whether to record the peak Python memory of each benchmark via "
+            "tracemalloc. This slows down the benchmarks"
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        help="a path to write the JSON results",
+    )
+    parser.add_argument(
+        "--compare",
+        help="the path to JSON results of a previous run to compare with",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the relative slowdown that is reported as a regression",
+    )
+    args = parser.parse_args()
+
+    fo.config.show_progress_bars = False
+
+    results = {"info": _get_run_info(args), "results": []}
+
+    with etau.TempDir() as tmp_dir:
+        for media_type in args.media:
+            media_dir = os.path.join(tmp_dir, "media", media_type)
+            filepaths = _make_media(media_dir, media_type)
+
+            for scale in args.scales:
+                ctx = BenchmarkContext(
+                    media_type,
+                    scale,
+                    filepaths,
+                    os.path.join(tmp_dir, "work"),
+                    num_objects=args.num_objects,
+                    frames_per_video=args.frames_per_video,
+                )
+
+                try:
+                    for name in _sort_benchmarks(args.benchmarks):
+                        result = _run_benchmark(
+                            name,
+                            ctx,
+                            repeat=args.repeat,
+                            trace_memory=args.trace_memory,
+                        )
+                        if result is not None:
+                            results["results"].append(result)
+                            _print_result(result)
+                finally:
+                    ctx.cleanup()
+
+    _close_app_client()
+
+    if args.output:
+        etau.ensure_basedir(args.output)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+        print("\nResults written to '%s'" % args.output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = _compare(baseline, results, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+class BenchmarkContext(object):
+    """State shared by the benchmarks of a media type and scale.
+
+    Args:
+        media_type: the media type of the dataset
+        scale: the scale of the dataset
+        filepaths: the media files that samples point to
+        work_dir: a directory in which benchmarks may write files
+        num_objects (20): the number of detections per image or frame
+        frames_per_video (10): the number of frames per video
+    """
+
+    def __init__(
+        self,
+        media_type,
+        scale,
+        filepaths,
+        work_dir,
+        num_objects=20,
+        frames_per_video=10,
+    ):
+        self.media_type = media_type
+        self.scale = scale
+        self.filepaths = filepaths
+        self.work_dir = work_dir
+        self.num_objects = num_objects
+        self.frames_per_video = frames_per_video
+        self.dataset = None
+
+        self._rng = random.Random(51)
+
+    @property
+    def is_video(self):
+        """Whether the dataset contains videos."""
+        return self.media_type == "video"
+
+    @property
+    def num_samples(self):
+        """The number of samples in the dataset."""
+        if self.is_video:
+            return max(1, SCALES[self.scale] // self.frames_per_video)
+
+        return SCALES[self.scale]
+
+    @property
+    def num_labels(self):
+        """The number of ground truth objects in the dataset."""
+        if self.is_video:
+            num_frames = self.num_samples * self.frames_per_video
+            return num_frames * self.num_objects
+
+        return self.num_samples * self.num_objects
+
+    @property
+    def label_prefix(self):
+        """The prefix of label fields in the dataset."""
+        return "frames." if self.is_video else ""
+
+    def get_dataset(self):
+        """Returns the synthetic dataset, populating it if necessary.
+
+        Returns:
+            a :class:`fiftyone.core.dataset.Dataset`
+        """
+        if self.dataset is None:
+            self.dataset = fo.Dataset()
+            for samples in self.iter_sample_batches():
+                self.dataset.add_samples(samples)
+
+        return self.dataset
+
+    def iter_sample_batches(self):
+        """Generates the samples of the dataset in batches.
+
+        Returns:
+            a generator that emits lists of :class:`fiftyone.core.sample.Sample`
+        """
+        num_samples = self.num_samples
+        for start in range(0, num_samples, _GENERATE_BATCH_SIZE):
+            end = min(start + _GENERATE_BATCH_SIZE, num_samples)
+            yield [self._make_sample(idx) for idx in range(start, end)]
+
+    def cleanup(self):
+        """Deletes any datasets and files created by the benchmarks."""
+        if self.dataset is not None:
+            self.dataset.delete()
+            self.dataset = None
+
+        etau.delete_dir(self.work_dir)
+
+    def _make_sample(self, idx):
+        filepath = self.filepaths[idx % len(self.filepaths)]
+        sample = fo.Sample(filepath=filepath)
+
+        if self.is_video:
+            # The videos do not exist, so their metadata is provided
+            sample["metadata"] = fo.VideoMetadata(
+                frame_width=640,
+                frame_height=480,
+                frame_rate=30.0,
+                total_frame_count=self.frames_per_video,
+                duration=self.frames_per_video / 30.0,
+            )
+
+            for frame_number in range(1, self.frames_per_video + 1):
+                sample.frames[frame_number] = fo.Frame(
+                    ground_truth=self._make_detections(),
+                    predictions=self._make_detections(confidence=True),
+                )
+        else:
+            sample["ground_truth"] = self._make_detections()
+            sample["predictions"] = self._make_detections(confidence=True)
+
+        return sample
+
+    def _make_detections(self, confidence=False):
+        detections = []
+        for _ in range(self.num_objects):
+            x, y = self._rng.random() * 0.8, self._rng.random() * 0.8
+            w, h = (
+                0.05 + 0.15 * self._rng.random(),
+                0.05 + 0.15 * self._rng.random(),
+            )
+            detection = fo.Detection(
+                label=self._rng.choice(LABELS),
+                bounding_box=[x, y, w, h],
+            )
+            if confidence:
+                detection.confidence = self._rng.random()
+
+            detections.append(detection)
+
+        return fo.Detections(detections=detections)
+
+
+#
+# Benchmarks
+#
+# Each benchmark accepts a `BenchmarkContext` and returns the number of items
+# that it processed, or None if it is not applicable to the context
+#
+
+
+def benchmark_add_samples(ctx):
+    if ctx.dataset is not None:
+        ctx.dataset.delete()
+
+    ctx.dataset = fo.Dataset()
+
+    elapsed = 0
+    for samples in ctx.iter_sample_batches():
+        start = time.perf_counter()
+        ctx.dataset.add_samples(samples)
+        elapsed += time.perf_counter() - start
+
+    # Only the time spent adding samples is measured, not generating them
+    return ctx.num_samples, elapsed
+
+
+def benchmark_iter_samples(ctx):
+    dataset = ctx.get_dataset()
+    for _ in dataset.iter_samples():
+        pass
+
+    return ctx.num_samples
+
+
+def benchmark_iter_samples_read_only(ctx):
+    dataset = ctx.get_dataset()
+    for sample in dataset.iter_samples(read_only=True):
+        sample.filepath
+
+    return ctx.num_samples
+
+
+def benchmark_values(ctx):
+    dataset = ctx.get_dataset()
+    dataset.values("id")
+    dataset.values(ctx.label_prefix + "ground_truth.detections.label")
+
+    return ctx.num_labels
+
+
+def benchmark_set_values(ctx):
+    dataset = ctx.get_dataset()
+    values = np.random.rand(ctx.num_samples).tolist()
+    dataset.set_values("score", values)
+
+    return ctx.num_samples
+
+
+def benchmark_aggregate(ctx):
+    dataset = ctx.get_dataset()
+    path = ctx.label_prefix + "predictions.detections"
+    dataset.aggregate(
+        [
+            fo.Count(path),
+            fo.CountValues(path + ".label"),
+            fo.Bounds(path + ".confidence"),
+            fo.HistogramValues(path + ".confidence", bins=50),
+        ]
+    )
+
+    return ctx.num_labels
+
+
+def benchmark_filter_labels(ctx):
+    dataset = ctx.get_dataset()
+    view = dataset.filter_labels(
+        ctx.label_prefix + "predictions", fo.ViewField("confidence") > 0.5
+    )
+    view.count(ctx.label_prefix + "predictions.detections")
+
+    return ctx.num_labels
+
+
+def benchmark_evaluate_detections(ctx):
+    dataset = ctx.get_dataset()
+    dataset.evaluate_detections(
+        ctx.label_prefix + "predictions",
+        gt_field=ctx.label_prefix + "ground_truth",
+        eval_key="eval",
+    )
+    dataset.delete_evaluation("eval")
+
+    return ctx.num_labels
+
+
+def benchmark_compute_metadata(ctx):
+    if ctx.is_video and shutil.which("ffprobe") is None:
+        return None
+
+    dataset = ctx.get_dataset()
+    dataset.compute_metadata(overwrite=True)
+
+    return ctx.num_samples
+
+
+def benchmark_export(ctx):
+    dataset = ctx.get_dataset()
+    export_dir = os.path.join(ctx.work_dir, "export")
+    etau.delete_dir(export_dir)
+    dataset.export(
+        export_dir=export_dir,
+        dataset_type=fo.types.FiftyOneDataset,
+        export_media=False,
+    )
+
+    return ctx.num_samples
+
+
+def benchmark_import(ctx):
+    export_dir = os.path.join(ctx.work_dir, "export")
+    if not os.path.isdir(export_dir):
+        benchmark_export(ctx)
+
+    dataset = fo.Dataset.from_dir(
+        dataset_dir=export_dir, dataset_type=fo.types.FiftyOneDataset
+    )
+    dataset.delete()
+
+    return ctx.num_samples
+
+
+def benchmark_app_samples(ctx):
+    client = _get_app_client()
+
+    dataset = ctx.get_dataset()
+    filters = {
+        ctx.label_prefix
+        + "predictions.detections.confidence": {
+            "range": [0.5, 1.0],
+            "exclude": False,
+            "none": False,
+            "nan": False,
+            "ninf": False,
+            "inf": False,
+        }
+    }
+
+    for page in range(1, _NUM_APP_REQUESTS + 1):
+        response = client.post(
+            "/samples",
+            json={
+                "dataset": dataset.name,
+                "view": [],
+                "filters": filters,
+                "page": page,
+                "page_length": 20,
+            },
+        )
+        response.raise_for_status()
+
+    return _NUM_APP_REQUESTS
+
+
+_APP_CLIENT = None
+
+
+def _get_app_client():
+    global _APP_CLIENT
+
+    # The server's database client is bound to the event loop of the first
+    # client, so a single client is used for all benchmarks
+    if _APP_CLIENT is None:
+        from starlette.applications import Starlette
+        from starlette.routing import Route
+        from starlette.testclient import TestClient
+        from fiftyone.server.routes import routes
+
+        # The full App also serves its static build, which may not exist
+        app = Starlette(routes=[Route(r, e) for r, e in routes])
+
+        _APP_CLIENT = TestClient(app)
+        _APP_CLIENT.__enter__()
+
+    return _APP_CLIENT
+
+
+def _close_app_client():
+    global _APP_CLIENT
+
+    if _APP_CLIENT is not None:
+        _APP_CLIENT.__exit__(None, None, None)
+        _APP_CLIENT = None
+
+
+BENCHMARKS = OrderedDict(
+    [
+        ("add_samples", benchmark_add_samples),
+        ("iter_samples", benchmark_iter_samples),
+        ("iter_samples_read_only", benchmark_iter_samples_read_only),
+        ("values", benchmark_values),
+        ("set_values", benchmark_set_values),
+        ("aggregate", benchmark_aggregate),
+        ("filter_labels", benchmark_filter_labels),
+        ("evaluate_detections", benchmark_evaluate_detections),
+        ("compute_metadata", benchmark_compute_metadata),
+        ("export", benchmark_export),
+        ("import", benchmark_import),
+        ("app_samples", benchmark_app_samples),
+    ]
+)
+
+# Benchmarks that modify the dataset are only run once
+_MUTATING_BENCHMARKS = {"add_samples"}
+
+
+def _sort_benchmarks(names):
+    names = set(names)
+    return [name for name in BENCHMARKS.keys() if name in names]
+
+
+def _run_benchmark(name, ctx, repeat=1, trace_memory=False):
+    benchmark = BENCHMARKS[name]
+
+    if name in _MUTATING_BENCHMARKS:
+        repeat = 1
+    elif name != "import":
+        # Untimed setup
+        ctx.get_dataset()
+
+    times = []
+    num_items = None
+    peak_traced = 0
+    rss_before = _get_peak_rss_mb()
+
+    for _ in range(repeat):
+        gc.collect()
+        if trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        output = benchmark(ctx)
+        elapsed = time.perf_counter() - start
+
+        if trace_memory:
+            peak_traced = max(peak_traced, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        if output is None:
+            return None
+
+        if isinstance(output, tuple):
+            num_items, elapsed = output
+        else:
+            num_items = output
+
+        times.append(elapsed)
+
+    rss_after = _get_peak_rss_mb()
+    best = min(times)
+
+    result = OrderedDict()
+    result["benchmark"] = name
+    result["media_type"] = ctx.media_type
+    result["scale"] = ctx.scale
+    result["num_samples"] = ctx.num_samples
+    result["num_items"] = num_items
+    result["repeat"] = len(times)
+    result["seconds"] = best
+    result["mean_seconds"] = sum(times) / len(times)
+    result["items_per_second"] = num_items / best if best > 0 else None
+    result["peak_rss_mb"] = rss_after
+    result["peak_rss_increase_mb"] = rss_after - rss_before
+    result["peak_traced_mb"] = (
+        peak_traced / 1024**2 if trace_memory else None
+    )
+
+    return result
+
+
+def _get_peak_rss_mb():
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return maxrss / 1024**2  # bytes
+
+    return maxrss / 1024  # kilobytes
+
+
+def _get_run_info(args):
+    info = OrderedDict()
+    info["timestamp"] = datetime.utcnow().isoformat()
+    info["commit"] = _get_git_revision_hash()
+    info["fiftyone_version"] = foc.VERSION
+    info["python_version"] = platform.python_version()
+    info["platform"] = platform.platform()
+    info["mongodb_version"] = foo.get_db_client().server_info()["version"]
+    info["num_objects"] = args.num_objects
+    info["frames_per_video"] = args.frames_per_video
+    return info
+
+
+def _get_git_revision_hash():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stderr=subprocess.DEVNULL,
+            )
+            .strip()
+            .decode("utf-8")
+        )
+    except Exception:
+        return None
+
+
+def _make_media(media_dir, media_type):
+    etau.ensure_dir(media_dir)
+
+    if media_type == "video":
+        # Videos are never decoded by the benchmarks
+        return [
+            os.path.join(media_dir, "video%d.mp4" % idx)
+            for idx in range(_NUM_MEDIA_FILES)
+        ]
+
+    filepaths = []
+    for idx in range(_NUM_MEDIA_FILES):
+        filepath = os.path.join(media_dir, "image%d.jpg" % idx)
+        img = np.random.randint(0, 255, size=(480, 640, 3), dtype=np.uint8)
+        etai.write(img, filepath)
+        filepaths.append(filepath)
+
+    return filepaths
+
+
+def _print_result(result):
+    print(
+        "%-24s %-6s %-5s %10.3fs %14s items/s %10.1f MB peak RSS"
+        % (
+            result["benchmark"],
+            result["media_type"],
+            result["scale"],
+            result["seconds"],
+            "%.1f" % result["items_per_second"]
+            if result["items_per_second"]
+            else "-",
+            result["peak_rss_mb"],
+        )
+    )
+
+
+def _compare(baseline, results, threshold):
+    def _key(r):
+        return r["benchmark"], r["media_type"], r["scale"]
+
+    baseline_results = {_key(r): r for r in baseline["results"]}
+
+    print("\nComparison with commit %s" % baseline["info"].get("commit", None))
+
+    regressions = []
+    for result in results["results"]:
+        other = baseline_results.get(_key(result), None)
+        if other is None:
+            continue
+
+        ratio = result["seconds"] / max(other["seconds"], 1e-9)
+        status = ""
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(result)
+        elif ratio < 1 - threshold:
+            status = "improvement"
+
+        print(
+            "%-24s %-6s %-5s %10.3fs -> %10.3fs (%5.2fx) %s"
+            % (
+                _key(result)
+                + (other["seconds"], result["seconds"], ratio, status)
+            )
+        )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    main()
@@ -40,6 +40,22 @@ def test_zoo_partial():
     assert len(dataset.match_tags("test")) == 5
 
 
+def test_zoo_snapshot():
+    dataset = foz.load_zoo_dataset(
+        "quickstart", drop_existing_dataset=True, snapshot=True
+    )
+    num_samples = len(dataset)
+    schema = dataset.get_field_schema()
+    dataset.delete()
+
+    # Second load is restored from the snapshot
+    dataset = foz.load_zoo_dataset("quickstart", snapshot=True)
+
+    assert len(dataset) == num_samples
+    assert dataset.get_field_schema().keys() == schema.keys()
+    assert dataset.count("ground_truth.detections") > 0
+
+
 def test_coco_2017():
     dataset = foz.load_zoo_dataset(
         "coco-2017",
@@ -5,6 +5,8 @@ Tests for the :mod:`fiftyone.utils.torch` module.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
+import pickle
 import unittest
 
 import numpy as np
@@ -12,6 +14,8 @@ from PIL import Image
 import torch
 import torchvision
 
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.utils.torch as fout
 
@@ -51,6 +55,97 @@ def test_torch_max_size():
     assert result.size == (200, 200)
 
 
+def test_to_torch_dataset():
+    with etau.TempDir() as tmp_dir:
+        samples = []
+        for i in range(3):
+            filepath = os.path.join(tmp_dir, "image%d.png" % i)
+            _get_fake_img(16, 16).save(filepath)
+            samples.append(fo.Sample(filepath=filepath))
+
+        samples[0]["label"] = "cat"
+        samples[0]["count"] = 1
+        samples[0]["score"] = 0.5
+        samples[0]["info"] = {"mixed": 1}
+        samples[0]["words"] = ["a", "b"]
+        samples[0]["gt"] = fo.Detections(
+            detections=[
+                fo.Detection(label="cat", bounding_box=[0, 0, 0.5, 0.5])
+            ]
+        )
+
+        samples[1]["label"] = "dog"
+        samples[1]["count"] = 2**60
+        samples[1]["score"] = 1.0
+        samples[1]["info"] = {"mixed": 0.25}
+        samples[1]["gt"] = fo.Detections()
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        fields = [
+            "filepath",
+            "label",
+            "count",
+            "score",
+            "info.mixed",
+            "words",
+            "gt.detections.bounding_box",
+        ]
+
+        snapshot_dir = os.path.join(tmp_dir, "snapshot")
+        torch_dataset = fout.to_torch_dataset(
+            dataset,
+            fields=fields,
+            snapshot_dir=snapshot_dir,
+            use_numpy=True,
+        )
+
+        assert len(torch_dataset) == 3
+        assert torch_dataset.field_names == tuple(fields)
+
+        # Snapshots can be reloaded and pickled for DataLoader workers
+        reloaded = fout.TorchImageSnapshotDataset(snapshot_dir, use_numpy=True)
+        reloaded = pickle.loads(pickle.dumps(reloaded))
+
+        for ds in (torch_dataset, reloaded):
+            img, values = ds[0]
+            assert img.shape[:2] == (16, 16)
+            assert values["filepath"] == samples[0].filepath
+            assert values["label"] == "cat"
+            assert values["count"] == 1 and isinstance(values["count"], int)
+            assert values["score"] == 0.5
+            assert values["info.mixed"] == 1
+            assert isinstance(values["info.mixed"], int)
+            assert values["words"] == ["a", "b"]
+            np.testing.assert_array_equal(
+                values["gt.detections.bounding_box"], [[0, 0, 0.5, 0.5]]
+            )
+
+            _, values = ds[1]
+            assert values["count"] == 2**60
+            assert values["info.mixed"] == 0.25
+            assert values["words"] is None
+            assert len(values["gt.detections.bounding_box"]) == 0
+
+            _, values = ds[2]
+            assert values["label"] is None
+            assert values["count"] is None
+            assert values["gt.detections.bounding_box"] is None
+
+        data_loader = torch.utils.data.DataLoader(
+            fout.to_torch_dataset(dataset, fields="label"),
+            batch_size=3,
+            collate_fn=lambda batch: batch,
+        )
+        batch = next(iter(data_loader))
+        assert [values for _, values in batch] == [
+            {"label": "cat"},
+            {"label": "dog"},
+            {"label": None},
+        ]
+
+
 @unittest.skip("Must be run manually")
 def test_torch_image_patches_dataset():
     image_path = "/path/to/an/image.png"
@@ -8,8 +8,12 @@ FiftyOne dataset-related unit tests.
 from datetime import date, datetime
 import gc
 import os
+import time
+from unittest import mock
 
+from bson import ObjectId
 import numpy as np
+from pymongo.errors import CursorNotFound
 import pytz
 import unittest
 
@@ -18,6 +22,7 @@ import eta.core.utils as etau
 import fiftyone as fo
 from fiftyone import ViewField as F
 import fiftyone.core.odm as foo
+import fiftyone.core.profiling as fopf
 
 from decorators import drop_datasets
 
@@ -27,6 +32,31 @@ class DatasetTests(unittest.TestCase):
     def test_list_datasets(self):
         self.assertIsInstance(fo.list_datasets(), list)
 
+    @drop_datasets
+    def test_list_datasets_info(self):
+        dataset_name = self.test_list_datasets_info.__name__
+        dataset = fo.Dataset(dataset_name)
+        dataset.tags = ["test"]
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(3)]
+        )
+
+        info = {i["name"]: i for i in fo.list_datasets(info=True)}
+        i = info[dataset_name]
+
+        self.assertEqual(i["media_type"], "image")
+        self.assertEqual(i["tags"], ["test"])
+        self.assertEqual(i["persistent"], False)
+        self.assertEqual(i["version"], dataset.version)
+        self.assertIsNotNone(i["created_at"])
+        self.assertEqual(i["num_samples"], 3)
+
+        # Writes invalidate cached counts
+        dataset.add_sample(fo.Sample(filepath="image3.jpg"))
+
+        info = {i["name"]: i for i in fo.list_datasets(info=True)}
+        self.assertEqual(info[dataset_name]["num_samples"], 4)
+
     @drop_datasets
     def test_delete_dataset(self):
         IGNORED_DATASET_NAMES = fo.list_datasets()
@@ -212,6 +242,67 @@ class DatasetTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             dataset.create_index("non_existent_field")
 
+    @drop_datasets
+    def test_add_samples(self):
+        dataset = fo.Dataset()
+
+        samples = [fo.Sample(filepath="image%d.jpg" % i) for i in range(1000)]
+        sample_ids = dataset.add_samples(samples)
+
+        self.assertListEqual(sample_ids, [s.id for s in samples])
+        self.assertListEqual(dataset.values("id"), sample_ids)
+        self.assertTrue(all(s.in_dataset for s in samples))
+
+    @drop_datasets
+    def test_add_samples_error(self):
+        dataset = fo.Dataset()
+
+        samples = [
+            fo.Sample(filepath="image%d.jpg" % i, text="x" * 4096)
+            for i in range(1000)
+        ]
+
+        def _iter_samples():
+            for idx, sample in enumerate(samples):
+                if idx == 900:
+                    raise ValueError("Failed to load sample")
+
+                yield sample
+
+        with self.assertRaises(ValueError):
+            dataset.add_samples(_iter_samples())
+
+        # All samples that were written before the error are finalized
+        added_ids = [s.id for s in samples if s.in_dataset]
+        self.assertGreater(len(added_ids), 0)
+        self.assertListEqual(dataset.values("id"), added_ids)
+
+    @drop_datasets
+    def test_upsert_samples(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, index=i) for i in range(5)]
+        )
+
+        samples = [
+            fo.Sample(filepath="image%d.jpg" % i, foo="bar%d" % i)
+            for i in range(3, 8)
+        ]
+        with fopf.collect() as sink:
+            dataset.merge_samples(samples, key_fcn=lambda s: s.filepath)
+
+        self.assertEqual(
+            sink.to_dict()["timers"]["upsert_samples"]["count"], 1
+        )
+        self.assertEqual(len(dataset), 8)
+        self.assertListEqual(
+            dataset.values("index"), [0, 1, 2, 3, 4, None, None, None]
+        )
+        self.assertListEqual(
+            dataset.values("foo"),
+            [None, None, None, "bar3", "bar4", "bar5", "bar6", "bar7"],
+        )
+
     @drop_datasets
     def test_iter_samples(self):
         dataset = fo.Dataset()
@@ -225,6 +316,169 @@ class DatasetTests(unittest.TestCase):
         for sample in dataset.iter_samples(progress=True):
             pass
 
+        filepaths = [s.filepath for s in dataset]
+
+        self.assertListEqual(
+            [s.filepath for s in dataset.iter_samples(batch_size=7)],
+            filepaths,
+        )
+        self.assertListEqual(
+            [
+                s.filepath
+                for s in dataset.iter_samples(batch_size=7, prefetch=True)
+            ],
+            filepaths,
+        )
+
+        sample = next(dataset.iter_samples(read_only=True))
+        self.assertEqual(sample.id, dataset.first().id)
+        self.assertEqual(sample.filepath, filepaths[0])
+        with self.assertRaises(ValueError):
+            sample.filepath = "other.jpg"
+
+        view = dataset.skip(10).limit(20)
+        self.assertListEqual(
+            [
+                s.filepath
+                for s in view.iter_samples(batch_size=7, prefetch=True)
+            ],
+            filepaths[10:30],
+        )
+
+    @drop_datasets
+    def test_iter_samples_cursor_timeout(self):
+        def _timeout_after(dataset, num_samples):
+            # Patches the dataset so that its first cursor times out after
+            # emitting the given number of samples
+            iter_sample_dicts = dataset._iter_sample_dicts
+            pipelines = []
+
+            def _iter_sample_dicts(pipeline, **kwargs):
+                pipelines.append(pipeline)
+                docs = iter_sample_dicts(pipeline, **kwargs)
+                if len(pipelines) > 1:
+                    return docs
+
+                def _iter():
+                    for idx, d in enumerate(docs):
+                        if idx >= num_samples:
+                            raise CursorNotFound("cursor id not found")
+
+                        yield d
+
+                if kwargs.get("prefetch", False):
+                    return fo.core.utils.iter_prefetched(_iter(), 2)
+
+                return _iter()
+
+            patch = mock.patch.object(
+                dataset, "_iter_sample_dicts", _iter_sample_dicts
+            )
+            return patch, pipelines
+
+        # The natural order of the unseen samples differs from their ID order
+        dataset = fo.Dataset()
+        ids = [ObjectId() for _ in range(10)]
+        dataset._sample_collection.insert_many(
+            [
+                {
+                    "_id": _id,
+                    "filepath": "/image%d.jpg" % i,
+                    "_media_type": "image",
+                    "tags": [],
+                    "_rand": 0.5,
+                }
+                for i, _id in enumerate(ids[:4] + ids[:3:-1])
+            ]
+        )
+
+        filepaths = ["/image%d.jpg" % i for i in range(10)]
+        self.assertListEqual(dataset.values("filepath"), filepaths)
+
+        for prefetch in (False, True):
+            patch, pipelines = _timeout_after(dataset, 4)
+            with patch:
+                values = [
+                    s.filepath for s in dataset.iter_samples(prefetch=prefetch)
+                ]
+
+            self.assertListEqual(values, filepaths)
+            self.assertEqual(len(pipelines), 2)
+            self.assertIn({"$match": {"_id": {"$gt": ids[3]}}}, pipelines[1])
+
+        # Seen samples were deleted during iteration, so we must skip
+        patch, pipelines = _timeout_after(dataset, 4)
+        values = []
+        with patch:
+            for sample in dataset.iter_samples():
+                values.append(sample.filepath)
+                if len(values) == 2:
+                    dataset.delete_samples(str(ids[0]))
+
+        self.assertEqual(len(pipelines), 2)
+        self.assertIn({"$skip": 4}, pipelines[1])
+
+    @drop_datasets
+    def test_iter_samples_read_only(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpg",
+                    foo="bar",
+                    ground_truth=fo.Detections(
+                        detections=[fo.Detection(label="cat")]
+                    ),
+                ),
+                fo.Sample(filepath="image2.jpg"),
+            ]
+        )
+
+        sample1, sample2 = list(dataset.iter_samples(read_only=True))
+
+        # Label fields
+        self.assertIsInstance(sample1.ground_truth, fo.Detections)
+        self.assertEqual(sample1.ground_truth.detections[0].label, "cat")
+        self.assertEqual(
+            sample1["ground_truth"].detections[0].id,
+            dataset.first().ground_truth.detections[0].id,
+        )
+        self.assertIsNone(sample2.ground_truth)
+
+        # Missing fields
+        with self.assertRaises(AttributeError):
+            sample1.missing
+
+        with self.assertRaises(KeyError):
+            sample1["missing"]
+
+        self.assertFalse(sample1.has_field("missing"))
+
+        # select_fields() views
+        view = dataset.select_fields("ground_truth")
+        sample = next(view.iter_samples(read_only=True))
+
+        self.assertIn("ground_truth", sample.field_names)
+        self.assertNotIn("foo", sample.field_names)
+        self.assertFalse(sample.has_field("foo"))
+        with self.assertRaises(AttributeError):
+            sample.foo
+
+        self.assertEqual(sample.ground_truth.detections[0].label, "cat")
+
+        # Equality and hashing
+        sample1b = next(dataset.iter_samples(read_only=True))
+        self.assertEqual(sample1, sample1b)
+        self.assertNotEqual(sample1, sample2)
+        self.assertEqual(len({sample1, sample1b, sample2}), 2)
+
+        # Unassigned slots must not be resolved as fields
+        blank = fo.core.sample.ReadOnlySample.__new__(
+            fo.core.sample.ReadOnlySample
+        )
+        with self.assertRaises(AttributeError):
+            blank._values
+
     @drop_datasets
     def test_date_fields(self):
         dataset = fo.Dataset()
@@ -289,6 +543,108 @@ class DatasetTests(unittest.TestCase):
         self.assertEqual(int((sample1.date - sample2.date).total_seconds()), 0)
         self.assertEqual(int((sample1.date - sample3.date).total_seconds()), 0)
 
+    @drop_datasets
+    def test_change_tracking(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i, index=i) for i in range(4)]
+        )
+
+        with self.assertRaises(ValueError):
+            dataset.changes_since(datetime.utcnow())
+
+        dataset.enable_change_tracking()
+
+        self.assertTrue(dataset.tracks_changes)
+        self.assertIn("last_modified_at", dataset.list_indexes())
+        self.assertEqual(dataset.count("last_modified_at"), 4)
+
+        timestamp = datetime.utcnow()
+        time.sleep(0.01)
+
+        self.assertEqual(len(dataset.changes_since(timestamp)), 0)
+
+        sample = dataset.first()
+        sample["foo"] = "bar"
+        sample.save()
+
+        dataset.add_sample(fo.Sample(filepath="image4.png", index=4))
+        dataset.skip(4).set_values("foo", ["baz"])
+
+        view = dataset.changes_since(timestamp)
+        self.assertListEqual(view.values("index"), [0, 4])
+
+        timestamp = datetime.utcnow()
+        time.sleep(0.01)
+
+        dataset.limit(2).set_field("foo", "spam").save()
+
+        view = dataset.changes_since(timestamp)
+        self.assertListEqual(view.values("index"), [0, 1])
+
+        dataset.disable_change_tracking()
+
+        self.assertFalse(dataset.tracks_changes)
+        self.assertNotIn("last_modified_at", dataset.list_indexes())
+        self.assertNotIn("last_modified_at", dataset.get_field_schema())
+
+    @drop_datasets
+    def test_set_values_reload(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i, index=i) for i in range(3)]
+        )
+
+        samples = list(dataset)
+        samples[2]["index"] = 100  # unsaved edit
+
+        dataset.limit(2).set_values("foo", ["a", "b"])
+
+        # Only the modified samples are reloaded
+        self.assertEqual(samples[0]["foo"], "a")
+        self.assertEqual(samples[1]["foo"], "b")
+        self.assertEqual(samples[2]["index"], 100)
+
+        dataset.set_values("index", [0, 10, 20])
+
+        self.assertListEqual([s["index"] for s in samples], [0, 10, 20])
+
+        dataset2 = fo.Dataset()
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(index=1)
+        sample.frames[2] = fo.Frame(index=2)
+        dataset2.add_sample(sample)
+
+        frame1 = sample.frames[1]
+        frame2 = sample.frames[2]
+
+        dataset2.match_frames(F("index") == 2).set_values(
+            "frames.foo", [["bar"]]
+        )
+
+        self.assertIsNone(frame1["foo"])
+        self.assertEqual(frame2["foo"], "bar")
+
+    @drop_datasets
+    def test_set_values_reload_video(self):
+        dataset = fo.Dataset()
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(index=1)
+        dataset.add_sample(sample)
+
+        doc = sample._doc
+        frame = sample.frames[1]
+
+        # Modify the frames without going through the in-memory objects
+        dataset._frame_collection.update_many({}, {"$set": {"index": 10}})
+
+        dataset.set_values("foo", ["bar"])
+
+        # Backing documents are reloaded in place, along with their frames
+        self.assertIs(sample._doc, doc)
+        self.assertEqual(sample["foo"], "bar")
+        self.assertEqual(frame["index"], 10)
+
     @drop_datasets
     def test_merge_samples1(self):
         # Windows compatibility
@@ -1385,6 +1385,63 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_open_images(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_incremental(self):
+        dataset = self._make_detections_dataset()
+
+        with self.assertRaises(ValueError):
+            dataset.evaluate_detections(
+                "predictions", eval_key="eval", incremental=True
+            )
+
+        dataset.enable_change_tracking()
+
+        # mAP cannot be computed incrementally
+        with self.assertRaises(ValueError):
+            dataset.evaluate_detections(
+                "predictions",
+                eval_key="eval",
+                incremental=True,
+                compute_mAP=True,
+            )
+
+        results = dataset.evaluate_detections(
+            "predictions", eval_key="eval", incremental=True
+        )
+
+        self.assertEqual(len(results.sample_ids), len(results.ytrue))
+        self.assertListEqual(dataset.values("eval_tp"), [0, 0, 0, 1, 0])
+
+        # Writing the evaluation results does not count as a change
+        self.assertEqual(len(dataset.changes_since(results.started_at)), 0)
+
+        sample = dataset.last()
+        sample.predictions.detections[0].label = "cat"
+        sample.save()
+
+        sample = dataset.skip(1).first()
+        sample.ground_truth = None
+        sample.save()
+
+        results = dataset.evaluate_detections(
+            "predictions", eval_key="eval", incremental=True
+        )
+
+        self.assertListEqual(dataset.values("eval_tp"), [0, 0, 0, 1, 1])
+        self.assertListEqual(dataset.values("eval_fp"), [0, 0, 1, 0, 0])
+        self.assertListEqual(dataset.values("eval_fn"), [0, 0, 0, 0, 0])
+        self.assertListEqual(
+            sorted(results.ytrue.tolist()), ["(none)", "cat", "cat"]
+        )
+        self.assertListEqual(
+            sorted(results.ypred.tolist()), ["cat", "cat", "cat"]
+        )
+
+        # Non-incremental evaluations do not store per-sample results
+        results = dataset.evaluate_detections("predictions", eval_key="eval2")
+        self.assertIsNone(results.sample_ids)
+        self.assertIsNone(results.started_at)
+
 
 class VideoDetectionsTests(unittest.TestCase):
     def _make_video_detections_dataset(self):
@@ -1882,6 +1939,56 @@ class SegmentationTests(unittest.TestCase):
         self.assertNotIn("eval_precision", dataset.get_field_schema())
         self.assertNotIn("eval_recall", dataset.get_field_schema())
 
+    @drop_datasets
+    def test_evaluate_segmentations_parallel(self):
+        dataset = self._make_segmentation_dataset()
+
+        # rows = GT, cols = predicted, labels = [0, 1, 2]
+        expected = np.array([[2, 1, 1], [1, 1, 0], [1, 0, 1]], dtype=int)
+
+        for num_workers in (1, 2):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # suppress missing masks
+
+                # Mask values are discovered during evaluation
+                results = dataset.evaluate_segmentations(
+                    "predictions",
+                    gt_field="ground_truth",
+                    eval_key="eval",
+                    num_workers=num_workers,
+                )
+
+            self.assertListEqual(results.classes.tolist(), ["0", "1", "2"])
+
+            actual = results.confusion_matrix()
+            self.assertTrue((actual == expected).all())
+
+            self.assertListEqual(
+                dataset.values("eval_accuracy"), [None, None, None, 1.0, 0.0]
+            )
+
+            dataset.delete_evaluation("eval")
+
+        # Per-sample macro-averaged metrics depend on all mask values, which
+        # are computed before evaluating when not provided
+        recalls = []
+        for mask_targets in ({0: "0", 1: "1", 2: "2"}, None):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # suppress missing masks
+
+                dataset.evaluate_segmentations(
+                    "predictions",
+                    gt_field="ground_truth",
+                    eval_key="eval",
+                    mask_targets=mask_targets,
+                    average="macro",
+                )
+
+            recalls.append(dataset.values("eval_recall"))
+            dataset.delete_evaluation("eval")
+
+        self.assertListEqual(recalls[0], recalls[1])
+
 
 class VideoSegmentationTests(unittest.TestCase):
     def _make_video_segmentation_dataset(self):
@@ -9,6 +9,9 @@ import os
 import random
 import string
 import unittest
+from unittest import mock
+
+from bson import ObjectId
 
 import cv2
 import numpy as np
@@ -20,7 +23,10 @@ import eta.core.video as etav
 
 import fiftyone as fo
 import fiftyone.utils.coco as fouc
+import fiftyone.utils.data as foud
 import fiftyone.utils.yolo as fouy
+import fiftyone.zoo as foz
+import fiftyone.zoo.datasets as fozd
 from fiftyone.core.expressions import ViewField as F
 
 from decorators import drop_datasets
@@ -365,6 +371,62 @@ class UnlabeledImageDatasetTests(ImageDatasetTests):
 
         self.assertEqual(len(dataset), len(dataset2))
 
+    def test_resume_media_export(self):
+        filepaths = [self._new_image() for _ in range(5)]
+        export_dir = self._new_dir()
+
+        # Existing files that were not written by a previous export are never
+        # overwritten
+        unrelated_path = os.path.join(
+            export_dir, os.path.basename(filepaths[0])
+        )
+        etau.write_file("unrelated", unrelated_path)
+
+        exporter = foud.ImageExporter(
+            True, export_path=export_dir, resume=True
+        )
+        exporter.setup()
+        outpaths1 = [exporter.export(filepath)[0] for filepath in filepaths]
+        exporter.close()
+
+        self.assertEqual(exporter.metrics["num_files"], 5)
+        self.assertEqual(len(etau.list_files(export_dir)), 6)
+        self.assertNotIn(unrelated_path, outpaths1)
+        with open(unrelated_path) as f:
+            self.assertEqual(f.read(), "unrelated")
+
+        exporter = foud.ImageExporter(
+            True, export_path=export_dir, num_workers=4, resume=True
+        )
+        exporter.setup()
+        outpaths2 = [exporter.export(filepath)[0] for filepath in filepaths]
+        exporter.close()
+
+        self.assertEqual(exporter.metrics["num_files"], 0)
+        self.assertEqual(exporter.metrics["num_skipped"], 5)
+        self.assertEqual(len(etau.list_files(export_dir)), 6)
+        self.assertListEqual(outpaths2, outpaths1)
+
+    def test_media_export_error(self):
+        export_dir = self._new_dir()
+        filepath = self._new_image()
+
+        class _Exporter(foud.ImageDirectoryExporter):
+            def close(self, *args):
+                super().close(*args)
+                raise RuntimeError("close failed")
+
+        # Errors raised while closing don't mask the error that interrupted
+        # the export
+        with self.assertRaises(ValueError):
+            with _Exporter(export_dir) as exporter:
+                exporter.export_sample(filepath)
+                raise ValueError("export failed")
+
+        with self.assertRaises(RuntimeError):
+            with _Exporter(export_dir) as exporter:
+                exporter.export_sample(filepath)
+
 
 class ImageClassificationDatasetTests(ImageDatasetTests):
     def _make_dataset(self):
@@ -878,6 +940,31 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
             dataset2.count("predictions.detections"),
         )
 
+        # Parallel export and import
+
+        export_dir = self._new_dir()
+        images_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.TFObjectDetectionDataset,
+            num_workers=2,
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.TFObjectDetectionDataset,
+            images_dir=images_dir,
+            label_field="predictions",
+            num_parallel_reads=2,
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+        self.assertDictEqual(
+            dataset.count_values("predictions.detections.label"),
+            dataset2.count_values("predictions.detections.label"),
+        )
+
     @drop_datasets
     def test_coco_detection_dataset(self):
         dataset = self._make_dataset()
@@ -1943,6 +2030,69 @@ class MultitaskImageDatasetTests(ImageDatasetTests):
         info2 = dataset2.get_evaluation_info("test")
         self.assertEqual(info.key, info2.key)
 
+    @skipwindows
+    @drop_datasets
+    def test_fiftyone_dataset_incremental(self):
+        dataset = self._make_dataset()
+        dataset.enable_change_tracking()
+        export_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            incremental=True,
+        )
+
+        sample = dataset.first()
+        sample["weather"].label = "rainy"
+        sample.save()
+
+        # Only the records of samples that changed are rewritten, so an
+        # untracked modification is not picked up
+        last_id = ObjectId(dataset.last().id)
+        dataset._sample_collection.update_one(
+            {"_id": last_id}, {"$set": {"weather.label": "untracked"}}
+        )
+
+        dataset.delete_samples(dataset.last())
+        dataset.add_sample(fo.Sample(filepath=self._new_image()))
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            incremental=True,
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+        self.assertListEqual(dataset.values("id"), dataset2.values("id"))
+        self.assertListEqual(
+            dataset.values("weather.label")[:-1],
+            dataset2.values("weather.label")[:-1],
+        )
+        self.assertEqual(dataset2.first().weather.label, "rainy")
+        self.assertNotIn("untracked", dataset2.values("weather.label"))
+        self.assertListEqual(
+            [os.path.basename(f) for f in dataset.values("filepath")],
+            [os.path.basename(f) for f in dataset2.values("filepath")],
+        )
+        self.assertEqual(
+            len(etau.list_files(os.path.join(export_dir, "data"))),
+            len(dataset),
+        )
+
+        dataset.export(
+            export_dir=export_dir, dataset_type=fo.types.FiftyOneDataset
+        )
+
+        self.assertFalse(
+            os.path.isfile(os.path.join(export_dir, "manifest.json"))
+        )
+
 
 class OpenLABELImageDatasetTests(ImageDatasetTests):
     @drop_datasets
@@ -2033,6 +2183,90 @@ class OpenLABELImageDatasetTests(ImageDatasetTests):
         self.assertEqual(dataset.count("segmentations.polylines"), 2)
 
 
+class LocalZooDataset(fozd.ZooDataset):
+    @property
+    def name(self):
+        return "local-zoo-dataset"
+
+    @property
+    def tags(self):
+        return ("image",)
+
+    @property
+    def supported_splits(self):
+        return ("train", "test")
+
+    def _download_and_prepare(self, dataset_dir, scratch_dir, split):
+        img = np.random.randint(255, size=(48, 64, 3), dtype=np.uint8)
+
+        samples = []
+        for idx in range(3):
+            filepath = os.path.join(scratch_dir, "%s%d.jpg" % (split, idx))
+            etai.write(img, filepath)
+            samples.append(
+                fo.Sample(
+                    filepath=filepath,
+                    ground_truth=fo.Classification(label=split),
+                )
+            )
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        dataset_type = fo.types.FiftyOneImageClassificationDataset
+        dataset.export(export_dir=dataset_dir, dataset_type=dataset_type)
+        dataset.delete()
+
+        return dataset_type(), 3, ["test", "train"]
+
+
+class ZooDatasetTests(ImageDatasetTests):
+    @drop_datasets
+    def test_zoo_snapshot(self):
+        zoo_datasets = {"base": {"local-zoo-dataset": LocalZooDataset}}
+
+        with mock.patch.object(
+            fozd, "_get_zoo_datasets", return_value=zoo_datasets
+        ), mock.patch.object(fo.config, "dataset_zoo_dir", self._new_dir()):
+            dataset1 = foz.load_zoo_dataset(
+                "local-zoo-dataset", dataset_name="zoo1", snapshot=True
+            )
+
+            # Subsequent loads restore the snapshot without importing
+            with mock.patch.object(foud, "build_dataset_importer") as build:
+                dataset2 = foz.load_zoo_dataset(
+                    "local-zoo-dataset", dataset_name="zoo2", snapshot=True
+                )
+
+            build.assert_not_called()
+
+            # Loads with different parameters don't use the snapshot
+            dataset3 = foz.load_zoo_dataset(
+                "local-zoo-dataset",
+                split="train",
+                dataset_name="zoo3",
+                snapshot=True,
+            )
+
+        self.assertEqual(len(dataset2), 6)
+        self.assertDictEqual(
+            dataset2.count_values("tags"), {"train": 3, "test": 3}
+        )
+        self.assertListEqual(
+            dataset2.values("filepath"), dataset1.values("filepath")
+        )
+        self.assertListEqual(
+            dataset2.values("ground_truth.label"),
+            dataset1.values("ground_truth.label"),
+        )
+        self.assertListEqual(
+            list(dataset2.get_field_schema()),
+            list(dataset1.get_field_schema()),
+        )
+        self.assertListEqual(dataset2.default_classes, ["test", "train"])
+        self.assertEqual(len(dataset3), 3)
+
+
 class VideoDatasetTests(unittest.TestCase):
     def setUp(self):
         temp_dir = etau.TempDir()
@@ -2509,6 +2743,59 @@ class MultitaskVideoDatasetTests(VideoDatasetTests):
 
         return dataset
 
+    @skipwindows
+    @drop_datasets
+    def test_fiftyone_dataset_incremental(self):
+        dataset = self._make_dataset()
+        dataset.enable_change_tracking()
+        export_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            incremental=True,
+        )
+
+        sample = dataset.first()
+        sample.frames[2]["weather"].label = "rainy"
+        sample.save()
+
+        sample = dataset.last()
+        sample.frames[1] = fo.Frame(weather=fo.Classification(label="foggy"))
+        sample.save()
+
+        # Frames of samples that did not change are reused
+        dataset._frame_collection.update_many(
+            {"_sample_id": ObjectId(dataset.skip(1).first().id)},
+            {
+                "$set": {
+                    "weather": {
+                        "_id": ObjectId(),
+                        "_cls": "Classification",
+                        "label": "untracked",
+                    }
+                }
+            },
+        )
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            incremental=True,
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+        self.assertEqual(dataset.count("frames"), dataset2.count("frames"))
+        self.assertListEqual(
+            dataset2.values("frames.weather.label"),
+            [["sunny", "rainy"], [None], ["foggy"]],
+        )
+
     @drop_datasets
     def test_fiftyone_video_labels_dataset(self):
         dataset = self._make_dataset()
@@ -0,0 +1,82 @@
+"""
+FiftyOne plots unit tests.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import unittest
+
+from matplotlib.path import Path
+import numpy as np
+
+import fiftyone.core.plots.plotly as fopl
+import fiftyone.core.plots.utils as fopu
+
+
+class GridIndexTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(51)
+        self.points = rng.normal(size=(10000, 2))
+        self.index = fopu.GridIndex(self.points, grid_size=64)
+
+    def test_query_box(self):
+        x = self.points[:, 0]
+        y = self.points[:, 1]
+
+        for xrange, yrange in (
+            ((-0.5, 0.5), (0, 1)),
+            ((1, -1), (2, -2)),
+            ((-100, 100), (-100, 100)),
+            ((10, 20), (10, 20)),
+        ):
+            inds = self.index.query_box(xrange, yrange)
+
+            xmin, xmax = sorted(xrange)
+            ymin, ymax = sorted(yrange)
+            expected = np.nonzero(
+                (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+            )[0]
+
+            self.assertListEqual(list(inds), list(expected))
+
+    def test_query_polygon(self):
+        xs = [0, 2, 0, -1]
+        ys = [0, 0, 2, 1]
+
+        inds = self.index.query_polygon(xs, ys)
+
+        path = Path(np.stack([xs, ys], axis=1))
+        expected = np.nonzero(path.contains_points(self.points))[0]
+
+        self.assertListEqual(list(inds), list(expected))
+        self.assertEqual(len(self.index.query_polygon([0, 1], [0, 1])), 0)
+
+    def test_degenerate_points(self):
+        index = fopu.GridIndex(np.ones((5, 2)))
+
+        inds = index.query_box((0, 2), (0, 2))
+        self.assertListEqual(list(inds), [0, 1, 2, 3, 4])
+
+        inds = index.query_box((2, 3), (0, 2))
+        self.assertEqual(len(inds), 0)
+
+
+class DensityScatterTests(unittest.TestCase):
+    def test_bin_points(self):
+        points = np.array([[0.1, 0.1], [0.2, 0.2], [0.9, 0.9], [0.6, 0.1]])
+
+        x, y, counts, keys, edges = fopl._bin_points(points, (0, 1), (0, 1), 2)
+
+        self.assertListEqual(list(counts), [2, 1, 1])
+        self.assertListEqual(list(x), [0.25, 0.75, 0.75])
+        self.assertListEqual(list(y), [0.25, 0.25, 0.75])
+        self.assertEqual(counts.sum(), len(points))
+
+        selected_keys = fopl._get_bin_keys(points[[2, 3]], edges)
+        found = np.isin(keys, selected_keys)
+        self.assertListEqual(list(np.nonzero(found)[0]), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
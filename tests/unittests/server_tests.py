@@ -0,0 +1,236 @@
+"""
+FiftyOne Server unit tests.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import asyncio
+import unittest
+
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+import fiftyone as fo
+from fiftyone import ViewField as F
+import fiftyone.core.session.events as fose
+import fiftyone.core.state as fos
+from fiftyone.core.json import stringify
+import fiftyone.server.events as fosev
+import fiftyone.server.routes as fosr
+import fiftyone.server.view as fosv
+
+from decorators import drop_datasets
+
+
+class ViewCacheTests(unittest.TestCase):
+    def setUp(self):
+        fosv.clear_view_cache()
+
+    def tearDown(self):
+        fosv.clear_view_cache()
+
+    @drop_datasets
+    def test_view_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(10)]
+        )
+
+        stages = dataset.limit(5)._serialize()
+
+        # Hit
+        view1 = fosv.get_view(dataset.name, stages=stages)
+        view2 = fosv.get_view(dataset.name, stages=stages)
+
+        self.assertIs(view1, view2)
+        self.assertEqual(len(view1), 5)
+
+        # Miss
+        view3 = fosv.get_view(
+            dataset.name, stages=dataset.limit(3)._serialize()
+        )
+
+        self.assertIsNot(view3, view1)
+        self.assertEqual(len(view3), 3)
+
+        # Extended views are not cached, but build on the cached view
+        view4 = fosv.get_view(
+            dataset.name, stages=stages, count_label_tags=True
+        )
+
+        self.assertIsNot(view4, view1)
+        self.assertIs(fosv.get_view(dataset.name, stages=stages), view1)
+
+    @drop_datasets
+    def test_view_cache_invalidation(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(fo.Sample(filepath="image.jpg"))
+
+        stages = dataset.limit(1)._serialize()
+        view1 = fosv.get_view(dataset.name, stages=stages)
+
+        fosv.clear_view_cache(dataset.name)
+        view2 = fosv.get_view(dataset.name, stages=stages)
+
+        self.assertIsNot(view2, view1)
+
+        # Once their TTL expires, entries are rebuilt only if the dataset has
+        # changed
+        ttl = fosv._VIEW_CACHE_TTL
+        fosv._VIEW_CACHE_TTL = 0
+        try:
+            view3 = fosv.get_view(dataset.name, stages=stages)
+            self.assertIs(view3, view2)
+
+            dataset.add_sample_field("foo", fo.StringField)
+
+            view4 = fosv.get_view(dataset.name, stages=stages)
+            self.assertIsNot(view4, view3)
+            self.assertIn("foo", view4.get_field_schema())
+        finally:
+            fosv._VIEW_CACHE_TTL = ttl
+
+
+class StatePatchTests(unittest.TestCase):
+    def _round_trip(self, old, new):
+        d_old = stringify(old.serialize())
+        d_new = stringify(new.serialize())
+
+        patch = fos.make_state_patch(d_old, d_new)
+
+        state = fos.StateDescription.from_dict(d_old)
+        state.apply_patch(patch)
+
+        self.assertEqual(stringify(state.serialize()), d_new)
+
+        return patch
+
+    @drop_datasets
+    def test_state_patch(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(5)]
+        )
+        other_dataset = fo.Dataset()
+        ids = dataset.values("id")
+
+        view = dataset.limit(4)
+        old = fos.StateDescription(
+            dataset=dataset, view=view, selected=ids[:3]
+        )
+
+        # Selections
+        new = fos.StateDescription(
+            dataset=dataset, view=view, selected=ids[:2] + ids[4:]
+        )
+        patch = self._round_trip(old, new)
+        self.assertEqual(
+            patch,
+            {"selected": {"remove": [ids[2]], "add": [ids[4]], "count": 3}},
+        )
+
+        # Appended view stages
+        new = fos.StateDescription(
+            dataset=dataset, view=view.skip(1), selected=ids[:3]
+        )
+        patch = self._round_trip(old, new)
+        self.assertListEqual(list(patch.keys()), ["view"])
+        self.assertIn("append", patch["view"])
+
+        # Replaced view
+        new = fos.StateDescription(
+            dataset=dataset, view=dataset.skip(2), selected=ids[:3]
+        )
+        patch = self._round_trip(old, new)
+        self.assertIn("set", patch["view"])
+
+        # Dataset and config
+        config = fo.app_config.copy()
+        config.grid_zoom = 3
+        new = fos.StateDescription(config=config, dataset=other_dataset)
+        patch = self._round_trip(old, new)
+        self.assertIn("dataset", patch)
+        self.assertIn("config", patch)
+
+    @drop_datasets
+    def test_state_patch_failure(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(fo.Sample(filepath="image.jpg"))
+
+        state = fos.StateDescription(dataset=dataset, view=dataset.limit(1))
+        d = stringify(state.serialize())
+
+        # Patches are resolved before anything is applied, and any error is
+        # reported as a ValueError
+        patch = {
+            "config": {"set": dict(d["config"], grid_zoom=1)},
+            "selected": {"set": ["abc"]},
+            "view": {"append": [{"_cls": "fiftyone.core.stages.Missing"}]},
+        }
+
+        with self.assertRaises(ValueError):
+            state.apply_patch(patch)
+
+        self.assertEqual(stringify(state.serialize()), d)
+
+        patch = {"selected": {"remove": [], "add": ["abc"], "count": 2}}
+
+        with self.assertRaises(ValueError):
+            state.apply_patch(patch)
+
+        self.assertEqual(state.selected, [])
+
+    @drop_datasets
+    def test_state_patch_route(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(fo.Sample(filepath="image.jpg"))
+
+        state = fos.StateDescription(dataset=dataset)
+        asyncio.run(fosev.dispatch_event(None, fose.StateUpdate(state=state)))
+        version = fosev.get_state_version()
+
+        app = Starlette(
+            routes=[Route(route, endpoint) for route, endpoint in fosr.routes]
+        )
+        client = TestClient(app)
+
+        def _post_patch(patch, version):
+            response = client.post(
+                "/event",
+                json={
+                    "event": fose.StatePatch.get_event_name(),
+                    "data": {"patch": patch, "version": version},
+                    "subscription": "test",
+                },
+            )
+            self.assertEqual(response.status_code, 200)
+            return response.json()
+
+        old = stringify(state.serialize())
+        new = stringify(
+            fos.StateDescription(
+                dataset=dataset, view=dataset.match(F("filepath") != None)
+            ).serialize()
+        )
+        patch = fos.make_state_patch(old, new)
+
+        # Patches generated from an outdated version must be resent in full
+        self.assertEqual(_post_patch(patch, version - 1), {"resync": True})
+        self.assertIsNone(fosev.get_state().view)
+
+        # Patches that fail to apply must be resent in full
+        bad_patch = {
+            "view": {"append": [{"_cls": "fiftyone.core.stages.Missing"}]}
+        }
+        self.assertEqual(_post_patch(bad_patch, version), {"resync": True})
+        self.assertIsNone(fosev.get_state().view)
+
+        self.assertEqual(_post_patch(patch, version), {"version": version + 1})
+        self.assertEqual(stringify(fosev.get_state().serialize()), new)
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
@@ -5,12 +5,17 @@ FiftyOne visual similarity-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
 import unittest
 
 import numpy as np
 
 import fiftyone as fo
 import fiftyone.brain as fob
+import fiftyone.core.odm as foo
+import fiftyone.core.odm.database as fodb
+import fiftyone.core.similarity as fosi
+import fiftyone.core.stages as fosg
 
 from decorators import drop_datasets
 
@@ -128,6 +133,154 @@ class SimilarityTests(unittest.TestCase):
 
         self.assertEqual(view1.values("id"), view4.values("id"))
 
+    @drop_datasets
+    def test_embeddings_field_similarity(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i) for i in range(100)]
+        )
+
+        embeddings = np.random.randn(100, 8)
+        dataset.set_values("embeddings", embeddings)
+
+        ids = dataset.values("id")
+        query_id = ids[0]
+
+        dists = 1 - (embeddings @ embeddings[0]) / (
+            np.linalg.norm(embeddings, axis=1) * np.linalg.norm(embeddings[0])
+        )
+        expected = [ids[i] for i in np.argsort(dists, kind="stable")]
+
+        view1 = dataset.sort_by_similarity(
+            query_id, embeddings_field="embeddings", dist_field="dist"
+        )
+        view2 = dataset.sort_by_similarity(
+            query_id, reverse=True, embeddings_field="embeddings"
+        )
+
+        self.assertListEqual(view1.values("id"), expected)
+        self.assertListEqual(view2.values("id"), expected[::-1])
+        self.assertAlmostEqual(view1.first().dist, 0.0, places=5)
+
+        # Probing every list is exact
+        index = fosi.get_similarity_index(dataset, "embeddings")
+        index.num_probes = index.num_lists
+
+        view3 = dataset.sort_by_similarity(
+            query_id, k=10, embeddings_field="embeddings"
+        )
+
+        self.assertListEqual(view3.values("id"), expected[:10])
+
+        # Results are restricted to the view
+        subset = dataset.skip(50)
+        view4 = subset.sort_by_similarity(
+            query_id, k=5, embeddings_field="embeddings"
+        )
+
+        self.assertEqual(len(view4), 5)
+        self.assertListEqual(
+            view4.values("id"),
+            [_id for _id in expected if _id in set(ids[50:])][:5],
+        )
+
+    @drop_datasets
+    def test_similarity_index_sync(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image%d.png" % i, embeddings=v)
+                for i, v in enumerate(np.random.randn(20, 4))
+            ]
+        )
+
+        index = fosi.compute_similarity_index(dataset, "embeddings")
+        self.assertEqual(len(index), 20)
+
+        sample = fo.Sample(filepath="image20.png", embeddings=np.ones(4))
+        dataset.add_sample(sample)
+        dataset.delete_samples(dataset.first())
+
+        index.sync(dataset, "embeddings")
+        self.assertEqual(len(index), 20)
+
+        ids, _ = index.search(np.ones(4), k=1)
+        self.assertListEqual(ids.tolist(), [sample.id])
+
+        # With change tracking, in-place edits are picked up
+        dataset.enable_change_tracking()
+
+        sample.embeddings = -np.ones(4)
+        sample.save()
+
+        view = dataset.sort_by_similarity(
+            sample.id, k=1, reverse=True, embeddings_field="embeddings"
+        )
+        ids, _ = index.search(-np.ones(4), k=1)
+
+        self.assertListEqual(ids.tolist(), [sample.id])
+        self.assertEqual(len(index), 20)
+        self.assertEqual(len(view), 1)
+
+        index_dir = index.index_dir
+        self.assertTrue(os.path.isdir(index_dir))
+
+        dataset.delete_sample_field("embeddings")
+        self.assertFalse(os.path.isdir(index_dir))
+
+    @drop_datasets
+    def test_similarity_index_untracked_changes(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image%d.png" % i, embeddings=v)
+                for i, v in enumerate(np.random.randn(52, 8))
+            ]
+        )
+        query = dataset.first()
+
+        view = dataset.sort_by_similarity(
+            query.id, k=5, embeddings_field="embeddings"
+        )
+        self.assertEqual(view.first().id, query.id)
+
+        # Added and deleted samples are detected without change tracking
+        sample = fo.Sample(
+            filepath="image52.png", embeddings=query.embeddings + 1e-4
+        )
+        dataset.add_sample(sample)
+        dataset.delete_samples(dataset.skip(1).first())
+
+        view = dataset.sort_by_similarity(
+            query.id, k=2, embeddings_field="embeddings"
+        )
+        self.assertSetEqual(set(view.values("id")), {query.id, sample.id})
+
+        view = dataset.sort_by_similarity(
+            query.id, embeddings_field="embeddings"
+        )
+        self.assertEqual(len(view), 52)
+        self.assertSetEqual(set(view.values("id")), set(dataset.values("id")))
+
+        # Large results are stored in short-lived IDs collections
+        max_inline_ids = fosg._MAX_INLINE_IDS
+        fosg._MAX_INLINE_IDS = 10
+        try:
+            view = dataset.sort_by_similarity(
+                query.id, embeddings_field="embeddings"
+            )
+            self.assertEqual(len(view), 52)
+            self.assertSetEqual(
+                set(view.limit(2).values("id")), {query.id, sample.id}
+            )
+
+            registry = foo.get_db_conn()[fodb._IDS_REGISTRY]
+            d = registry.find_one({"owner": dataset._sample_collection_name})
+            self.assertEqual(d["ttl"], fosg._SIMILARITY_IDS_TTL)
+        finally:
+            fosg._MAX_INLINE_IDS = max_inline_ids
+            dataset.delete()
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
@@ -5,17 +5,28 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import functools
+import os
+import sys
 import time
+import types
 import unittest
+from unittest import mock
 
+from bson import Timestamp
 from mongoengine.errors import ValidationError
 import numpy as np
 
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
+import fiftyone.core.profiling as fopf
 import fiftyone.core.uid as fou
-from fiftyone.migrations.runner import MigrationRunner
+import fiftyone.utils.labels as foul
+from fiftyone.migrations.runner import MigrationRunner, migrate_all
 
 from decorators import drop_datasets
 
@@ -59,6 +70,102 @@ class LabelsTests(unittest.TestCase):
         self.assertIsNot(det2, det)
         self.assertNotEqual(det2.id, det.id)
 
+    @drop_datasets
+    def test_objects_to_segmentations(self):
+        dataset = fo.Dataset()
+
+        samples = []
+        for i in range(5):
+            detection = fo.Detection(
+                label="cat",
+                bounding_box=[0.25, 0.25, 0.5, 0.5],
+                mask=np.ones((8, 8), dtype=bool),
+            )
+            samples.append(
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    ground_truth=fo.Detections(detections=[detection]),
+                )
+            )
+
+        samples[2]["ground_truth"] = None
+        dataset.add_samples(samples)
+
+        # Input labels are paged, and pages need not align with batches
+        with mock.patch.object(foul, "_PAGE_SIZE", 3):
+            foul.objects_to_segmentations(
+                dataset,
+                "ground_truth",
+                "segmentation",
+                mask_size=(32, 24),
+                mask_targets={1: "cat"},
+                num_workers=2,
+                batch_size=2,
+            )
+
+        self.assertEqual(dataset.count("segmentation"), 4)
+        self.assertIsNone(samples[2]["segmentation"])
+        self.assertIsNotNone(samples[4]["segmentation"])
+        mask = samples[0].segmentation.mask
+        self.assertTupleEqual(mask.shape, (24, 32))
+        self.assertEqual(mask[12, 16], 1)
+
+        with etau.TempDir() as tmp_dir:
+            foul.objects_to_segmentations(
+                dataset,
+                "ground_truth",
+                "segmentation_disk",
+                mask_size=(32, 24),
+                mask_targets={1: "cat"},
+                output_dir=tmp_dir,
+                num_workers=1,
+            )
+
+            segmentation = samples[0].segmentation_disk
+            self.assertIsNone(segmentation.mask)
+            self.assertTrue(os.path.isfile(segmentation.mask_path))
+            self.assertTrue(np.array_equal(segmentation.get_mask(), mask))
+
+            foul.segmentations_to_detections(
+                dataset,
+                "segmentation_disk",
+                "detections",
+                mask_targets={1: "cat"},
+                num_workers=2,
+            )
+
+        self.assertListEqual(
+            dataset.distinct("detections.detections.label"), ["cat"]
+        )
+
+    @drop_datasets
+    def test_convert_labels_filtered_by_output(self):
+        dataset = fo.Dataset()
+
+        mask = np.zeros((8, 8), dtype=np.uint8)
+        mask[2:6, 2:6] = 1
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    segmentation=fo.Segmentation(mask=mask),
+                )
+                for i in range(35)
+            ]
+        )
+
+        # Writing the outputs removes samples from the input view, which
+        # must not cause any samples to be skipped
+        with mock.patch.object(foul, "_PAGE_SIZE", 10):
+            foul.segmentations_to_detections(
+                dataset.exists("detections", False),
+                "segmentation",
+                "detections",
+                mask_targets={1: "cat"},
+            )
+
+        self.assertEqual(dataset.count("detections"), 35)
+
 
 class SerializationTests(unittest.TestCase):
     def test_embedded_document(self):
@@ -215,6 +322,88 @@ class MigrationTests(unittest.TestCase):
         )
         self.assertEqual(runner.revisions, ["0.3", "0.2", "0.1"])
 
+    @drop_datasets
+    def test_migrate_all(self):
+        conn = foo.get_db_conn()
+        names = [fo.Dataset().name for _ in range(3)]
+
+        conn.datasets.update_many(
+            {"name": {"$in": names}},
+            {
+                "$set": {"version": "0.15.0"},
+                "$unset": {"skeletons": "", "default_skeleton": ""},
+            },
+        )
+
+        migrate_all()
+
+        for d in conn.datasets.find({"name": {"$in": names}}):
+            self.assertEqual(d["version"], foc.VERSION)
+            self.assertEqual(d["skeletons"], {})
+            self.assertIsNone(d["default_skeleton"])
+
+    @drop_datasets
+    def test_run_all_resume(self):
+        conn = foo.get_db_conn()
+        names = [fo.Dataset().name for _ in range(3)]
+
+        conn.datasets.update_many(
+            {"name": {"$in": names}},
+            {
+                "$set": {"version": "0.15.0"},
+                "$unset": {"skeletons": "", "default_skeleton": ""},
+            },
+        )
+
+        failed = set()
+
+        def up(db, dataset_name):
+            if dataset_name == names[0] and dataset_name not in failed:
+                failed.add(dataset_name)
+                raise ValueError("Migration failed")
+
+        module_name = "_test_revision"
+        module = types.ModuleType(module_name)
+        module.up = up
+        sys.modules[module_name] = module
+
+        revisions = [
+            ("0.15.1", "fiftyone.migrations.revisions.v0_15_1"),
+            ("0.16.0", module_name),
+        ]
+
+        try:
+            runner = MigrationRunner(
+                head="0.15.0", destination="0.16.0", _revisions=revisions
+            )
+            errors = runner.run_all(names, num_workers=2)
+
+            self.assertListEqual(list(errors.keys()), [names[0]])
+
+            versions = {
+                d["name"]: d["version"]
+                for d in conn.datasets.find({"name": {"$in": names}})
+            }
+            self.assertEqual(versions[names[0]], "0.15.1")
+            self.assertEqual(versions[names[1]], "0.16.0")
+            self.assertEqual(versions[names[2]], "0.16.0")
+
+            # Resuming only runs the remaining revisions
+            runner = MigrationRunner(
+                head="0.15.1", destination="0.16.0", _revisions=revisions
+            )
+            self.assertListEqual(runner.revisions, ["0.16.0"])
+            self.assertDictEqual(runner.run_all([names[0]]), {})
+
+            d = conn.datasets.find_one({"name": names[0]})
+            self.assertEqual(d["version"], "0.16.0")
+            self.assertEqual(d["skeletons"], {})
+        finally:
+            sys.modules.pop(module_name, None)
+            conn.datasets.update_many(
+                {"name": {"$in": names}}, {"$set": {"version": foc.VERSION}}
+            )
+
     def test_future(self):
         pkg_ver = foc.VERSION
         future_ver = str(int(pkg_ver[0]) + 1) + pkg_ver[1:]
@@ -246,6 +435,242 @@ class UIDTests(unittest.TestCase):
         self.assertTrue(fou._import_logged)
 
 
+class ProfilingTests(unittest.TestCase):
+    def test_sink(self):
+        fopf.increment("noop")
+
+        with fopf.collect() as sink:
+            with fopf.stage("outer"):
+                fopf.increment("items", 2)
+
+                with fopf.stage("inner"):
+                    fopf.set_gauge("depth", 3)
+                    fopf.set_gauge("depth", 1)
+                    fopf.observe("latency", 0.02)
+
+            with fopf.collect() as nested_sink:
+                fopf.increment("nested")
+
+        d = sink.to_dict()
+
+        self.assertDictEqual(d["counters"], {"outer.items": 2, "nested": 1})
+        self.assertDictEqual(
+            d["gauges"], {"outer.inner.depth": {"value": 1, "max": 3}}
+        )
+        self.assertSetEqual(set(d["timers"]), {"outer", "outer.inner"})
+        self.assertEqual(d["histograms"]["outer.inner.latency"]["count"], 1)
+        self.assertDictEqual(nested_sink.to_dict()["counters"], {"nested": 1})
+
+        summary = sink.get_stage_summary()
+        self.assertEqual(summary[0]["stage"], "outer")
+        self.assertEqual(summary[0]["items"], 2)
+
+        prom = sink.to_prometheus()
+        self.assertIn("fiftyone_outer_items_total 2", prom)
+        self.assertIn('fiftyone_outer_inner_latency_bucket{le="0.05"} 1', prom)
+        self.assertIn("fiftyone_outer_seconds_count 1", prom)
+
+    @drop_datasets
+    def test_add_samples(self):
+        dataset = fo.Dataset()
+
+        with fopf.collect() as sink:
+            dataset.add_samples(
+                [fo.Sample(filepath="image%d.jpg" % i) for i in range(10)]
+            )
+
+        d = sink.to_dict()
+
+        self.assertEqual(d["counters"]["add_samples.items"], 10)
+        self.assertEqual(d["timers"]["add_samples"]["count"], 1)
+        self.assertEqual(d["histograms"]["add_samples.batch_size"]["sum"], 10)
+
+    @drop_datasets
+    def test_worker_threads(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(10)]
+        )
+
+        _do_aggregate = foo.database._do_aggregate
+
+        def _count_pipelines(*args):
+            fopf.increment("pipelines")
+            return _do_aggregate(*args)
+
+        # Metrics recorded by pooled aggregation workers are attributed to
+        # the caller's sink and stage
+        with mock.patch.object(
+            foo.database, "_do_aggregate", _count_pipelines
+        ):
+            with fopf.collect() as sink:
+                with fopf.stage("outer"):
+                    counts = dataset.aggregate(
+                        [fo.Count(), fo.Count("filepath")]
+                    )
+
+        self.assertListEqual(counts, [10, 10])
+        self.assertDictEqual(
+            sink.to_dict()["counters"], {"outer.pipelines": 2}
+        )
+
+
+class IterPrefetchedTests(unittest.TestCase):
+    def test_iter_prefetched(self):
+        iter_prefetched = fo.core.utils.iter_prefetched
+
+        self.assertListEqual(
+            list(iter_prefetched(range(100), 7)), list(range(100))
+        )
+
+        def _producer():
+            for i in range(5):
+                yield i
+
+            raise ValueError("producer failed")
+
+        # Producer exceptions are raised after the preceding elements
+        values = []
+        with self.assertRaises(ValueError):
+            for value in iter_prefetched(_producer(), 2):
+                values.append(value)
+
+        self.assertListEqual(values, [0, 1, 2, 3, 4])
+
+        # The producer stops when the consumer does
+        produced = []
+
+        def _infinite():
+            i = 0
+            while True:
+                produced.append(i)
+                yield i
+                i += 1
+
+        it = iter_prefetched(_infinite(), 3)
+        self.assertEqual(next(it), 0)
+        it.close()
+
+        time.sleep(0.5)
+        num_produced = len(produced)
+        time.sleep(0.3)
+        self.assertEqual(len(produced), num_produced)
+        self.assertLess(num_produced, 10)
+
+
+class ParallelShardsWriterTests(unittest.TestCase):
+    def test_parallel_shards_writer(self):
+        ParallelShardsWriter = fo.core.utils.ParallelShardsWriter
+        open_fcn = functools.partial(open, mode="w")
+
+        with etau.TempDir() as tmp_dir:
+            paths = [os.path.join(tmp_dir, "%d.txt" % i) for i in range(3)]
+
+            with ParallelShardsWriter(
+                paths, open_fcn, serialize_fcn=str, num_workers=2
+            ) as writer:
+                for idx in range(10):
+                    writer.write(idx)
+
+            # Each shard receives its items in order
+            shards = []
+            for path in paths:
+                with open(path) as f:
+                    shards.append(f.read())
+
+            self.assertListEqual(shards, ["0369", "147", "258"])
+
+            # Worker errors are raised on exit
+            with self.assertRaises(RuntimeError):
+                with ParallelShardsWriter(
+                    paths, open_fcn, serialize_fcn=int, num_workers=2
+                ) as writer:
+                    writer.write("a")
+
+
+class AggregateTests(unittest.TestCase):
+    @drop_datasets
+    def test_aggregate_pipelines(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, x=i) for i in range(100)]
+        )
+
+        coll = dataset._sample_collection
+        pipelines = [
+            [{"$count": "count"}],
+            [{"$group": {"_id": None, "total": {"$sum": "$x"}}}],
+        ]
+
+        results = foo.aggregate(coll, pipelines)
+
+        self.assertEqual(results[0], [{"count": 100}])
+        self.assertEqual(results[1], [{"_id": None, "total": 4950}])
+
+    @drop_datasets
+    def test_snapshot_read_fallback(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(10)]
+        )
+
+        coll = dataset._sample_collection
+        pipeline = [{"$count": "count"}]
+
+        # Standalone servers reject snapshot reads, in which case the pipeline
+        # is run normally
+        snapshot_time = Timestamp(int(time.time()), 1)
+        result = foo.database._do_aggregate(coll, pipeline, snapshot_time)
+        self.assertEqual(result, [{"count": 10}])
+
+    def test_snapshot_reads_cache(self):
+        client = foo.get_db_client()
+        topology = client.topology_description.topology_type_name
+
+        # Support is cached per client, so reconnecting re-checks it
+        self.addCleanup(
+            setattr,
+            foo.database,
+            "_snapshot_reads_supported",
+            foo.database._snapshot_reads_supported,
+        )
+        foo.database._snapshot_reads_supported = (object(), True)
+        supported = foo.database._supports_snapshot_reads(client)
+
+        self.assertEqual(
+            supported, topology in ("ReplicaSetWithPrimary", "Sharded")
+        )
+        self.assertIs(foo.database._snapshot_reads_supported[0], client)
+
+
+class BulkWriterTests(unittest.TestCase):
+    def test_bulk_writer(self):
+        batches = []
+
+        with foo.BulkWriter(
+            batches.append, init_batch_bytes=10, min_batch_bytes=10
+        ) as writer:
+            for idx in range(100):
+                writer.add(idx, 5, item=str(idx))
+
+        self.assertGreater(len(batches), 1)
+        self.assertListEqual(
+            [idx for batch in batches for idx in batch], list(range(100))
+        )
+        self.assertListEqual(
+            writer.pop_completed(), [str(idx) for idx in range(100)]
+        )
+        self.assertListEqual(writer.pop_completed(), [])
+
+    def test_bulk_writer_error(self):
+        def write_fcn(ops):
+            raise ValueError("write failed")
+
+        with self.assertRaises(ValueError):
+            with foo.BulkWriter(write_fcn) as writer:
+                writer.add("op", 1)
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     unittest.main(verbosity=2)
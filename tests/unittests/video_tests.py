@@ -9,6 +9,7 @@ from datetime import date, datetime
 
 from bson import ObjectId
 import numpy as np
+import time
 import unittest
 
 import fiftyone as fo
@@ -177,6 +178,33 @@ class VideoTests(unittest.TestCase):
 
         self.assertListEqual(frame_numbers2, [2, 4])
 
+    @drop_datasets
+    def test_add_samples_frames(self):
+        dataset = fo.Dataset()
+
+        samples = []
+        for i in range(3):
+            sample = fo.Sample(filepath="video%d.mp4" % i)
+            for fn in range(1, i + 2):
+                sample.frames[fn] = fo.Frame(index=10 * i + fn)
+
+            samples.append(sample)
+
+        dataset.add_samples(samples)
+
+        self.assertEqual(dataset.count("frames"), 6)
+
+        frame_ids = dataset.values("frames.id", unwind=True)
+        frames = [f for s in samples for f in s.frames.values()]
+        self.assertListEqual([f.id for f in frames], frame_ids)
+        self.assertTrue(all(f.in_dataset for f in frames))
+
+        frame = samples[2].frames[3]
+        frame["index"] = 100
+        frame.save()
+
+        self.assertEqual(dataset.count_values("frames.index")[100], 1)
+
     @drop_datasets
     def test_expand_schema(self):
         # None-valued new frame fields are ignored for schema expansion
@@ -370,6 +398,59 @@ class VideoTests(unittest.TestCase):
         self.assertEqual(len(sample.frames), 1)
         self.assertEqual(dataset.count("frames"), 1)
 
+    @drop_datasets
+    def test_change_tracking(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="video%d.mp4" % i, index=i) for i in range(3)]
+        )
+
+        sample = dataset.first()
+        sample.frames[1] = fo.Frame(label="a")
+        sample.frames[2] = fo.Frame(label="b")
+        sample.save()
+
+        dataset.enable_change_tracking()
+
+        def _changed_frames(timestamp):
+            return dataset._frame_collection.count_documents(
+                {"last_modified_at": {"$gte": timestamp}}
+            )
+
+        timestamp = datetime.utcnow()
+        time.sleep(0.01)
+
+        # Saving frames that were loaded but not modified is not a change
+        sample = dataset.first()
+        for frame in sample.frames.values():
+            pass
+
+        sample.save()
+
+        self.assertEqual(len(dataset.changes_since(timestamp)), 0)
+
+        sample.frames[2]["label"] = "c"
+        sample.save()
+
+        view = dataset.changes_since(timestamp)
+        self.assertListEqual(view.values("index"), [0])
+        self.assertEqual(_changed_frames(timestamp), 1)
+
+        sample.save()
+        self.assertEqual(_changed_frames(timestamp), 1)
+
+        # Frame-level changes made after the view was created are reflected
+        sample = dataset.skip(2).first()
+        sample.frames[1] = fo.Frame(label="d")
+        sample.save()
+
+        self.assertListEqual(view.values("index"), [0, 2])
+        self.assertListEqual(view.values("frames.label"), [["a", "c"], ["d"]])
+
+        dataset.skip(1).limit(1).set_values("frames.label", [{1: "e"}])
+
+        self.assertListEqual(view.values("index"), [0, 1, 2])
+
     @drop_datasets
     def test_delete_video_sample(self):
         dataset = fo.Dataset()
@@ -14,8 +14,11 @@ import numpy as np
 
 import fiftyone as fo
 from fiftyone import ViewField as F, VALUE
+import fiftyone.core.odm as foo
+import fiftyone.core.odm.database as fodb
 import fiftyone.core.sample as fos
 import fiftyone.core.stages as fosg
+import fiftyone.core.view as fov
 
 from decorators import drop_datasets
 
@@ -175,6 +178,51 @@ class DatasetViewTests(unittest.TestCase):
         detections = dataset[sample_view.id].test_dets.detections
         self.assertListEqual(detections, [])
 
+    @drop_datasets
+    def test_pipeline_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(
+            fo.Sample(
+                filepath="image.png",
+                ground_truth=fo.Detections(
+                    detections=[
+                        fo.Detection(label="cat", confidence=0.9),
+                        fo.Detection(label="dog", confidence=0.1),
+                    ]
+                ),
+            )
+        )
+
+        view = dataset.filter_labels("ground_truth", F("confidence") > 0.5)
+        pipeline = view._pipeline()
+
+        stage_pipelines = view._get_stage_pipelines()
+        self.assertIs(view._get_stage_pipelines()[0], stage_pipelines[0])
+        self.assertEqual(view._pipeline(), pipeline)
+
+        # Appending a stage reuses the cached pipelines of the prefix
+        view2 = view.limit(1)
+        stage_pipelines2 = view2._get_stage_pipelines()
+        self.assertIs(stage_pipelines2[0], stage_pipelines[0])
+        self.assertEqual(len(stage_pipelines2), 2)
+        self.assertEqual(view2.count("ground_truth.detections"), 1)
+
+        # Schema changes invalidate the cache
+        dataset.rename_sample_field("ground_truth", "gt")
+        dataset.clone_sample_field("gt", "ground_truth")
+        dataset.delete_sample_field("gt")
+
+        self.assertIsNot(view._get_stage_pipelines()[0], stage_pipelines[0])
+        self.assertEqual(view.count("ground_truth.detections"), 1)
+
+        dataset.reload()
+        self.assertIsNot(view2._get_stage_pipelines()[0], stage_pipelines2[0])
+
+
+def _get_ids_collections(sample_collection_name):
+    prefix = "ids." + sample_collection_name + "."
+    return [c for c in foo.list_collections() if c.startswith(prefix)]
+
 
 class ViewFieldTests(unittest.TestCase):
     @drop_datasets
@@ -2120,6 +2168,86 @@ class ViewStageTests(unittest.TestCase):
         for sample, _id in zip(view, ids):
             self.assertEqual(sample.id, _id)
 
+    def test_select_exclude_large(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(20)]
+        )
+        sample_ids = dataset.values("id")
+        ids = sample_ids[15:3:-2]
+
+        max_inline_ids = fosg._MAX_INLINE_IDS
+        ids_collection_refresh = fodb._IDS_COLLECTION_REFRESH
+        pipeline_cache_ttl = fov._PIPELINE_CACHE_TTL
+        fosg._MAX_INLINE_IDS = 2
+        try:
+            view = dataset.select(ids)
+            self.assertListEqual(
+                view.values("id"), [_id for _id in sample_ids if _id in ids]
+            )
+
+            view = dataset.select(ids, ordered=True)
+            self.assertListEqual(view.values("id"), ids)
+            self.assertIn("$lookup", view._pipeline()[0])
+
+            view = dataset.exclude(ids)
+            self.assertListEqual(
+                view.values("id"),
+                [_id for _id in sample_ids if _id not in ids],
+            )
+
+            coll_name = dataset._sample_collection_name
+
+            # The stages share a collection
+            self.assertEqual(len(_get_ids_collections(coll_name)), 1)
+
+            # IDs collections are owned by their dataset
+            foo.drop_orphan_collections()
+            self.assertEqual(len(_get_ids_collections(coll_name)), 1)
+
+            # Unused IDs collections expire, and are recreated on use
+            fodb._IDS_COLLECTION_REFRESH = 0
+            fov._PIPELINE_CACHE_TTL = 0
+            ids_coll_name = _get_ids_collections(coll_name)[0]
+            foo.get_db_conn()[fodb._IDS_REGISTRY].update_one(
+                {"_id": ids_coll_name},
+                {"$set": {"last_used_at": datetime.utcnow() - timedelta(2)}},
+            )
+            foo.drop_expired_ids_collections()
+            self.assertEqual(len(_get_ids_collections(coll_name)), 0)
+
+            self.assertListEqual(
+                view.values("id"),
+                [_id for _id in sample_ids if _id not in ids],
+            )
+            self.assertEqual(len(_get_ids_collections(coll_name)), 1)
+
+            # Clearing the dataset drops its IDs collections
+            dataset.clear()
+            self.assertEqual(len(_get_ids_collections(coll_name)), 0)
+            self.assertEqual(len(view), 0)
+
+            dataset.add_samples(
+                [fo.Sample(filepath="image%d.jpg" % i) for i in range(5)]
+            )
+            view = dataset.select(dataset.values("id")[:3])
+            self.assertEqual(len(view), 3)
+
+            dataset.delete()
+            self.assertEqual(len(_get_ids_collections(coll_name)), 0)
+            self.assertEqual(
+                foo.get_db_conn()[fodb._IDS_REGISTRY].count_documents(
+                    {"owner": coll_name}
+                ),
+                0,
+            )
+        finally:
+            fosg._MAX_INLINE_IDS = max_inline_ids
+            fodb._IDS_COLLECTION_REFRESH = ids_collection_refresh
+            fov._PIPELINE_CACHE_TTL = pipeline_cache_ttl
+            if not dataset.deleted:
+                dataset.delete()
+
     def test_select_fields(self):
         self.dataset.add_sample_field("select_fields_field", fo.IntField)
 